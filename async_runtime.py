@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Async Runtime - asyncio driver for live show cases
+A LiveStage owns one Live (auto_refresh=False, so no refresh thread) and
+draws it from a single refresh task on the event loop, at a capped rate and
+only when something changed or a widget animates by itself. Several widgets
+- dashboard, progress, status line - can share the stage, each updated by
+its own coroutine. Keystrokes are read through the event loop (add_reader
+on POSIX), so q / Esc / Ctrl+C stop every coroutine at once instead of
+waiting for a sleep to finish. Terminal resizes are debounced
+(resize.ResizeWatcher): no frames are drawn while a window is being
+dragged, and one redraw follows when the size has settled.
+
+    stage = LiveStage(console)
+    stage.add(status_text, size=1)
+    stage.add(progress)
+    run_stage(stage, update_status(stage), do_work(progress))
+"""
+
+import asyncio
+import os
+import signal
+import sys
+from contextlib import ExitStack
+from typing import Callable, Coroutine, List, Optional
+
+from rich.console import Console, ConsoleDimensions
+from rich.layout import Layout
+from rich.live import Live
+
+from pacing import pacer
+from resize import DEFAULT_DEBOUNCE, ResizeWatcher
+
+DEFAULT_REFRESH_PER_SECOND = 10.0
+
+# Key polling interval where the event loop cannot watch the terminal (Windows)
+KEY_POLL_INTERVAL = 0.05
+
+
+class LiveStage:
+    """One Live region shared by any number of widgets and coroutines
+
+    ``animate`` redraws on every tick (spinners, progress bars); with
+    animate=False the stage only redraws after invalidate(). On a terminal
+    the region is drawn by frame_diff.DiffLive, which writes only the cells
+    that changed; diff=False uses rich's Live (full redraw per frame).
+    """
+
+    def __init__(self, console: Console, refresh_per_second: float = DEFAULT_REFRESH_PER_SECOND,
+                 animate: bool = True, screen: bool = False, transient: bool = False, diff: bool = True,
+                 debounce: float = DEFAULT_DEBOUNCE):
+        self.console = console
+        self.diff = diff
+        self.interval = 1.0 / pacer.refresh_rate(refresh_per_second)
+        self.animate = animate
+        self.screen = screen
+        self.transient = transient
+        self.live = None
+        self.interrupted = False
+        self.frames = 0
+        self.resize = ResizeWatcher(console, debounce)
+        self._regions: List[Layout] = []
+        self._key_handlers: List[Callable[[str], bool]] = []
+        self._resize_handlers: List[Callable[[ConsoleDimensions], None]] = []
+        self._dirty = True
+        self._stopped: Optional[asyncio.Event] = None
+
+    def add(self, renderable, name: Optional[str] = None, size: Optional[int] = None, ratio: int = 1) -> Layout:
+        """Add a widget below the existing ones; returns its layout region"""
+        region = Layout(renderable, name=name or f"widget{len(self._regions)}", size=size, ratio=ratio)
+        self._regions.append(region)
+        return region
+
+    def update(self, region: Layout, renderable):
+        """Replace the widget shown in region"""
+        region.update(renderable)
+        if self.live is not None and len(self._regions) == 1:
+            # A lone widget is the Live's renderable itself (no full-height Layout)
+            self.live.update(renderable)
+        self.invalidate()
+
+    def invalidate(self):
+        """Request a redraw on the next tick"""
+        self._dirty = True
+
+    def on_key(self, handler: Callable[[str], bool]):
+        """Call handler(key) for keystrokes other than the quit keys; True redraws"""
+        self._key_handlers.append(handler)
+
+    def on_resize(self, handler: Callable[[ConsoleDimensions], None]):
+        """Call handler(size) once the terminal size has settled after a resize (a redraw follows)"""
+        self._resize_handlers.append(handler)
+
+    def stop(self, interrupted: bool = True):
+        """End the stage, cancelling its coroutines"""
+        self.interrupted = self.interrupted or interrupted
+        if self._stopped is not None:
+            self._stopped.set()
+
+    @property
+    def renderable(self):
+        if len(self._regions) == 1:
+            return self._regions[0].renderable
+        layout = Layout()
+        layout.split_column(*self._regions)
+        return layout
+
+    def _make_live(self):
+        if self.diff and self.console.is_terminal:
+            from frame_diff import DiffLive
+            return DiffLive(self.renderable, console=self.console, screen=self.screen, transient=self.transient)
+        return Live(self.renderable, console=self.console, auto_refresh=False,
+                    screen=self.screen, transient=self.transient)
+
+    def _draw(self):
+        self._dirty = False
+        self.live.refresh()
+        self.frames += 1
+
+    async def _refresh_loop(self):
+        resize = self.resize
+        while True:
+            if resize.settling:
+                # Mid-drag: no frames until the size stops changing
+                await asyncio.sleep(resize.debounce)
+                continue
+            size = resize.poll()
+            if size is not None:
+                for handler in self._resize_handlers:
+                    handler(size)
+                self._dirty = True
+            if self._dirty or self.animate:
+                self._draw()
+            await asyncio.sleep(self.interval)
+
+    def _handle_key(self, key: Optional[str]):
+        from pager import QUIT_KEYS
+        if key is None:
+            return
+        if key in QUIT_KEYS:
+            self.stop()
+        elif any(handler(key) for handler in self._key_handlers):
+            self.invalidate()
+
+    async def _poll_keys(self, keys):
+        while True:
+            while keys.pending():
+                self._handle_key(keys.read_key())
+            await asyncio.sleep(KEY_POLL_INTERVAL)
+
+    def _watch_keys(self, stack: ExitStack, loop: asyncio.AbstractEventLoop) -> Optional[asyncio.Future]:
+        """Start delivering keystrokes to _handle_key; cleanup is pushed onto stack"""
+        from terminal_input import KeyReader, open_terminal
+
+        terminal = open_terminal() if self.console.is_terminal else None
+        if terminal is None:
+            return None
+        if terminal is not sys.stdin:
+            stack.callback(terminal.close)
+        keys = stack.enter_context(KeyReader(terminal))
+        if os.name == "nt":
+            return asyncio.ensure_future(self._poll_keys(keys))
+        loop.add_reader(keys.fileno(), lambda: self._handle_key(keys.read_key()))
+        stack.callback(loop.remove_reader, keys.fileno())
+        return None
+
+    async def run(self, *coroutines: Coroutine) -> bool:
+        """Run the coroutines under the Live until they all finish or the stage stops
+
+        Returns False if the user interrupted (quit key or Ctrl+C).
+        """
+        loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        workers = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+        helpers: List[asyncio.Future] = []
+        with ExitStack() as stack:
+            self.live = stack.enter_context(self._make_live())
+            stack.callback(self.resize.start(loop).stop)
+            poller = self._watch_keys(stack, loop)
+            if poller is not None:
+                helpers.append(poller)
+            if os.name != "nt":
+                # Ctrl+C cancels the coroutines right away instead of interrupting a render
+                loop.add_signal_handler(signal.SIGINT, self.stop)
+                stack.callback(loop.remove_signal_handler, signal.SIGINT)
+
+            stopped = asyncio.ensure_future(self._stopped.wait())
+            helpers += [stopped, asyncio.ensure_future(self._refresh_loop())]
+            try:
+                pending = set(workers)
+                while pending and not stopped.done():
+                    done, pending = await asyncio.wait(pending | {stopped}, return_when=asyncio.FIRST_COMPLETED)
+                    pending.discard(stopped)
+                    for task in done:
+                        if task is not stopped and task.exception() is not None:
+                            raise task.exception()
+            finally:
+                for task in workers + helpers:
+                    task.cancel()
+                await asyncio.gather(*workers, *helpers, return_exceptions=True)
+            self._draw()
+        self.live = None
+        return not self.interrupted
+
+
+def run_stage(stage: LiveStage, *coroutines: Coroutine) -> bool:
+    """Run a stage from synchronous code (a fresh event loop per call)"""
+    try:
+        return asyncio.run(stage.run(*coroutines))
+    except KeyboardInterrupt:
+        return False
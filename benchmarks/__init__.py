@@ -0,0 +1,4 @@
+"""
+Benchmarks for the showcase stage
+Run from the repository root, e.g. ``python -m benchmarks.bench_dashboard``.
+"""
@@ -0,0 +1,6 @@
+"""``python -m benchmarks`` runs the headless per-show-case suite (bench_showcases)"""
+
+from benchmarks.bench_showcases import main
+
+if __name__ == "__main__":
+    main()
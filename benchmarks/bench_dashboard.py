@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Dashboard benchmark - rebuild-per-tick vs. incremental DashboardModel
+Renders both approaches into an off-screen terminal as fast as possible and
+reports ticks per second, frames actually drawn, peak traced memory and bytes
+written per tick.
+
+    python -m benchmarks.bench_dashboard --metrics 4 32 64 --frames 120
+"""
+
+import argparse
+import io
+import random
+import time
+import tracemalloc
+from collections import deque
+from typing import Deque, Dict, List, Tuple
+
+from rich import box
+from rich.console import Console
+from rich.layout import Layout
+from rich.live import Live
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
+
+from dashboard import DashboardModel, MetricSpec, DEFAULT_METRICS, system_status
+from timeseries import SPARK_CHARS
+
+
+class NullFile(io.TextIOBase):
+    """Writable sink that only counts what is written"""
+
+    def __init__(self):
+        self.bytes_written = 0
+
+    def write(self, text: str) -> int:
+        self.bytes_written += len(text.encode("utf-8"))
+        return len(text)
+
+    def isatty(self) -> bool:
+        return True
+
+
+def make_metrics(count: int) -> List[MetricSpec]:
+    """The four default metrics, padded with synthetic ones up to count"""
+    metrics = list(DEFAULT_METRICS[:count])
+    for i in range(len(metrics), count):
+        template = DEFAULT_METRICS[i % len(DEFAULT_METRICS)]
+        metrics.append(template._replace(key=f"{template.key}_{i}", label=f"{template.label} #{i}"))
+    return metrics
+
+
+def make_ticks(metrics: List[MetricSpec], frames: int, change_ratio: float, seed: int = 42) -> List[Dict[str, float]]:
+    """Pre-generate metric values; each tick changes about change_ratio of them"""
+    rng = random.Random(seed)
+    values = {spec.key: float(rng.randint(1, 100)) for spec in metrics}
+    ticks = []
+    for _ in range(frames):
+        for spec in metrics:
+            if rng.random() < change_ratio:
+                values[spec.key] = float(rng.randint(1, 100))
+        ticks.append(dict(values))
+    return ticks
+
+
+def naive_trend(history: Deque[float], spec: MetricSpec, spark_width: int) -> Tuple[str, str]:
+    """Sparkline and window stats recomputed from the full history every tick"""
+    low, high = min(history), max(history)
+    ordered = sorted(history)
+    p95 = ordered[min(int(0.95 * len(ordered)), len(ordered) - 1)]
+    span = high - low
+    recent = list(history)[-spark_width:]
+    top = len(SPARK_CHARS) - 1
+    spark = "".join(SPARK_CHARS[int((v - low) / span * top) if span else 0] for v in recent)
+    p = spec.precision
+    stats = f"↓{low:.{p}f} ~{sum(history) / len(history):.{p}f} p95 {p95:.{p}f} ↑{high:.{p}f}"
+    return spark, stats
+
+
+def rebuild_layout(metrics: List[MetricSpec], values: Dict[str, float], histories: Dict[str, Deque[float]]) -> Layout:
+    """The original real_time_dashboard approach: a new Layout every tick"""
+    layout = Layout()
+    layout.split_column(
+        Layout(name="header", size=3),
+        Layout(name="main", ratio=2),
+        Layout(name="footer", size=3)
+    )
+    layout["header"].update(Panel(Text("🖥️ 系统实时监控", style="bold blue"), style="blue"))
+
+    metrics_table = Table(show_header=False, box=box.SIMPLE, expand=True)
+    for style, ratio in DashboardModel.columns:
+        metrics_table.add_column(style=style, ratio=ratio, no_wrap=True)
+    for spec in metrics:
+        value = values[spec.key]
+        history = histories[spec.key]
+        history.append(value)
+        spark, stats = naive_trend(history, spec, 12)
+        metrics_table.add_row(spec.label, spec.format(value), spark, stats, spec.status(value))
+    layout["main"].update(Panel(metrics_table, title="📈 实时指标"))
+
+    footer_text = Text(f"📊 当前状态: {system_status(values)} | ⏰ 更新时间: {time.strftime('%H:%M:%S')}")
+    layout["footer"].update(Panel(footer_text))
+    return layout
+
+
+def run_rebuild(console: Console, metrics: List[MetricSpec], ticks: List[Dict[str, float]]) -> int:
+    histories = {spec.key: deque(maxlen=120) for spec in metrics}
+    with Live(console=console, auto_refresh=False) as live:
+        for values in ticks:
+            live.update(rebuild_layout(metrics, values, histories), refresh=True)
+    return len(ticks)
+
+
+def run_incremental(console: Console, metrics: List[MetricSpec], ticks: List[Dict[str, float]]) -> int:
+    dashboard = DashboardModel(metrics)
+    with Live(dashboard, console=console, auto_refresh=False) as live:
+        for values in ticks:
+            dashboard.update(values)
+            dashboard.refresh(live)
+    return dashboard.frames
+
+
+def measure(runner, metrics, ticks, height: int) -> Dict[str, float]:
+    """Time one approach, then re-run it under tracemalloc for allocations"""
+    sink = NullFile()
+    console = Console(file=sink, force_terminal=True, width=100, height=height)
+    started = time.perf_counter()
+    rendered = runner(console, metrics, ticks)
+    elapsed = time.perf_counter() - started
+
+    console = Console(file=NullFile(), force_terminal=True, width=100, height=height)
+    tracemalloc.start()
+    runner(console, metrics, ticks)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "ticks_per_sec": len(ticks) / elapsed,
+        "rendered": rendered,
+        "peak_kb": peak / 1024,
+        "bytes_per_tick": sink.bytes_written / len(ticks),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dashboard rebuild vs. incremental benchmark")
+    parser.add_argument("--metrics", type=int, nargs="+", default=[4, 32, 64], help="metric row counts to test")
+    parser.add_argument("--frames", type=int, default=120, help="ticks per run")
+    parser.add_argument("--change-ratio", type=float, default=0.1, help="share of metrics changing per tick")
+    args = parser.parse_args()
+
+    console = Console()
+    table = Table(title=f"Dashboard benchmark ({args.frames} ticks, {args.change_ratio:.0%} of metrics change per tick)")
+    table.add_column("metrics", justify="right")
+    table.add_column("approach")
+    table.add_column("ticks/s", justify="right")
+    table.add_column("frames drawn", justify="right")
+    table.add_column("peak alloc", justify="right")
+    table.add_column("bytes/tick", justify="right")
+
+    for count in args.metrics:
+        metrics = make_metrics(count)
+        ticks = make_ticks(metrics, args.frames, args.change_ratio)
+        height = count + 12
+        results = {
+            "rebuild": measure(run_rebuild, metrics, ticks, height),
+            "incremental": measure(run_incremental, metrics, ticks, height),
+        }
+        for name, result in results.items():
+            table.add_row(
+                str(count), name,
+                f"{result['ticks_per_sec']:.0f}",
+                str(result["rendered"]),
+                f"{result['peak_kb']:.0f} KB",
+                f"{result['bytes_per_tick']:.0f}",
+            )
+        speedup = results["incremental"]["ticks_per_sec"] / results["rebuild"]["ticks_per_sec"]
+        table.add_row("", f"[bold]speedup x{speedup:.1f}[/bold]", "", "", "", "", end_section=True)
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
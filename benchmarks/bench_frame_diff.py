@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Frame diff benchmark - bytes written per refresh, rich Live vs. DiffLive
+Replays the same frames of the live show cases (status line, metrics
+table, incremental dashboard) through rich's Live and through DiffLive,
+both writing to a counting terminal sink, and reports bytes and write()
+calls per frame plus render time.
+
+    python -m benchmarks.bench_frame_diff --frames 200 --width 120 --height 40
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from rich.console import Console
+from rich.live import Live
+from rich.table import Table
+
+from dashboard import DashboardModel
+from frame_diff import CountingFile, DiffLive
+from metrics import SyntheticMetricsProvider
+
+
+def status_frames(frames: int) -> Iterator:
+    """Show case 10: one status line whose counter changes every frame"""
+    spinner_chars = ["↻", "→", "↺", "←"]
+    for i in range(frames):
+        yield f"{spinner_chars[i % 4]} 同步中... {i / frames * 100:.1f}%（已同步 {i}/{frames} 条）"
+
+
+def table_frames(frames: int) -> Iterator:
+    """Show case 20: a small table rebuilt every frame with fresh values"""
+    provider = SyntheticMetricsProvider(seed=3)
+    for i in range(frames):
+        values = provider.sample()
+        table = Table()
+        for header in ("时间", "CPU使用率", "内存使用", "网络流量"):
+            table.add_column(header)
+        table.add_row(f"12:00:{i % 60:02d}", f"{values['cpu']:.0f}%", f"{values['memory_mb']:.0f} MB",
+                      f"{values['network'] * 125:.0f} KB/s")
+        yield table
+
+
+def dashboard_frames(frames: int) -> Iterator:
+    """Interactive dashboard: the same model updated in place each frame"""
+    provider = SyntheticMetricsProvider(seed=5)
+    dashboard = DashboardModel()
+    for i in range(frames):
+        dashboard.update(provider.sample(), now=1_700_000_000 + i)
+        yield dashboard
+
+
+SCENARIOS: Dict[str, Callable[[int], Iterator]] = {
+    "status line": status_frames,
+    "metrics table": table_frames,
+    "dashboard": dashboard_frames,
+}
+
+
+def replay(make_live: Callable, frames: Iterator, width: int, height: int) -> Tuple[CountingFile, float, int]:
+    sink = CountingFile()
+    console = Console(file=sink, width=width, height=height, force_terminal=True, color_system="truecolor")
+    count = 0
+    started = time.perf_counter()
+    with make_live(console) as live:
+        start_bytes, start_writes = sink.bytes_written, sink.writes
+        for renderable in frames:
+            live.update(renderable)
+            live.refresh()
+            count += 1
+        # Only the refreshes are compared, not start-up / tear-down
+        sink.bytes_written -= start_bytes
+        sink.writes -= start_writes
+    return sink, time.perf_counter() - started, count
+
+
+OUTPUTS: List[Tuple[str, Callable]] = [
+    ("rich Live", lambda console: Live(console=console, auto_refresh=False)),
+    ("DiffLive", lambda console: DiffLive(console=console)),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bytes per refresh: rich Live vs. frame-diffed output")
+    parser.add_argument("--frames", type=int, default=200, help="frames per scenario")
+    parser.add_argument("--width", type=int, default=120, help="terminal width")
+    parser.add_argument("--height", type=int, default=40, help="terminal height")
+    args = parser.parse_args()
+
+    table = Table(title=f"Terminal output per frame ({args.width}x{args.height}, {args.frames} frames)")
+    table.add_column("scenario")
+    table.add_column("output")
+    table.add_column("bytes / frame", justify="right")
+    table.add_column("writes / frame", justify="right")
+    table.add_column("ms / frame", justify="right")
+    table.add_column("bytes saved", justify="right")
+
+    for name, scenario in SCENARIOS.items():
+        baseline = None
+        for output, make_live in OUTPUTS:
+            sink, seconds, count = replay(make_live, scenario(args.frames), args.width, args.height)
+            per_frame = sink.bytes_written / count
+            baseline = baseline or per_frame
+            table.add_row(name, output, f"{per_frame:,.0f}", f"{sink.writes / count:.1f}",
+                          f"{seconds / count * 1000:.2f}", f"{1 - per_frame / baseline:.0%}")
+        table.add_section()
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
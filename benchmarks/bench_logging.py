@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Logging benchmark - do producers stall when the terminal can't keep up?
+Producer threads log at a fixed target rate for a few seconds into an
+off-screen terminal, through RichHandler directly and through LogPipeline
+(RichHandler batches, and the fast line renderer) under each overflow
+policy. Reports the rate the producers actually achieved, the p99 / max
+time a single logging call took, and what was rendered, lost and spent.
+
+    python -m benchmarks.bench_logging --rate 50000 --threads 4 --seconds 2
+"""
+
+import argparse
+import logging
+import statistics
+import threading
+import time
+from contextlib import nullcontext
+from typing import Dict, List, Optional
+
+from rich.console import Console
+from rich.logging import RichHandler
+from rich.table import Table
+
+from frame_diff import CountingFile
+from log_pipeline import LogPipeline
+
+# (label, pipeline options or None for a plain RichHandler). RichHandler renders ~1k lines/s,
+# so its pipelines get a queue of about a second's work (draining 50k records would take a minute)
+MODES = [
+    ("RichHandler", None),
+    ("pipeline · drop", {"policy": "drop", "capacity": 1_000}),
+    ("pipeline · sample", {"policy": "sample", "capacity": 1_000}),
+    ("fast · block", {"policy": "block", "fast": True}),
+    ("fast · drop", {"policy": "drop", "fast": True}),
+    ("fast · sample", {"policy": "sample", "fast": True}),
+]
+
+
+def produce(logger: logging.Logger, rate: float, deadline: float, latencies: List[float]):
+    """Log at rate lines/s until deadline, recording each call's duration"""
+    interval = 1.0 / rate
+    next_at = time.perf_counter()
+    i = 0
+    while True:
+        now = time.perf_counter()
+        if now >= deadline:
+            return
+        if now < next_at:
+            time.sleep(next_at - now)
+        started = time.perf_counter()
+        logger.info("request %d served in %.1f ms from %s", i, (i % 97) / 3, "10.0.0.7")
+        latencies.append(time.perf_counter() - started)
+        next_at += interval
+        i += 1
+
+
+def run(options: Optional[Dict], rate: float, threads: int, seconds: float, width: int) -> Dict:
+    sink = CountingFile()
+    console = Console(file=sink, width=width, force_terminal=True, color_system="truecolor")
+    handler = RichHandler(console=console, show_path=False)
+    logger = logging.getLogger(f"bench.{id(sink)}")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    pipeline = LogPipeline(handler, **options) if options is not None else None
+    if pipeline is None:
+        logger.addHandler(handler)
+
+    latencies: List[List[float]] = [[] for _ in range(threads)]
+    started = time.perf_counter()
+    with pipeline if pipeline is not None else nullcontext():
+        if pipeline is not None:
+            pipeline.attach(logger)
+        deadline = started + seconds
+        workers = [threading.Thread(target=produce, args=(logger, rate / threads, deadline, latencies[i]))
+                   for i in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        produced = time.perf_counter() - started
+    drained = time.perf_counter() - started
+    logger.removeHandler(handler)
+
+    calls = sorted(latency for thread in latencies for latency in thread)
+    return {
+        "offered": len(calls) / produced,
+        "p99_us": calls[int(len(calls) * 0.99)] * 1e6 if calls else 0.0,
+        "max_ms": calls[-1] * 1000 if calls else 0.0,
+        "median_us": statistics.median(calls) * 1e6 if calls else 0.0,
+        "lines": len(calls),
+        "lost": pipeline.lost if pipeline is not None else 0,
+        "drain_s": drained - produced,
+        "cpu": pipeline.stats["cpu"] if pipeline is not None else None,
+        "kib": sink.bytes_written / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Logging throughput: RichHandler vs. LogPipeline under load")
+    parser.add_argument("--rate", type=float, default=50_000, help="target lines per second (all threads)")
+    parser.add_argument("--threads", type=int, default=4, help="producer threads")
+    parser.add_argument("--seconds", type=float, default=2.0, help="how long the producers run")
+    parser.add_argument("--width", type=int, default=120, help="terminal width")
+    args = parser.parse_args()
+
+    table = Table(title=f"Logging at {args.rate:,.0f} lines/s target, {args.threads} threads, {args.seconds:g}s")
+    table.add_column("mode")
+    table.add_column("achieved /s", justify="right")
+    table.add_column("call median µs", justify="right")
+    table.add_column("call p99 µs", justify="right")
+    table.add_column("call max ms", justify="right")
+    table.add_column("lost", justify="right")
+    table.add_column("drain s", justify="right")
+    table.add_column("listener CPU s", justify="right")
+    table.add_column("output KiB", justify="right")
+
+    for label, options in MODES:
+        result = run(options, args.rate, args.threads, args.seconds, args.width)
+        lost = f"{result['lost']:,} ({result['lost'] / max(result['lines'], 1):.0%})"
+        cpu = "-" if result["cpu"] is None else f"{result['cpu']:.2f}"
+        table.add_row(label, f"{result['offered']:,.0f}", f"{result['median_us']:.1f}", f"{result['p99_us']:.0f}",
+                      f"{result['max_ms']:.1f}", lost, f"{result['drain_s']:.2f}", cpu, f"{result['kib']:,.0f}")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
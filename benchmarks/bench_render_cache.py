@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Render cache benchmark - static show cases with and without memoized output
+Runs each static show case (nested tables, emoji, layout, columns, rules)
+into an off-screen terminal at several widths: once with an empty render
+cache, then repeatedly with the cache warm, as a kiosk loop would. Reports
+the cold and warm render times, the bytes each pass wrote (they must be
+equal) and the memory the cache holds.
+
+    python -m benchmarks.bench_render_cache --widths 80 120 200 --runs 50
+"""
+
+import argparse
+import statistics
+import time
+from typing import Dict
+
+from rich.console import Console
+from rich.table import Table
+
+import rich_showcase
+from frame_diff import CountingFile
+from pacing import pacer
+from render_cache import render_cache
+
+# Show cases printed through the render cache
+CASES = ("4", "14", "15", "16", "21")
+
+
+def run(number: str, width: int, height: int, runs: int) -> Dict:
+    case = rich_showcase.find_showcase(number)
+    case.load()
+
+    def once():
+        sink = CountingFile()
+        rich_showcase.console = Console(file=sink, width=width, height=height, force_terminal=True,
+                                        color_system="truecolor")
+        started = time.perf_counter()
+        case.run()
+        return time.perf_counter() - started, sink.bytes_written
+
+    render_cache.clear()
+    cold, cold_bytes = once()
+    warm = [once() for _ in range(runs)]
+    return {
+        "name": case.name,
+        "cold_ms": cold * 1000,
+        "warm_ms": statistics.median(seconds for seconds, _ in warm) * 1000,
+        "same_output": all(written == cold_bytes for _, written in warm),
+        "bytes": cold_bytes,
+        "cached_kib": render_cache.size / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Static show cases: cold render vs. render cache hits")
+    parser.add_argument("--widths", type=int, nargs="+", default=[80, 120, 200], help="terminal widths")
+    parser.add_argument("--height", type=int, default=40, help="terminal height (the layout fills it)")
+    parser.add_argument("--runs", type=int, default=50, help="warm runs per case and width")
+    args = parser.parse_args()
+    # Static output only: the layout show case stays live on an animated terminal
+    pacer.configure(0)
+
+    table = Table(title=f"Render cache, {args.runs} warm runs per case (median)")
+    table.add_column("case")
+    table.add_column("width", justify="right")
+    table.add_column("cold ms", justify="right")
+    table.add_column("warm ms", justify="right")
+    table.add_column("speed-up", justify="right")
+    table.add_column("output", justify="right")
+    table.add_column("cached KiB", justify="right")
+
+    for number in CASES:
+        for width in args.widths:
+            result = run(number, width, args.height, args.runs)
+            output = f"{result['bytes']:,} B" if result["same_output"] else "[red]differs[/red]"
+            table.add_row(f"{number}. {result['name']}", str(width), f"{result['cold_ms']:.2f}",
+                          f"{result['warm_ms']:.2f}", f"{result['cold_ms'] / max(result['warm_ms'], 1e-6):.1f}×",
+                          output, f"{result['cached_kib']:,.0f}")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Resize benchmark - redraw on every resize event vs. debounced reflow
+Drags an off-screen terminal through a burst of sizes (one per event, at
+--events-per-second for --seconds), then leaves it alone for a moment,
+while a layout is shown in a DiffLive region. "every event" redraws the
+whole layout on each size change, like a plain Layout; "debounced" skips
+frames until the size has settled (resize.ResizeWatcher) and re-renders
+only the regions of the ReflowLayout whose size changed. Reports frames
+drawn, regions rendered, CPU time and bytes written.
+
+    python -m benchmarks.bench_resize --events-per-second 60 --seconds 1
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, List, Tuple
+
+from rich.console import Console
+from rich.layout import Layout
+from rich.panel import Panel
+from rich.table import Table
+
+from dashboard import DashboardModel
+from frame_diff import CountingFile, DiffLive
+from resize import ReflowLayout, ResizeWatcher
+
+
+def layout_system() -> ReflowLayout:
+    """The layout of Show Case 15"""
+    layout = ReflowLayout()
+    layout.split(Layout(name="header", size=3), Layout(name="main", ratio=2), Layout(name="footer", size=2))
+    layout["main"].split_row(Layout(name="left", ratio=1), Layout(name="center", ratio=2),
+                             Layout(name="right", ratio=1))
+    layout["header"].update(Panel("[bold]Rich Layout System Demo[/bold]", style="blue"))
+    layout["left"].update(Panel("[green]左侧面板\n这里可以放置菜单\n或导航内容[/green]", title="菜单"))
+    layout["center"].update(Panel("[yellow]中央内容区域\n这是主要的显示区域\n可以展示各种信息[/yellow]", title="内容"))
+    layout["right"].update(Panel("[cyan]右侧面板\n状态信息\n或辅助内容[/cyan]", title="状态"))
+    layout["footer"].update(Panel("[dim]底部状态栏\n© 2024 Rich Showcase[/dim]", style="dim"))
+    return layout
+
+
+def dashboard() -> Tuple[DashboardModel, ReflowLayout]:
+    model = DashboardModel()
+    model.update({"cpu": 42, "memory": 63, "disk_io": 120, "network": 35})
+    return model, model.layout
+
+
+def drag_sizes(count: int, width: int, height: int) -> List[Tuple[int, int]]:
+    """A drag of the bottom-right corner: narrower and taller, with some jitter"""
+    return [(width - i // 2, height + (i % 7)) for i in range(count)]
+
+
+def run(build: Callable, debounced: bool, sizes: List[Tuple[int, int]], interval: float, settle: float) -> Dict:
+    sink = CountingFile()
+    width, height = sizes[0]
+    console = Console(file=sink, width=width, height=height, force_terminal=True, color_system="truecolor")
+    renderable, layout = build()
+    watcher = ResizeWatcher(console)
+    cpu = 0.0
+    with DiffLive(renderable, console=console) as live:
+        frames_before = live.frames
+        for size in sizes + [None] * int(settle / interval):
+            tick = time.perf_counter()
+            if size is not None:
+                console.size = size
+            started = time.process_time()
+            if not debounced:
+                if size is not None:
+                    layout.invalidate()
+                    live.refresh()
+            elif not watcher.settling and watcher.poll() is not None:
+                live.refresh()
+            cpu += time.process_time() - started
+            time.sleep(max(interval - (time.perf_counter() - tick), 0))
+        frames = live.frames - frames_before
+    return {"frames": frames, "rendered": layout.stats["rendered"], "reused": layout.stats["reused"],
+            "cpu_ms": cpu * 1000, "kib": sink.bytes_written / 1024}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Terminal resize: redraw per event vs. debounced reflow")
+    parser.add_argument("--events-per-second", type=float, default=60, help="resize events during the drag")
+    parser.add_argument("--seconds", type=float, default=1.0, help="how long the drag lasts")
+    parser.add_argument("--width", type=int, default=160, help="terminal width at the start of the drag")
+    parser.add_argument("--height", type=int, default=40, help="terminal height at the start of the drag")
+    args = parser.parse_args()
+
+    interval = 1.0 / args.events_per_second
+    sizes = drag_sizes(int(args.events_per_second * args.seconds), args.width, args.height)
+    table = Table(title=f"Dragging through {len(sizes)} sizes in {args.seconds:g}s")
+    table.add_column("layout")
+    table.add_column("mode")
+    table.add_column("frames", justify="right")
+    table.add_column("regions rendered", justify="right")
+    table.add_column("regions reused", justify="right")
+    table.add_column("CPU ms", justify="right")
+    table.add_column("output KiB", justify="right")
+
+    for name, build in (("layout system", lambda: (layout_system(),) * 2), ("dashboard", dashboard)):
+        for mode, debounced in (("every event", False), ("debounced", True)):
+            result = run(build, debounced, sizes, interval, settle=0.5)
+            table.add_row(name, mode, str(result["frames"]), str(result["rendered"]), str(result["reused"]),
+                          f"{result['cpu_ms']:.0f}", f"{result['kib']:,.0f}", end_section=debounced)
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Search benchmark - per-keystroke latency of SearchIndex vs. a linear scan
+Builds synthetic catalogues, replays queries one keystroke at a time and
+reports index build time plus p50 / p95 / max latency per keystroke, for
+independent searches, an IncrementalSearch session and the original scan.
+
+    python -m benchmarks.bench_search --sizes 10000 100000
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import Callable, List
+
+from rich.console import Console
+from rich.table import Table
+
+from search_engine import IncrementalSearch, SearchIndex
+
+WORDS = [
+    "Python", "JavaScript", "TypeScript", "Rust", "Kotlin", "Swift", "Docker",
+    "Kubernetes", "Linux", "Postgres", "Redis", "Kafka", "GraphQL", "Terraform",
+    "编程语言", "前端开发", "系统编程", "容器编排", "云服务", "数据库", "版本控制",
+    "Straße", "Überwachung", "Café", "ﬁle", "Naïve", "résumé",
+]
+SYLLABLES = ["ka", "lo", "mi", "ne", "tor", "zen", "qua", "rix", "bel", "dun", "sha", "vo"]
+
+
+def make_corpus(size: int, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(size):
+        name = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        corpus.append(f"{rng.choice(WORDS)} {name.title()} {rng.choice(WORDS)} #{i}")
+    return corpus
+
+
+def make_queries(corpus: List[str], count: int, seed: int = 11) -> List[str]:
+    """Queries cut from random entries, plus some with a typo"""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        words = rng.choice(corpus).split()
+        query = words[1][: rng.randint(3, len(words[1]))]
+        if rng.random() < 0.3 and len(query) > 4:
+            position = rng.randrange(1, len(query) - 1)
+            query = query[:position] + query[position + 1] + query[position] + query[position + 2:]
+        queries.append(query)
+    return queries
+
+
+def linear_search(corpus: List[str]) -> Callable[[str], List[str]]:
+    """The original real_time_search filter"""
+    def search(term: str) -> List[str]:
+        return [item for item in corpus if term.lower() in item.lower()]
+    return search
+
+
+def keystroke_latencies(search: Callable[[str], object], queries: List[str]) -> List[float]:
+    latencies = []
+    for query in queries:
+        for end in range(1, len(query) + 1):
+            started = time.perf_counter()
+            search(query[:end])
+            latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SearchIndex per-keystroke latency benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000], help="catalogue sizes")
+    parser.add_argument("--queries", type=int, default=50, help="queries typed per catalogue")
+    parser.add_argument("--limit", type=int, default=50, help="results requested per keystroke")
+    args = parser.parse_args()
+
+    table = Table(title="Per-keystroke search latency (ms)")
+    table.add_column("entries", justify="right")
+    table.add_column("engine")
+    table.add_column("build", justify="right")
+    table.add_column("p50", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column("max", justify="right")
+
+    for size in args.sizes:
+        corpus = make_corpus(size)
+        queries = make_queries(corpus, args.queries)
+
+        started = time.perf_counter()
+        index = SearchIndex(corpus)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        engines = [
+            ("SearchIndex", f"{build_ms:.0f}", lambda q: index.search(q, limit=args.limit)),
+            ("IncrementalSearch", "-", IncrementalSearch(index, limit=args.limit).update),
+            ("linear scan", "-", linear_search(corpus)),
+        ]
+        for name, build, search in engines:
+            latencies = keystroke_latencies(search, queries)
+            table.add_row(
+                f"{size:,}", name, build,
+                f"{statistics.median(latencies):.2f}",
+                f"{percentile(latencies, 0.95):.2f}",
+                f"{max(latencies):.2f}",
+            )
+        table.add_section()
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Show case benchmark - every show case and interactive screen, headless
+Runs each registered show case and each InteractiveDemo screen against a
+null console (pacing disabled, synthetic metrics, prompts answered by an
+input_provider.ScriptedInput) at several terminal widths. Every case runs
+in a fresh process so peak RSS belongs to that case alone, and reports render time,
+memory allocated (tracemalloc, on a second pass so tracing does not skew
+the timing), peak RSS and output bytes. Results are written to JSON;
+--baseline compares against an earlier run and flags regressions.
+
+    python -m benchmarks --widths 80 120 200 --output bench.json
+    python -m benchmarks --baseline bench-v1.json --threshold 0.2
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+# Answers for the InteractiveDemo screens, one line per prompt ("" accepts the default)
+DEMO_SCRIPTS: Dict[str, List[str]] = {
+    "show_welcome": [""],
+    "smart_menu_system": ["1", "", "2", "", "3", "", "4", "", "5", "", "0"],
+    "dynamic_form_input": ["ab", "alice", "alice", "alice@example.com", "", "9,x", "1,3,5", "y"],
+    "real_time_search": ["开发", "1"],
+    "step_by_step_wizard": ["", "", "", "", "y", "", "y"],
+    "real_time_dashboard": [],
+    "show_system_status": [],
+    "user_management": [],
+    "data_analysis": [],
+    "system_settings": [],
+    "show_help": [],
+    "run_all_demos": ["", "1", "5", "", "0", "", "4", "", "", "", "", "n", "y", "", "0"],
+}
+
+# Metrics compared by --baseline (higher is worse for all of them)
+COMPARED = ("render_ms", "allocated_kb", "output_bytes")
+
+
+def peak_rss_kb() -> Optional[int]:
+    """High-water resident set size of this process, in KiB (None where unsupported)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_case(kind: str, name: str, width: int) -> Dict:
+    """Run one case in this (fresh) process and measure it; pool worker"""
+    import interactive_demo
+    import rich_showcase
+    from frame_diff import CountingFile
+    from input_provider import ScriptedInput
+    from metrics import SyntheticMetricsProvider
+    from pacing import pacer
+    from render_cache import render_cache
+
+    pacer.configure(0)
+    rich_showcase.metrics_source = "synthetic"
+
+    def attempt():
+        # A fresh console, script and demo object per pass, and a cold render cache;
+        # seeded so output sizes are reproducible
+        random.seed(0)
+        render_cache.clear()
+        sink = CountingFile(terminal=False)
+        console = Console(file=sink, width=width, height=40, color_system="truecolor")
+        rich_showcase.console = interactive_demo.console = console
+        # Typed answers are echoed by the terminal, not written by the program
+        script = ScriptedInput(DEMO_SCRIPTS.get(name, []), console, echo=False)
+        if kind == "showcase":
+            return rich_showcase.find_showcase(name).run, sink, script
+        demo = interactive_demo.InteractiveDemo(SyntheticMetricsProvider(seed=1), input_provider=script)
+        return getattr(demo, name), sink, script
+
+    result = {"kind": kind, "case": name, "width": width}
+    started = time.perf_counter()
+    if kind == "showcase":
+        rich_showcase.find_showcase(name).load()
+    result["import_ms"] = (time.perf_counter() - started) * 1000
+    rss_before = peak_rss_kb()
+    try:
+        target, sink, script = attempt()
+        started = time.perf_counter()
+        target()
+        result["render_ms"] = (time.perf_counter() - started) * 1000
+        result["output_bytes"] = sink.bytes_written
+        result["writes"] = sink.writes
+        result["answers"] = script.answers
+        result["rss_peak_kb"] = peak_rss_kb()
+        result["rss_growth_kb"] = None if rss_before is None else result["rss_peak_kb"] - rss_before
+
+        target, _, _ = attempt()
+        tracemalloc.start()
+        try:
+            target()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result["allocated_kb"] = peak / 1024
+        result["retained_kb"] = current / 1024
+    except BaseException as e:
+        # Includes ScriptExhausted: a script too short for its screen is a failed case
+        result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def all_cases() -> List[Tuple[str, str]]:
+    """(kind, name) of every show case and demo screen, in presentation order"""
+    from rich_showcase import SHOWCASES
+    cases = [("showcase", case.number) for case in SHOWCASES]
+    return cases + [("demo", name) for name in DEMO_SCRIPTS]
+
+
+def compare(results: List[Dict], baseline_path: str, threshold: float) -> List[str]:
+    """Describe every metric that grew by more than threshold since the baseline"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["kind"], r["case"], r["width"]): r for r in json.load(f)["results"]}
+    regressions = []
+    for result in results:
+        before = baseline.get((result["kind"], result["case"], result["width"]))
+        if before is None or "error" in result or "error" in before:
+            continue
+        for metric in COMPARED:
+            old, new = before.get(metric), result.get(metric)
+            if old and new is not None and new > old * (1 + threshold):
+                regressions.append(f"{result['kind']} {result['case']} @{result['width']}: "
+                                   f"{metric} {old:,.1f} → {new:,.1f} (+{new / old - 1:.0%})")
+    return regressions
+
+
+def case_label(result: Dict) -> str:
+    if result["kind"] == "showcase":
+        from rich_showcase import find_showcase
+        return f"{result['case']}. {find_showcase(result['case']).name}"
+    return f"demo.{result['case']}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless per-case benchmark of every show case and demo screen")
+    parser.add_argument("--widths", type=int, nargs="+", default=[80, 120, 200], help="terminal widths to render at")
+    parser.add_argument("--cases", nargs="+", help="only these show case numbers / demo method names")
+    parser.add_argument("--jobs", type=int, default=1, help="cases run concurrently (1 keeps timings comparable)")
+    parser.add_argument("--output", default="bench-showcases.json", help="JSON results file")
+    parser.add_argument("--baseline", metavar="FILE", help="earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="relative growth reported as a regression")
+    args = parser.parse_args()
+
+    cases = [case for case in all_cases() if not args.cases or case[1] in args.cases]
+    runs = [(kind, name, width) for kind, name in cases for width in args.widths]
+    console = Console()
+    started = time.perf_counter()
+    # spawn + one task per child: every case starts from a clean interpreter
+    context = multiprocessing.get_context("spawn")
+    with console.status(f"运行 {len(runs)} 个用例...") as status, \
+            context.Pool(args.jobs, maxtasksperchild=1) as pool:
+        results = []
+        for result in pool.starmap(run_case, runs, chunksize=1):
+            results.append(result)
+            status.update(f"运行 {len(runs)} 个用例... {len(results)}/{len(runs)}")
+
+    from snapshot_cache import rich_version
+    report = {
+        "rich": rich_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "widths": args.widths,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    table = Table(title=f"Show cases, headless ({time.perf_counter() - started:.1f}s total)")
+    table.add_column("case")
+    table.add_column("width", justify="right")
+    table.add_column("render ms", justify="right")
+    table.add_column("allocated KiB", justify="right")
+    table.add_column("peak RSS MiB", justify="right")
+    table.add_column("output KiB", justify="right")
+    for result in results:
+        if "error" in result:
+            table.add_row(case_label(result), str(result["width"]), f"[red]{result['error']}[/red]", "", "", "")
+            continue
+        rss = result["rss_peak_kb"]
+        table.add_row(case_label(result), str(result["width"]), f"{result['render_ms']:.1f}",
+                      f"{result['allocated_kb']:,.0f}", "-" if rss is None else f"{rss / 1024:.1f}",
+                      f"{result['output_bytes'] / 1024:.1f}")
+    console.print(table)
+    console.print(f"[dim]结果已写入 {args.output}[/dim]")
+
+    failures = sum("error" in result for result in results)
+    regressions = compare(results, args.baseline, args.threshold) if args.baseline else []
+    for line in regressions:
+        console.print(f"[yellow]⚠ {line}[/yellow]")
+    if failures or regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Transfer benchmark - does the progress display throttle I/O throughput?
+Hashes the same files with no progress reporting, through a ProgressHub, and
+with a Progress.update call per chunk (the naive approach), for each chunk
+size and worker count, and reports throughput in MB/s. The first pass warms
+the page cache so every run reads from memory and display overhead is what
+differs. Many small files mostly measure per-file setup; point --path at a
+few large files to see steady-state throughput.
+
+    python -m benchmarks.bench_transfer --path /usr/lib --chunk-sizes 64K 1M --workers 1 4
+"""
+
+import argparse
+import io
+import os
+import statistics
+from typing import Callable, Dict
+
+from rich.console import Console
+from rich.progress import Progress, BarColumn, DownloadColumn, TextColumn, TransferSpeedColumn
+from rich.table import Table
+
+from progress_engine import ProgressHub
+from transfer import TransferSummary, parse_size, plan_transfers, run_transfers
+
+
+class NullFile(io.TextIOBase):
+    """Writable terminal sink that discards output"""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def isatty(self) -> bool:
+        return True
+
+
+class DirectHub:
+    """Hub stand-in that calls Progress.update on every chunk, from the worker thread"""
+
+    class Reporter:
+        def __init__(self, progress: Progress, task_id):
+            self.progress = progress
+            self.task_id = task_id
+
+        def advance(self, amount: float):
+            self.progress.update(self.task_id, advance=amount)
+
+        def flush(self):
+            pass
+
+        def done(self):
+            pass
+
+    def __init__(self, progress: Progress):
+        self.progress = progress
+
+    def add_task(self, description: str, total: float):
+        return self.progress.add_task(description, total=total)
+
+    def reporter(self, task_id):
+        return self.Reporter(self.progress, task_id)
+
+
+def make_progress() -> Progress:
+    console = Console(file=NullFile(), width=120, height=40, force_terminal=True)
+    return Progress(TextColumn("{task.description}"), BarColumn(), DownloadColumn(), TransferSpeedColumn(),
+                    console=console)
+
+
+def run_none(jobs, chunk_size: int, workers: int) -> TransferSummary:
+    return run_transfers(jobs, None, chunk_size=chunk_size, workers=workers)
+
+
+def run_hub(jobs, chunk_size: int, workers: int) -> TransferSummary:
+    with ProgressHub(make_progress(), overall="all") as hub:
+        return run_transfers(jobs, hub, chunk_size=chunk_size, workers=workers)
+
+
+def run_direct(jobs, chunk_size: int, workers: int) -> TransferSummary:
+    with make_progress() as progress:
+        return run_transfers(jobs, DirectHub(progress), chunk_size=chunk_size, workers=workers)
+
+
+def default_path() -> str:
+    """The interpreter's extension modules: a few dozen binary files, ~15 MB"""
+    stdlib = os.path.dirname(os.__file__)
+    dynload = os.path.join(stdlib, "lib-dynload")
+    return dynload if os.path.isdir(dynload) else stdlib
+
+
+MODES: Dict[str, Callable[..., TransferSummary]] = {
+    "no progress": run_none,
+    "ProgressHub": run_hub,
+    "update per chunk": run_direct,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Transfer throughput with and without progress display")
+    parser.add_argument("--path", nargs="+", default=[default_path()], help="files or directories to hash")
+    parser.add_argument("--chunk-sizes", nargs="+", default=["16K", "256K", "1M"], help="read chunk sizes")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4], help="concurrent files")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per configuration (median is reported)")
+    args = parser.parse_args()
+
+    jobs, _ = plan_transfers(args.path)
+    total = sum(job.size for job in jobs)
+    run_none(jobs, parse_size("1M"), 4)   # warm the page cache
+
+    table = Table(title=f"Hash throughput, {len(jobs):,} files / {total / 1e6:.1f} MB (MB/s, median of {args.repeat})")
+    table.add_column("chunk", justify="right")
+    table.add_column("workers", justify="right")
+    for mode in MODES:
+        table.add_column(mode, justify="right")
+    table.add_column("hub overhead", justify="right")
+
+    for chunk in args.chunk_sizes:
+        chunk_size = parse_size(chunk)
+        for workers in args.workers:
+            speeds = {}
+            for mode, run in MODES.items():
+                runs = [run(jobs, chunk_size, workers) for _ in range(args.repeat)]
+                speeds[mode] = statistics.median(summary.throughput for summary in runs) / 1e6
+            overhead = 1 - speeds["ProgressHub"] / speeds["no progress"]
+            table.add_row(chunk, str(workers), *(f"{speeds[mode]:.0f}" for mode in MODES), f"{overhead:.1%}")
+        table.add_section()
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
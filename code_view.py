@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Code View - incremental, cached syntax highlighting for large source files
+HighlightedSource drives pygments' token generator only as far as the lines
+that are about to be shown, so the first screen of a 50k-line file appears
+after lexing a few hundred lines. The remainder is lexed in the background
+in chunks, and the finished lines are stored in a TokenCache keyed by
+(sha256 of the content, lexer, theme); showing the same file again skips
+lexing entirely. Cache files are plain JSON, checked when loaded, so a
+shared cache directory holds data only. CodeView renders just the visible line range and plugs
+into the pager.
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from rich.color import Color, blend_rgb
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.errors import StyleSyntaxError
+from rich.style import Style
+from rich.syntax import PygmentsSyntaxTheme
+from rich.text import Span, Text
+
+DEFAULT_THEME = "monokai"
+
+# Lines lexed per step, beyond the last line requested
+LEX_CHUNK = 256
+
+MEMORY_CACHE_ENTRIES = 16
+
+
+def default_cache_dir() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "termshowstage", "code")
+
+
+def source_key(data: bytes, lexer: str, theme: str) -> str:
+    """Cache key of a highlighted file"""
+    digest = hashlib.sha256(data).hexdigest()
+    return hashlib.sha256(f"{digest}\0{lexer}\0{theme}".encode()).hexdigest()
+
+
+# (style strings, line strings, span triples, first span per line)
+CachedLines = Tuple[List[str], List[str], array, array]
+
+
+class TokenCache:
+    """Highlighted lines by source key: a small in-memory LRU over an optional directory"""
+
+    def __init__(self, directory: Optional[str] = None, entries: int = MEMORY_CACHE_ENTRIES):
+        self.directory = directory
+        self.entries = entries
+        self._memory: "OrderedDict[str, CachedLines]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    @staticmethod
+    def _decode(data: dict) -> CachedLines:
+        """CachedLines from a cache file's JSON; ValueError / TypeError if it is not well formed"""
+        styles, lines = data["styles"], data["lines"]
+        spans, span_index = array("I", data["spans"]), array("I", data["span_index"])
+        if not (isinstance(styles, list) and isinstance(lines, list)
+                and all(isinstance(item, str) for item in styles + lines)):
+            raise TypeError("styles and lines must be lists of strings")
+        if (len(spans) % 3 or len(span_index) != len(lines) + 1 or span_index[0] != 0
+                or span_index[-1] != len(spans) or any(a > b for a, b in zip(span_index, span_index[1:]))):
+            raise ValueError("span tables do not match the lines")
+        if any(style_id >= len(styles) for style_id in spans[2::3]):
+            raise ValueError("span refers to an unknown style")
+        for name in styles:
+            Style.parse(name)
+        return styles, lines, spans, span_index
+
+    def get(self, key: str) -> Optional[CachedLines]:
+        with self._lock:
+            lines = self._memory.get(key)
+            if lines is not None:
+                self._memory.move_to_end(key)
+                return lines
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                lines = self._decode(json.load(f))
+        except (OSError, ValueError, TypeError, KeyError, OverflowError, RecursionError, StyleSyntaxError):
+            return None
+        self._remember(key, lines)
+        return lines
+
+    def _remember(self, key: str, lines: CachedLines):
+        with self._lock:
+            self._memory[key] = lines
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.entries:
+                self._memory.popitem(last=False)
+
+    def put(self, key: str, lines: CachedLines):
+        self._remember(key, lines)
+        if self.directory is None:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temporary = f"{path}.{os.getpid()}.tmp"
+            styles, text_lines, spans, span_index = lines
+            with open(temporary, "w", encoding="utf-8") as f:
+                json.dump({"styles": styles, "lines": text_lines, "spans": spans.tolist(),
+                           "span_index": span_index.tolist()}, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(temporary, path)
+        except OSError:
+            pass
+
+
+# Shared by the show case and the viewer within one process
+memory_cache = TokenCache()
+
+
+def resolve_lexer(name: Optional[str], path: Optional[str], text: str):
+    """Lexer by name, else by file name among pygments' built-in lexers, else guessed
+
+    Built-in lexers are matched directly: the first plugin lookup pygments
+    would do scans every installed package and costs more than lexing a
+    screenful of code.
+    """
+    from pygments.lexers import get_all_lexers, get_lexer_by_name, guess_lexer
+    from pygments.util import ClassNotFound
+
+    options = {"stripnl": False, "ensurenl": True, "tabsize": 4}
+    try:
+        if name:
+            return get_lexer_by_name(name, **options)
+        if path:
+            filename = os.path.basename(path)
+            candidates = [
+                get_lexer_by_name(aliases[0], **options)
+                for _, aliases, patterns, _ in get_all_lexers(plugins=False)
+                if aliases and any(fnmatch.fnmatch(filename, pattern) for pattern in patterns)
+            ]
+            if candidates:
+                return max(candidates, key=lambda lexer: lexer.analyse_text(text[:4096]))
+        return guess_lexer(text[:4096], **options)
+    except ClassNotFound:
+        return get_lexer_by_name("text", **options)
+
+
+class HighlightedSource:
+    """Lines of highlighted source, lexed on demand (thread-safe)
+
+    Lines are stored compactly - the line strings plus (start, end, style)
+    triples in an array - and only turned into Text when displayed.
+    """
+
+    def __init__(self, text: str, lexer=None, theme: str = DEFAULT_THEME, path: Optional[str] = None,
+                 cache: Optional[TokenCache] = None, data: Optional[bytes] = None):
+        self.lexer = lexer if lexer is not None and not isinstance(lexer, str) else resolve_lexer(lexer, path, text)
+        self.lexer_name = self.lexer.aliases[0] if self.lexer.aliases else self.lexer.name
+        self.theme = PygmentsSyntaxTheme(theme)
+        self.cache = cache
+        self.key = source_key(data if data is not None else text.encode("utf-8", "surrogatepass"),
+                              self.lexer_name, theme)
+        self.line_count = text.count("\n") + (1 if text and not text.endswith("\n") else 0)
+        self.from_cache = False
+
+        self._lock = threading.Lock()
+        self._style_ids: Dict[object, int] = {}
+        self._current: List[str] = []
+        self._current_length = 0
+        cached = cache.get(self.key) if cache is not None else None
+        if cached is not None:
+            style_names, self._lines, self._spans, self._span_index = cached
+            self._styles = [Style.parse(name) for name in style_names]
+            self._tokens, self.from_cache = None, True
+        else:
+            self._styles: List[Style] = []
+            self._lines: List[str] = []
+            self._spans = array("I")             # (start, end, style id) per styled run
+            self._span_index = array("I", [0])   # first span of each line
+            self._tokens = self.lexer.get_tokens(text)
+
+    @classmethod
+    def from_file(cls, path: str, lexer: Optional[str] = None, theme: str = DEFAULT_THEME,
+                  cache: Optional[TokenCache] = None) -> "HighlightedSource":
+        with open(path, "rb") as f:
+            data = f.read()
+        return cls(data.decode("utf-8", errors="replace"), lexer, theme, path=path, cache=cache, data=data)
+
+    @property
+    def complete(self) -> bool:
+        return self._tokens is None
+
+    @property
+    def lexed(self) -> int:
+        return len(self._lines)
+
+    def _style_id(self, token_type) -> Optional[int]:
+        style_id = self._style_ids.get(token_type, -1)
+        if style_id == -1:
+            style = self.theme.get_style_for_token(token_type)
+            if style:
+                style_id = len(self._styles)
+                self._styles.append(style)
+            else:
+                style_id = None
+            self._style_ids[token_type] = style_id
+        return style_id
+
+    def _lex(self, stop: Optional[int]):
+        """Consume tokens until stop lines are complete (None: to the end)"""
+        lines, spans, span_index = self._lines, self._spans, self._span_index
+        current, length = self._current, self._current_length
+        for token_type, value in self._tokens:
+            style_id = self._style_id(token_type)
+            while True:
+                head, newline, value = value.partition("\n")
+                if head:
+                    current.append(head)
+                    if style_id is not None:
+                        spans.extend((length, length + len(head), style_id))
+                    length += len(head)
+                if not newline:
+                    break
+                lines.append("".join(current))
+                span_index.append(len(spans))
+                current, length = [], 0
+            if stop is not None and len(lines) >= stop:
+                break
+        else:
+            self._tokens = None
+        self._current, self._current_length = current, length
+        if self._tokens is None and self.cache is not None:
+            self.cache.put(self.key, ([str(style) for style in self._styles], lines, spans, span_index))
+
+    def _line(self, index: int) -> Text:
+        spans, styles = self._spans, self._styles
+        return Text(self._lines[index], spans=[
+            Span(spans[i], spans[i + 1], styles[spans[i + 2]])
+            for i in range(self._span_index[index], self._span_index[index + 1], 3)
+        ])
+
+    def lines(self, start: int, stop: int) -> List[Text]:
+        """Highlighted lines start..stop-1, lexing ahead by one chunk if needed"""
+        with self._lock:
+            if self._tokens is not None and stop > len(self._lines):
+                self._lex(stop + LEX_CHUNK)
+            return [self._line(index) for index in range(start, min(stop, len(self._lines)))]
+
+    def finish(self):
+        """Lex the rest of the file in chunks (lets readers in between chunks)"""
+        while not self.complete:
+            with self._lock:
+                if self._tokens is not None:
+                    self._lex(len(self._lines) + LEX_CHUNK)
+
+    def finish_in_background(self) -> Optional[threading.Thread]:
+        if self.complete:
+            return None
+        thread = threading.Thread(target=self.finish, name="code-lexer", daemon=True)
+        thread.start()
+        return thread
+
+    def background_style(self) -> Style:
+        return self.theme.get_background_style()
+
+    def line_number_style(self) -> Style:
+        """Line numbers blended between the text and background colours, as Syntax does"""
+        from pygments.token import Token
+        background = self.background_style()
+        foreground = self.theme.get_style_for_token(Token.Text).color
+        if background.bgcolor is None or foreground is None or background.bgcolor.is_system_defined \
+                or foreground.is_system_defined:
+            return background + Style(dim=True)
+        blended = blend_rgb(background.bgcolor.get_truecolor(), foreground.get_truecolor(), cross_fade=0.3)
+        return background + Style(color=Color.from_triplet(blended))
+
+
+class CodeView:
+    """Renders the visible line range of a HighlightedSource
+
+    ``height`` fixes the number of lines shown; by default the view fills
+    the available height (pager) or the console height.
+    """
+
+    def __init__(self, source: HighlightedSource, line_numbers: bool = True, height: Optional[int] = None):
+        self.source = source
+        self.line_numbers = line_numbers
+        self.height = height
+        self.offset = 0
+        self._page = height or 10
+
+    def _clamp(self):
+        self.offset = max(min(self.offset, self.source.line_count - self._page), 0)
+
+    def scroll(self, lines: int):
+        self.offset += lines
+        self._clamp()
+
+    def page(self, pages: int):
+        self.scroll(pages * self._page)
+
+    def home(self):
+        self.offset = 0
+
+    def end(self):
+        self.offset = self.source.line_count
+        self._clamp()
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        self._page = self.height or options.height or console.height
+        self._clamp()
+        source = self.source
+        background = source.background_style()
+        number_style = source.line_number_style()
+        gutter = len(str(source.line_count)) + 2 if self.line_numbers else 0
+        width = options.max_width - gutter
+        for number, line in enumerate(source.lines(self.offset, self.offset + self._page), self.offset + 1):
+            code = line.copy()
+            code.style = background
+            code.truncate(width, overflow="ellipsis", pad=True)
+            if self.line_numbers:
+                yield Text.assemble((f"{number:>{gutter - 1}} ", number_style), code, no_wrap=True, end="\n")
+            else:
+                code.no_wrap = True
+                yield code
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Incremental Dashboard - a monitoring dashboard built once and mutated in place
+The Layout, Panels and metric rows are created a single time; each tick only
+rewrites the Text cells whose formatted value changed, re-renders just those
+rows, and callers skip the refresh entirely when nothing visible changed.
+The Layout is a resize.ReflowLayout: the header panel is rendered again only
+when its size changes, the metrics and footer panels only when they change.
+"""
+
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.layout import Layout
+from rich.panel import Panel
+from rich.segment import Segment
+from rich.text import Text
+from resize import ReflowLayout
+from timeseries import MetricSeries
+
+
+class MetricSpec(NamedTuple):
+    """How one dashboard row is labelled, formatted and classified"""
+    key: str
+    label: str
+    unit: str
+    status: Callable[[float], str]
+    precision: int = 0
+    scale: float = 100.0  # expected maximum, used for the p95 histogram
+
+    def format(self, value: float) -> str:
+        return f"{value:.{self.precision}f}{self.unit}"
+
+
+def _cpu_status(value: float) -> str:
+    return "⚠️ 警告" if value > 80 else "✅ 正常"
+
+
+def _memory_status(value: float) -> str:
+    return "🔴 危险" if value > 85 else "🟡 注意" if value > 70 else "✅ 正常"
+
+
+def _disk_status(value: float) -> str:
+    return "⚡ 高速" if value > 150 else "📊 正常"
+
+
+def _network_status(value: float) -> str:
+    return "🌊 高负载" if value > 80 else "📡 正常"
+
+
+# The four rows shown by InteractiveDemo.real_time_dashboard
+DEFAULT_METRICS: List[MetricSpec] = [
+    MetricSpec("cpu", "CPU 使用率", "%", _cpu_status),
+    MetricSpec("memory", "内存使用", "%", _memory_status),
+    MetricSpec("disk_io", "磁盘 I/O", " MB/s", _disk_status, scale=500.0),
+    MetricSpec("network", "网络流量", " Mbps", _network_status, scale=1000.0),
+]
+
+
+def system_status(values: Dict[str, float]) -> str:
+    """Overall status line derived from CPU and memory usage"""
+    cpu_usage = values.get("cpu", 0)
+    memory_usage = values.get("memory", 0)
+    if cpu_usage < 70 and memory_usage < 75:
+        return "🟢 系统正常"
+    return "🟡 系统繁忙" if cpu_usage < 85 else "🔴 系统过载"
+
+
+class MetricRows:
+    """Columns of metric cells, sized by ratio like a header-less ``box.SIMPLE`` table
+
+    Each row's rendered segments are cached until the row is invalidated or
+    the width changes, so a frame only pays for the rows that actually changed.
+    """
+
+    def __init__(self, columns: Sequence[Tuple[str, int]] = (("cyan", 1), ("green", 1), ("yellow", 1))):
+        self.columns = list(columns)
+        self.rows: List[Tuple[Text, ...]] = []
+        self._lines: List[Optional[List[Segment]]] = []
+        self._width: Optional[int] = None
+
+    def add_row(self, *cells: Text) -> int:
+        """Append a row of Text cells (kept by reference) and return its index"""
+        self.rows.append(cells)
+        self._lines.append(None)
+        return len(self.rows) - 1
+
+    def invalidate(self, index: int):
+        """Mark a row as changed so the next frame re-renders it"""
+        self._lines[index] = None
+
+    def column_widths(self, width: int) -> List[int]:
+        """Split the width (less one space of padding per column) by ratio"""
+        available = max(width - len(self.columns) - 1, len(self.columns))
+        total_ratio = sum(ratio for _, ratio in self.columns)
+        return [max(available * ratio // total_ratio, 1) for _, ratio in self.columns]
+
+    def _render_row(self, console: Console, options: ConsoleOptions, cells: Tuple[Text, ...]) -> List[Segment]:
+        line = Text(" ")
+        widths = self.column_widths(options.max_width)
+        for cell, (style, _), column_width in zip(cells, self.columns, widths):
+            piece = cell.copy()
+            piece.stylize_before(style)
+            piece.truncate(column_width, overflow="ellipsis", pad=True)
+            line.append_text(piece)
+            line.append(" ")
+        return list(console.render(line, options.update(no_wrap=True, overflow="ellipsis")))
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        if options.max_width != self._width:
+            self._width = options.max_width
+            self._lines = [None] * len(self.rows)
+        yield Segment.line()
+        for index, cells in enumerate(self.rows):
+            lines = self._lines[index]
+            if lines is None:
+                lines = self._lines[index] = self._render_row(console, options, cells)
+            yield from lines
+        yield Segment.line()
+
+
+class DashboardModel:
+    """Dashboard whose renderables are built once and updated cell by cell
+
+    Every metric keeps a bounded MetricSeries, so each row also shows a
+    sparkline of recent samples and min / avg / p95 / max over the window.
+    """
+
+    # label, value, trend, window stats, status
+    columns = (("cyan", 3), ("green", 3), ("magenta", 4), ("dim", 6), ("yellow", 3))
+
+    def __init__(self, metrics: Optional[List[MetricSpec]] = None, title: str = "🖥️ 系统实时监控",
+                 history: int = 120, spark_width: int = 12):
+        self.metrics = list(metrics or DEFAULT_METRICS)
+        self.spark_width = spark_width
+        self.dirty = True
+        self.frames = 0
+        self.series: Dict[str, MetricSeries] = {
+            spec.key: MetricSeries(history, spec.scale) for spec in self.metrics
+        }
+        self._shown: Dict[str, Tuple[str, ...]] = {}
+        self._cells: Dict[str, Tuple[Text, ...]] = {}
+        self._row_index: Dict[str, int] = {}
+        self._footer_text = Text("")
+        self.layout = self._build(title)
+
+    def _build(self, title: str) -> ReflowLayout:
+        layout = ReflowLayout()
+        layout.split_column(
+            Layout(name="header", size=3),
+            Layout(name="main", ratio=2),
+            Layout(name="footer", size=3)
+        )
+        layout["header"].update(Panel(Text(title, style="bold blue"), style="blue"))
+
+        self.rows = MetricRows(self.columns)
+        for spec in self.metrics:
+            # Keep references to the cells so updates can rewrite them in place
+            cells = tuple(Text("-") for _ in self.columns[1:])
+            self._cells[spec.key] = cells
+            self._row_index[spec.key] = self.rows.add_row(Text(spec.label), *cells)
+
+        layout["main"].update(Panel(self.rows, title="📈 实时指标"))
+        layout["footer"].update(Panel(self._footer_text))
+        return layout
+
+    def _window_stats(self, spec: MetricSpec, series: MetricSeries) -> str:
+        p = spec.precision
+        return (f"↓{series.min:.{p}f} ~{series.avg:.{p}f} "
+                f"p95 {series.p95:.{p}f} ↑{series.max:.{p}f}")
+
+    def update(self, values: Dict[str, float], now: Optional[float] = None) -> bool:
+        """Record one sample per metric; return True if anything visible changed"""
+        changed = False
+        for spec in self.metrics:
+            if spec.key not in values:
+                continue
+            value = values[spec.key]
+            series = self.series[spec.key]
+            series.push(value)
+            shown = (
+                spec.format(value),
+                series.sparkline(self.spark_width),
+                self._window_stats(spec, series),
+                spec.status(value),
+            )
+            if self._shown.get(spec.key) == shown:
+                continue
+            self._shown[spec.key] = shown
+            for cell, text in zip(self._cells[spec.key], shown):
+                cell.plain = text
+            self.rows.invalidate(self._row_index[spec.key])
+            changed = True
+        if changed:
+            self.layout.invalidate("main")
+
+        clock = time.strftime("%H:%M:%S", time.localtime(now))
+        footer = f"📊 当前状态: {system_status(values)} | ⏰ 更新时间: {clock}"
+        if footer != self._footer_text.plain:
+            self._footer_text.plain = footer
+            self.layout.invalidate("footer")
+            changed = True
+
+        self.dirty = self.dirty or changed
+        return changed
+
+    def refresh(self, live) -> bool:
+        """Redraw the Live region only if the model changed since the last frame"""
+        if not self.dirty:
+            return False
+        live.refresh()
+        self.dirty = False
+        self.frames += 1
+        return True
+
+    def __rich__(self) -> ReflowLayout:
+        return self.layout
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Frame Diff - a Live replacement that writes only what changed
+DiffLive keeps the lines of the previous frame. On refresh it re-renders
+the renderable, skips lines that are unchanged, and for changed lines
+rewrites only the run of cells between the first and last difference. The
+whole frame's output is joined into a single write() and flush(). Over a
+slow link (SSH) this cuts the bytes per refresh from "the whole region" to
+"the characters that changed", and avoids the flicker of erase-and-redraw.
+
+``bytes_written`` / ``writes`` / ``frames`` count what went to the
+terminal; CountingFile measures any other writer (e.g. rich's Live) the
+same way.
+"""
+
+import io
+from typing import List, Optional, TextIO, Tuple
+
+from rich.cells import cell_len
+from rich.console import COLOR_SYSTEMS, Console
+from rich.segment import Segment
+from rich.style import Style
+
+Cell = Tuple[str, Optional[Style]]
+
+HIDE_CURSOR = "\x1b[?25l"
+SHOW_CURSOR = "\x1b[?25h"
+ERASE_DOWN = "\x1b[J"
+
+
+class CountingFile(io.TextIOBase):
+    """Wraps a text stream, counting the UTF-8 bytes and write() calls passed through
+
+    With no stream the output is discarded; ``terminal`` controls isatty().
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, terminal: bool = True):
+        self.stream = stream
+        self.terminal = terminal
+        self.bytes_written = 0
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.bytes_written += len(text.encode("utf-8"))
+        self.writes += 1
+        if self.stream is not None:
+            self.stream.write(text)
+        return len(text)
+
+    def flush(self):
+        if self.stream is not None:
+            self.stream.flush()
+
+    def isatty(self) -> bool:
+        return self.terminal
+
+    def fileno(self) -> int:
+        if self.stream is None:
+            raise io.UnsupportedOperation("fileno")
+        return self.stream.fileno()
+
+
+def _cells(line: List[Segment]) -> List[Cell]:
+    """One entry per terminal cell; the second cell of a wide character is ("", style)"""
+    cells: List[Cell] = []
+    for text, style, control in line:
+        if control:
+            continue
+        for char in text:
+            cells.append((char, style))
+            if cell_len(char) == 2:
+                cells.append(("", style))
+    return cells
+
+
+class DiffLive:
+    """Live-like region (context manager, update(), refresh()) with diffed output
+
+    Inline by default, like Live; screen=True uses the alternate screen.
+    Without a terminal nothing is drawn until stop(), which prints the last
+    frame, as Live does. Printing to the console while the region is active
+    is not supported.
+    """
+
+    def __init__(self, renderable=None, console: Optional[Console] = None, screen: bool = False,
+                 transient: bool = False):
+        self.renderable = renderable
+        self.console = console or Console()
+        self.screen = screen
+        self.transient = transient
+        self.bytes_written = 0
+        self.writes = 0
+        self.frames = 0
+        self.is_started = False
+        self._lines: List[List[Segment]] = []
+        self._width: Optional[int] = None
+        self._row = 0   # cursor row relative to the top of the region
+        self._color_system = COLOR_SYSTEMS.get(self.console.color_system)
+
+    def __enter__(self) -> "DiffLive":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _write(self, text: str):
+        if not text:
+            return
+        file = self.console.file
+        file.write(text)
+        file.flush()
+        self.bytes_written += len(text.encode("utf-8"))
+        self.writes += 1
+
+    def start(self):
+        if self.is_started:
+            return
+        self.is_started = True
+        if self.console.is_terminal:
+            if self.screen:
+                self.console.set_alt_screen(True)
+            self._write(HIDE_CURSOR)
+        self.refresh()
+
+    def stop(self):
+        if not self.is_started:
+            return
+        if not self.console.is_terminal:
+            if self.renderable is not None:
+                self.console.print(self.renderable)
+        else:
+            self.refresh()
+            if self.screen:
+                self._write(SHOW_CURSOR)
+                self.console.set_alt_screen(False)
+            elif self.transient:
+                self._write(self._move(0, 0) + ERASE_DOWN + SHOW_CURSOR)
+            elif self._lines:
+                self._write(self._move(len(self._lines) - 1, 0) + "\r\n" + SHOW_CURSOR)
+            else:
+                self._write(SHOW_CURSOR)
+        self.is_started = False
+        self._lines = []
+
+    def update(self, renderable, refresh: bool = False):
+        self.renderable = renderable
+        if refresh:
+            self.refresh()
+
+    def _move(self, row: int, column: int) -> str:
+        """Escape codes moving the cursor to (row, column) of the region"""
+        if self.screen:
+            self._row = row
+            return f"\x1b[{row + 1};{column + 1}H"
+        delta, self._row = row - self._row, row
+        vertical = f"\x1b[{delta}B" if delta > 0 else f"\x1b[{-delta}A" if delta < 0 else ""
+        return f"{vertical}\x1b[{column + 1}G"
+
+    def _run(self, cells: List[Cell]) -> str:
+        """Styled text of a run of cells, one escape sequence per style change"""
+        out = []
+        start = 0
+        for index in range(1, len(cells) + 1):
+            if index == len(cells) or cells[index][1] != cells[start][1]:
+                text = "".join(char for char, _ in cells[start:index])
+                style = cells[start][1]
+                out.append(style.render(text, color_system=self._color_system) if style else text)
+                start = index
+        return "".join(out)
+
+    def _render(self) -> List[List[Segment]]:
+        console = self.console
+        options = console.options.update(height=None)
+        lines = console.render_lines(self.renderable if self.renderable is not None else "", options, pad=True)
+        if len(lines) > console.height:
+            # Like Live's default vertical_overflow="ellipsis"
+            lines = lines[:console.height - 1] + [[Segment("...".ljust(console.width))]]
+        return lines
+
+    def refresh(self):
+        """Draw the current renderable, writing only the differences from the last frame"""
+        if not self.is_started or not self.console.is_terminal:
+            return
+        lines = self._render()
+        previous = self._lines
+        out = []
+        if self.console.width != self._width:
+            # First frame or resize: redraw everything from the top of the region
+            if previous:
+                out.append(self._move(0, 0) + ERASE_DOWN)
+            previous = []
+            self._width = self.console.width
+
+        common = min(len(lines), len(previous))
+        for row in range(common):
+            if lines[row] == previous[row]:
+                continue
+            old, new = _cells(previous[row]), _cells(lines[row])
+            first = next((i for i, (a, b) in enumerate(zip(old, new)) if a != b), min(len(old), len(new)))
+            last = len(new) - 1
+            while last >= first and len(old) == len(new) and old[last] == new[last]:
+                last -= 1
+            while first > 0 and new[first][0] == "":
+                first -= 1        # never start in the middle of a wide character
+            while last + 1 < len(new) and new[last + 1][0] == "":
+                last += 1
+            out.append(self._move(row, first) + self._run(new[first:last + 1]))
+            if len(old) > len(new):
+                out.append("\x1b[K")
+
+        if len(lines) > common:
+            # New lines below the old region (scrolls the terminal if needed)
+            out.append(self._move(common - 1, 0) if common else self._move(0, 0) if self.screen else "\r")
+            for row in range(common, len(lines)):
+                if row:
+                    out.append("\r\n")
+                out.append(self._run(_cells(lines[row])))
+            self._row = len(lines) - 1
+        elif len(previous) > len(lines):
+            out.append(self._move(len(lines), 0) + ERASE_DOWN)
+
+        self._lines = lines
+        self.frames += 1
+        self._write("".join(out))
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Filesystem Tree - concurrent, depth-limited directory scanning for --tree
+Directories are read with os.scandir on a thread pool, only down to a depth
+limit, honouring .gitignore / .ignore files along the way. Each finished
+directory adds its file count and bytes to all of its ancestors, so the tree
+can be rendered progressively with sizes that grow while the scan runs.
+Directories with very many files keep only a count and total, not names.
+Directories below the depth limit are not read at all, so the totals of
+their ancestors are marked as lower bounds ("≥").
+"""
+
+import fnmatch
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+IGNORE_FILES = (".gitignore", ".ignore")
+ALWAYS_IGNORED = {".git", ".hg", ".svn"}
+
+DEFAULT_DEPTH = 3
+DEFAULT_ENTRIES = 50
+
+FILE_ICONS = {
+    ".py": "🐍", ".md": "📄", ".txt": "📄", ".json": "🧾", ".csv": "📊",
+    ".png": "🖼", ".jpg": "🖼", ".gif": "🖼", ".zip": "📦", ".gz": "📦",
+}
+
+
+class IgnoreRules:
+    """gitignore-style patterns from one directory, chained to its parent's
+
+    Supports comments, "!" negation, trailing "/" for directories only, and
+    patterns containing "/" anchored to the directory of the ignore file.
+    """
+
+    def __init__(self, base: str, lines: List[str], parent: Optional["IgnoreRules"] = None):
+        self.base = base
+        self.parent = parent
+        self.rules: List[Tuple[re.Pattern, bool, bool, bool]] = []
+        for line in lines:
+            line = line.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if line.startswith("**/"):
+                line = line[3:]
+            anchored = "/" in line
+            line = line.lstrip("/")
+            regex = re.compile(fnmatch.translate(line.replace("/**/", "/*/")))
+            self.rules.append((regex, negate, dir_only, anchored))
+
+    @classmethod
+    def load(cls, directory: str, parent: Optional["IgnoreRules"]) -> Optional["IgnoreRules"]:
+        """Rules for directory: its own ignore files added to the parent's"""
+        lines: List[str] = []
+        for name in IGNORE_FILES:
+            try:
+                with open(os.path.join(directory, name), errors="replace") as f:
+                    lines.extend(f)
+            except OSError:
+                continue
+        return cls(directory, lines, parent) if lines else parent
+
+    def ignored(self, path: str, is_dir: bool) -> bool:
+        verdict = self.parent.ignored(path, is_dir) if self.parent is not None else False
+        relative = path[len(self.base) + 1:]
+        name = os.path.basename(path)
+        for regex, negate, dir_only, anchored in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(relative if anchored else name):
+                verdict = not negate
+        return verdict
+
+
+class DirNode:
+    """One scanned (or pending) directory"""
+
+    __slots__ = ("path", "name", "depth", "parent", "dirs", "files", "file_count",
+                 "own_bytes", "total_bytes", "total_files", "partial", "state", "error")
+
+    def __init__(self, path: str, name: str, depth: int, parent: Optional["DirNode"] = None):
+        self.path = path
+        self.name = name
+        self.depth = depth
+        self.parent = parent
+        self.dirs: List[DirNode] = []
+        self.files: List[Tuple[str, int]] = []   # only kept up to the entry limit
+        self.file_count = 0
+        self.own_bytes = 0
+        self.total_bytes = 0        # this directory plus scanned descendants
+        self.total_files = 0
+        self.partial = False        # totals leave out a collapsed or unreadable descendant
+        self.state = "pending"      # pending / scanned / collapsed / error
+        self.error: Optional[str] = None
+
+
+class FsScanner:
+    """Scans a directory tree on a thread pool, down to max_depth
+
+        scanner = FsScanner(path, max_depth=3).start()
+        scanner.wait(0.1)      # True once every directory is done
+        tree = render_tree(scanner)
+    """
+
+    def __init__(self, root: str, max_depth: int = DEFAULT_DEPTH, max_entries: int = DEFAULT_ENTRIES,
+                 workers: Optional[int] = None, use_ignore_files: bool = True):
+        root = os.path.abspath(root)
+        self.root = DirNode(root, os.path.basename(root) or root, 0)
+        self.max_depth = max_depth
+        self.max_entries = max_entries
+        self.use_ignore_files = use_ignore_files
+        self.lock = threading.Lock()
+        self.dirs_scanned = 0
+        self.ignored = 0
+        self._pending = 0
+        self._done = threading.Event()
+        self._pool = ThreadPoolExecutor(max_workers=workers or min(16, (os.cpu_count() or 1) * 2),
+                                        thread_name_prefix="fs-scan")
+
+    def start(self) -> "FsScanner":
+        self._submit(self.root, None)
+        return self
+
+    def _submit(self, node: DirNode, rules: Optional[IgnoreRules]):
+        with self.lock:
+            self._pending += 1
+        self._pool.submit(self._scan, node, rules)
+
+    def _scan(self, node: DirNode, rules: Optional[IgnoreRules]):
+        try:
+            self._scan_directory(node, rules)
+        except OSError as e:
+            node.state, node.error = "error", e.strerror or str(e)
+            self._mark_partial(node.parent)
+        finally:
+            with self.lock:
+                self._pending -= 1
+                if self._pending == 0:
+                    self._done.set()
+
+    def _scan_directory(self, node: DirNode, rules: Optional[IgnoreRules]):
+        if self.use_ignore_files:
+            rules = IgnoreRules.load(node.path, rules)
+        subdirs, files = [], []
+        count = size = ignored = 0
+        with os.scandir(node.path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if entry.name in ALWAYS_IGNORED or (rules is not None and rules.ignored(entry.path, is_dir)):
+                        ignored += 1
+                        continue
+                    if is_dir:
+                        subdirs.append(DirNode(entry.path, entry.name, node.depth + 1, node))
+                        continue
+                    entry_size = entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+                count += 1
+                size += entry_size
+                if len(files) < self.max_entries:
+                    files.append((entry.name, entry_size))
+
+        subdirs.sort(key=lambda child: child.name.lower())
+        files.sort(key=lambda item: item[0].lower())
+        with self.lock:
+            node.dirs, node.files = subdirs, files
+            node.file_count, node.own_bytes = count, size
+            node.state = "scanned"
+            self.dirs_scanned += 1
+            self.ignored += ignored
+            # Roll the totals up so every ancestor's size grows as the scan proceeds
+            ancestor = node
+            while ancestor is not None:
+                ancestor.total_bytes += size
+                ancestor.total_files += count
+                ancestor = ancestor.parent
+
+        for child in subdirs:
+            if child.depth <= self.max_depth:
+                self._submit(child, rules)
+            else:
+                child.state = "collapsed"
+        if subdirs and node.depth >= self.max_depth:
+            # Subdirectories past the depth limit are not counted
+            self._mark_partial(node)
+
+    def _mark_partial(self, node: Optional[DirNode]):
+        """Mark node and its ancestors: their totals leave out a subtree"""
+        with self.lock:
+            while node is not None and not node.partial:
+                node.partial = True
+                node = node.parent
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def file_icon(name: str) -> str:
+    return FILE_ICONS.get(os.path.splitext(name)[1].lower(), "📄")
+
+
+def render_tree(scanner: FsScanner):
+    """Rich Tree of the current scan state (safe to call while scanning)"""
+    from rich.filesize import decimal
+    from rich.text import Text
+    from rich.tree import Tree
+
+    limit = scanner.max_entries
+
+    def label(node: DirNode) -> Text:
+        text = Text.assemble(("📁 ", ""), (f"{node.name}/", "bold blue"))
+        if node.state == "collapsed":
+            text.append("  …", style="dim")
+        elif node.state == "error":
+            text.append(f"  ⚠ {node.error}", style="red")
+        elif node.state == "pending":
+            text.append("  扫描中…", style="dim italic")
+        else:
+            bound = "≥" if node.partial else ""
+            text.append(f"  {bound}{decimal(node.total_bytes)}, {bound}{node.total_files:,} 个文件", style="dim")
+        return text
+
+    with scanner.lock:
+        tree = Tree(label(scanner.root), guide_style="bold bright_blue")
+        stack = [(scanner.root, tree)]
+        while stack:
+            node, branch = stack.pop()
+            children = []
+            for child in node.dirs[:limit]:
+                children.append((child, branch.add(label(child))))
+            if len(node.dirs) > limit:
+                branch.add(Text(f"📁 ... {len(node.dirs) - limit:,} more directories", style="dim"))
+            if node.file_count > limit:
+                branch.add(Text(f"🗂 {node.file_count:,} files ({decimal(node.own_bytes)})", style="cyan"))
+            else:
+                for name, size in node.files:
+                    branch.add(Text.assemble(f"{file_icon(name)} {name}", (f"  {decimal(size)}", "dim")))
+            stack.extend(reversed(children))
+    return tree
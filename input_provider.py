@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Input Provider - where the interactive demo gets its answers from
+InteractiveDemo asks every question through an InputProvider instead of
+calling Prompt.ask / console.input directly. KeyboardInput reads the
+terminal as before; ScriptedInput replays answers from a JSON or YAML
+script, so the whole tour runs unattended (CI, load tests, benchmarks).
+Both record how long each screen took.
+
+A script is a list of answers, one per prompt, or {"answers": [...]}:
+
+    {"answers": ["", "1", "5", "", "0"]}
+
+"" accepts the prompt's default; YAML booleans become "y" / "n".
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from typing import Iterable, List, NamedTuple, Optional, Type
+
+from rich.console import Console
+from rich.prompt import Prompt, PromptBase
+
+import terminal_input
+
+
+class ScriptExhausted(BaseException):
+    """A prompt was reached after the script ran out of answers
+
+    Derives from BaseException so the demos' ``except Exception`` retry
+    loops cannot swallow it and prompt forever.
+    """
+
+
+class ScreenTiming(NamedTuple):
+    """Wall-clock time and answers consumed by one demo screen"""
+    name: str
+    seconds: float
+    answers: int
+
+
+class InputProvider:
+    """Answers prompts for the demo and times its screens"""
+
+    # True when keystrokes can be read one at a time (live search)
+    keyboard = False
+
+    def __init__(self, console: Console):
+        self.console = console
+        self.answers = 0
+        self.timings: List[ScreenTiming] = []
+
+    def _stream(self):
+        """Stream handed to Prompt / console.input (None reads the terminal)"""
+        return None
+
+    def ask(self, prompt_type: Type[PromptBase] = Prompt, prompt: str = "", **options):
+        """Ask with a rich prompt class (Prompt, IntPrompt, Confirm, ...); invalid answers are re-asked"""
+        return prompt_type.ask(prompt, console=self.console, stream=self._stream(), **options)
+
+    def pause(self, prompt: str = ""):
+        """Wait for Enter"""
+        self.console.input(prompt, stream=self._stream())
+
+    @contextmanager
+    def screen(self, name: str):
+        """Time the screen run inside the block"""
+        started, answers = time.perf_counter(), self.answers
+        try:
+            yield
+        finally:
+            self.timings.append(ScreenTiming(name, time.perf_counter() - started, self.answers - answers))
+
+
+class KeyboardInput(InputProvider):
+    """Answers typed at the terminal"""
+
+    def __init__(self, console: Console):
+        super().__init__(console)
+        self.keyboard = terminal_input.interactive_terminal()
+
+    def ask(self, prompt_type: Type[PromptBase] = Prompt, prompt: str = "", **options):
+        answer = super().ask(prompt_type, prompt, **options)
+        self.answers += 1
+        return answer
+
+    def pause(self, prompt: str = ""):
+        super().pause(prompt)
+        self.answers += 1
+
+
+class ScriptedInput(InputProvider):
+    """Answers replayed from a script, echoed after each prompt as if typed"""
+
+    def __init__(self, answers: Iterable[str], console: Console, echo: bool = True):
+        super().__init__(console)
+        self.script = list(answers)
+        self.echo = echo
+
+    @property
+    def remaining(self) -> int:
+        return len(self.script) - self.answers
+
+    def _stream(self):
+        return self
+
+    def readline(self) -> str:
+        """Next answer (called by rich's prompts through the stream argument)
+
+        Returned without a trailing newline: console.input passes it on
+        unstripped, and only an exact "" selects a prompt's default.
+        """
+        if self.answers >= len(self.script):
+            raise ScriptExhausted(f"脚本的 {len(self.script)} 个回答已用完")
+        answer = self.script[self.answers]
+        self.answers += 1
+        if self.echo:
+            self.console.print(answer, markup=False, highlight=False)
+        return answer
+
+
+def _answer(value) -> str:
+    if isinstance(value, bool):
+        return "y" if value else "n"
+    return "" if value is None else str(value)
+
+
+def load_script(path: str) -> List[str]:
+    """Read the answers of a JSON or YAML (.yaml / .yml, needs PyYAML) script"""
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("YAML 脚本需要 PyYAML（pip install pyyaml），或改用 JSON") from None
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get("answers")
+    if not isinstance(data, list):
+        raise ValueError(f"脚本应为回答列表或 {{\"answers\": [...]}}: {path}")
+    return [_answer(value) for value in data]
+
+
+def create_input(console: Console, script_path: Optional[str] = None) -> InputProvider:
+    """Keyboard input, or a replay of script_path"""
+    if script_path:
+        return ScriptedInput(load_script(script_path), console)
+    return KeyboardInput(console)
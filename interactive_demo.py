@@ -4,26 +4,58 @@
 展示 Rich 库的高级用户交互功能
 """
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.prompt import Prompt, IntPrompt, Confirm, FloatPrompt
 from rich.table import Table
-from rich.layout import Layout
 from rich.live import Live
 from rich.text import Text
-from rich.progress import Progress
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich import box
-import time
 from typing import List, Dict, Any, Optional
 import random
+import time
+from pacing import pacer
+from async_runtime import LiveStage, run_stage
+from dashboard import DashboardModel
+from metrics import MetricsProvider, MetricsSampler, create_provider
+from search_engine import IncrementalSearch, SearchHit, SearchIndex, highlight
+from input_provider import InputProvider, KeyboardInput, create_input
+import terminal_input
+from terminal_input import KeyReader
+from pager import NAVIGATION_KEYS
+from virtual_table import CallbackRows, VirtualTable
 
 console = Console()
 
+# 实时搜索的默认数据（可用 --catalog 指定每行一个条目的文件）
+DEFAULT_CATALOG = [
+    "Python 编程语言", "JavaScript 前端开发", "Java 企业应用",
+    "C++ 系统编程", "Go 并发编程", "Rust 系统级编程",
+    "TypeScript 类型安全", "Swift iOS 开发", "Kotlin Android 开发",
+    "PHP Web 开发", "Ruby 脚本语言", "SQL 数据库查询",
+    "HTML 网页结构", "CSS 样式设计", "Docker 容器化",
+    "Kubernetes 容器编排", "AWS 云服务", "Azure 微软云",
+    "Git 版本控制", "Linux 操作系统"
+]
+
+# 每次搜索最多显示的结果数
+SEARCH_RESULT_LIMIT = 50
+
+# 边输入边搜索模式下排序的结果数（只渲染可见窗口内的行）
+LIVE_SEARCH_LIMIT = 500
+
 class InteractiveDemo:
     """高级交互式示例类"""
     
-    def __init__(self):
+    def __init__(self, metrics_provider: Optional[MetricsProvider] = None, catalog_path: Optional[str] = None,
+                 input_provider: Optional[InputProvider] = None):
         self.user_data = {}
+        # 所有提示都经由 input 回答：键盘输入，或回放脚本（无人值守运行）
+        self.input = input_provider or KeyboardInput(console)
+        self.metrics_provider = metrics_provider or create_provider()
+        self.catalog_path = catalog_path
+        self._search_index: Optional[SearchIndex] = None
     
     def clear_screen(self):
         """清屏"""
@@ -49,7 +81,7 @@ class InteractiveDemo:
         console.print("  • 分步向导体验")
         console.print("  • 实时数据仪表盘")
         
-        console.input("\n🎮 按回车键开始体验...")
+        self.input.pause("\n🎮 按回车键开始体验...")
     
     def smart_menu_system(self):
         """智能菜单选择系统"""
@@ -89,8 +121,8 @@ class InteractiveDemo:
             
             # 获取用户选择
             try:
-                choice = IntPrompt.ask(
-                    "\n🎯 请输入选项编号",
+                choice = self.input.ask(
+                    IntPrompt, "\n🎯 请输入选项编号",
                     choices=[str(opt["id"]) for opt in menu_options],
                     show_choices=False
                 )
@@ -136,7 +168,7 @@ class InteractiveDemo:
         elif option["id"] == 5:
             self.show_help()
         
-        console.input("\n↵ 按回车键返回主菜单...")
+        self.input.pause("\n↵ 按回车键返回主菜单...")
     
     def user_management(self):
         """用户管理功能"""
@@ -197,18 +229,20 @@ class InteractiveDemo:
             {"指标": "运行时间", "值": f"{random.randint(1, 72)} 小时", "状态": "正常"}
         ]
         
-        table = Table(box=box.SIMPLE)
-        table.add_column("指标", style="cyan")
-        table.add_column("值", style="green")
-        table.add_column("状态", style="yellow")
-        
+        rows = []
         for data in status_data:
             status_style = "green" if data["状态"] in ["正常", "良好", "充足"] else "red"
-            table.add_row(
+            rows.append((
                 data["指标"],
                 data["值"],
                 Text(data["状态"], style=status_style)
-            )
+            ))
+        
+        # 行按可见窗口取用，指标再多也只渲染一屏
+        table = VirtualTable(rows, box=box.SIMPLE)
+        table.add_column("指标", style="cyan")
+        table.add_column("值", style="green")
+        table.add_column("状态", style="yellow")
         
         console.print(table)
     
@@ -226,7 +260,7 @@ class InteractiveDemo:
         
         # 用户名输入
         while True:
-            username = Prompt.ask("👤 请输入用户名")
+            username = self.input.ask(Prompt, "👤 请输入用户名")
             if len(username) >= 3:
                 form_data["username"] = username
                 break
@@ -234,14 +268,14 @@ class InteractiveDemo:
         
         # 邮箱输入验证
         while True:
-            email = Prompt.ask("📧 请输入邮箱地址")
+            email = self.input.ask(Prompt, "📧 请输入邮箱地址")
             if "@" in email and "." in email:
                 form_data["email"] = email
                 break
             console.print("❌ 请输入有效的邮箱地址", style="red")
         
         # 年龄输入
-        age = IntPrompt.ask("🎂 请输入年龄", default=18)
+        age = self.input.ask(IntPrompt, "🎂 请输入年龄", default=18)
         form_data["age"] = age
         
         # 偏好选择
@@ -252,7 +286,7 @@ class InteractiveDemo:
         
         selected_prefs = []
         while True:
-            choices = Prompt.ask("📋 请输入偏好编号 (如: 1,3,5)")
+            choices = self.input.ask(Prompt, "📋 请输入偏好编号 (如: 1,3,5)")
             try:
                 selected_indices = [int(x.strip()) for x in choices.split(",") if x.strip()]
                 selected_prefs = [preferences[i-1] for i in selected_indices if 1 <= i <= len(preferences)]
@@ -274,7 +308,7 @@ class InteractiveDemo:
             border_style="green"
         ))
         
-        if Confirm.ask("\n✅ 确认提交信息吗？"):
+        if self.input.ask(Confirm, "\n✅ 确认提交信息吗？"):
             console.print("🎉 表单提交成功！", style="bold green")
             self.user_data.update(form_data)
         else:
@@ -290,62 +324,141 @@ class InteractiveDemo:
             border_style="cyan"
         ))
         
-        # 模拟数据
-        items = [
-            "Python 编程语言", "JavaScript 前端开发", "Java 企业应用",
-            "C++ 系统编程", "Go 并发编程", "Rust 系统级编程",
-            "TypeScript 类型安全", "Swift iOS 开发", "Kotlin Android 开发",
-            "PHP Web 开发", "Ruby 脚本语言", "SQL 数据库查询",
-            "HTML 网页结构", "CSS 样式设计", "Docker 容器化",
-            "Kubernetes 容器编排", "AWS 云服务", "Azure 微软云",
-            "Git 版本控制", "Linux 操作系统"
-        ]
-        
-        console.print(f"📚 总共有 {len(items)} 个技术项目可供搜索")
-        console.print("💡 尝试输入关键词如: 'python', 'web', '云', '开发'")
-        
-        search_term = Prompt.ask("\n🔎 请输入搜索关键词")
-        
-        # 实时过滤
-        filtered_items = [
-            item for item in items 
-            if search_term.lower() in item.lower()
-        ]
-        
-        if filtered_items:
-            console.print(f"\n✅ 找到 {len(filtered_items)} 个匹配结果:")
+        index = self.search_index()
+        console.print(f"📚 总共有 {len(index):,} 个技术项目可供搜索")
+        console.print("💡 尝试输入关键词如: 'python', 'web', '云', '开发'（支持模糊匹配）")
+        
+        if self.input.keyboard:
+            # 终端可逐键读取：边输入边过滤
+            console.print("⌨️  直接输入即可过滤，↑/↓/PgUp/PgDn 选择，Enter 查看详情，Esc 返回")
+            pacer.sleep(1)
+            search_term, hit = self.live_search(index)
+            if hit is not None:
+                self.show_search_detail(hit, search_term)
+            return
+        
+        search_term = self.input.ask(Prompt, "\n🔎 请输入搜索关键词")
+        
+        # 索引检索：前缀 > 词首 > 子串 > 模糊匹配
+        started = time.perf_counter()
+        hits = index.search(search_term, limit=SEARCH_RESULT_LIMIT)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        if hits:
+            more = f"（仅显示前 {SEARCH_RESULT_LIMIT} 条）" if len(hits) == SEARCH_RESULT_LIMIT else ""
+            console.print(f"\n✅ 找到 {len(hits)} 个匹配结果{more}，用时 {elapsed_ms:.1f} ms:")
             
             table = Table(box=box.SIMPLE)
             table.add_column("序号", style="cyan", justify="right")
             table.add_column("项目名称", style="green")
+            table.add_column("匹配", style="dim")
             
-            for i, item in enumerate(filtered_items, 1):
-                # 高亮搜索关键词
-                highlighted = item.replace(search_term, f"[bold yellow]{search_term}[/bold yellow]")
-                table.add_row(str(i), highlighted)
+            for i, hit in enumerate(hits, 1):
+                # 高亮搜索关键词（不区分大小写）
+                table.add_row(str(i), highlight(hit), "≈ 模糊" if hit.fuzzy else "精确")
             
             console.print(table)
             
             # 选择详细查看
-            if len(filtered_items) > 1:
+            if len(hits) > 1:
                 try:
-                    choice = IntPrompt.ask(
-                        "\n📖 请输入序号查看详情 (0 返回)",
-                        choices=[str(i) for i in range(len(filtered_items) + 1)],
+                    choice = self.input.ask(
+                        IntPrompt, "\n📖 请输入序号查看详情 (0 返回)",
+                        choices=[str(i) for i in range(len(hits) + 1)],
                         show_choices=False
                     )
                     
                     if choice > 0:
-                        selected = filtered_items[choice - 1]
-                        console.print(f"\n📋 项目详情: {selected}")
-                        console.print(f"📏 长度: {len(selected)} 字符")
-                        console.print(f"🔤 包含关键词: {search_term}")
+                        self.show_search_detail(hits[choice - 1], search_term)
                         
                 except (ValueError, IndexError):
                     console.print("❌ 无效的选择", style="red")
         else:
             console.print("❌ 没有找到匹配的结果", style="red")
     
+    def live_search(self, index: SearchIndex):
+        """逐键增量搜索，返回 (最终关键词, 选中的结果或 None)"""
+        session = IncrementalSearch(index, limit=LIVE_SEARCH_LIMIT)
+        results = self.search_results_table(session)
+        results.select(0)
+        query, elapsed_ms, stale = "", 0.0, False
+        
+        with KeyReader() as keys, Live(console=console, auto_refresh=False, transient=True) as live:
+            while True:
+                live.update(self.search_view(session, results, query, elapsed_ms, stale), refresh=True)
+                key = keys.read_key()
+                if key in (terminal_input.ESCAPE, terminal_input.CTRL_C):
+                    return query, None
+                if key == terminal_input.ENTER:
+                    return query, session.hits[results.selected] if session.hits else None
+                if key in NAVIGATION_KEYS:
+                    NAVIGATION_KEYS[key](results)
+                    continue
+                if key == terminal_input.BACKSPACE:
+                    query = query[:-1]
+                elif key and len(key) == 1 and key.isprintable():
+                    query += key
+                else:
+                    continue
+                
+                # 有新按键到达时放弃本次扫描，直接处理下一个按键
+                started = time.perf_counter()
+                stale = not session.update(query, should_cancel=keys.pending)
+                if not stale:
+                    elapsed_ms = (time.perf_counter() - started) * 1000
+                    results.select(0)
+    
+    def search_results_table(self, session: IncrementalSearch) -> VirtualTable:
+        """搜索结果的虚拟表格：只为可见窗口内的结果生成行"""
+        def fetch(start: int, stop: int):
+            return [
+                (str(i + 1), highlight(hit), "≈ 模糊" if hit.fuzzy else "精确")
+                for i, hit in enumerate(session.hits[start:stop], start)
+            ]
+        
+        table = VirtualTable(
+            CallbackRows(fetch, length=lambda: len(session.hits)),
+            height=max(console.height - 6, 5),
+            box=box.SIMPLE,
+            expand=True,
+        )
+        table.add_column("序号", style="cyan", justify="right", width=6)
+        table.add_column("项目名称", style="green", ratio=1)
+        table.add_column("匹配", style="dim", width=6)
+        return table
+    
+    def search_view(self, session: IncrementalSearch, results: VirtualTable, query: str,
+                    elapsed_ms: float, stale: bool = False) -> Panel:
+        """输入行、搜索统计和结果窗口"""
+        status = Text()
+        status.append(f"{session.total:,} 个匹配", style="bold")
+        if session.hits:
+            status.append(f" · 排序前 {len(session.hits)} 条", style="dim")
+        status.append(f" · {elapsed_ms:.1f} ms", style="dim")
+        if session.scanned:
+            status.append(f" · 检查 {session.scanned:,} 项", style="dim")
+        if stale:
+            status.append(" · 搜索中…", style="yellow")
+        
+        prompt = Text.assemble(("🔎 ", ""), (query, "bold"), ("▌", "blink"))
+        return Panel(Group(prompt, status, results), title="实时搜索", border_style="cyan")
+    
+    def show_search_detail(self, hit: SearchHit, search_term: str):
+        """显示选中结果的详情"""
+        console.print(f"\n📋 项目详情: {hit.text}")
+        console.print(f"📏 长度: {len(hit.text)} 字符")
+        console.print(f"🔤 包含关键词: {search_term}")
+    
+    def search_index(self) -> SearchIndex:
+        """搜索索引（首次使用时构建，之后复用）"""
+        if self._search_index is None:
+            if self.catalog_path:
+                with console.status(f"📥 正在加载并索引 {self.catalog_path} ..."):
+                    self._search_index = SearchIndex.from_file(self.catalog_path)
+            else:
+                self._search_index = SearchIndex(DEFAULT_CATALOG)
+        return self._search_index
+    
     def step_by_step_wizard(self):
         """分步向导体验"""
         self.clear_screen()
@@ -367,30 +480,30 @@ class InteractiveDemo:
         
         config = {}
         
-        with Progress() as progress:
+        with Progress(console=console) as progress:
             task = progress.add_task("🚀 配置进度", total=len(steps))
             
             # 步骤 1: 欢迎
             progress.update(task, advance=1, description=steps[0])
             console.print("\n🎯 欢迎使用系统配置向导!")
             console.print("📝 我们将引导您完成系统的基本配置")
-            time.sleep(1)
+            pacer.sleep(1)
             
             # 步骤 2: 基本配置
             progress.update(task, advance=1, description=steps[1])
-            config["hostname"] = Prompt.ask("🏷️ 请输入系统主机名", default="myserver")
-            config["timezone"] = Prompt.ask("⏰ 请输入时区", default="Asia/Shanghai")
+            config["hostname"] = self.input.ask(Prompt, "🏷️ 请输入系统主机名", default="myserver")
+            config["timezone"] = self.input.ask(Prompt, "⏰ 请输入时区", default="Asia/Shanghai")
             
             # 步骤 3: 网络设置
             progress.update(task, advance=1, description=steps[2])
-            config["ip_address"] = Prompt.ask("🌐 请输入IP地址", default="192.168.1.100")
-            config["netmask"] = Prompt.ask("🔗 请输入子网掩码", default="255.255.255.0")
+            config["ip_address"] = self.input.ask(Prompt, "🌐 请输入IP地址", default="192.168.1.100")
+            config["netmask"] = self.input.ask(Prompt, "🔗 请输入子网掩码", default="255.255.255.0")
             
             # 步骤 4: 安全选项
             progress.update(task, advance=1, description=steps[3])
-            config["enable_firewall"] = Confirm.ask("🛡️ 是否启用防火墙")
+            config["enable_firewall"] = self.input.ask(Confirm, "🛡️ 是否启用防火墙")
             if config["enable_firewall"]:
-                config["firewall_rules"] = Prompt.ask("📋 请输入防火墙规则", default="default")
+                config["firewall_rules"] = self.input.ask(Prompt, "📋 请输入防火墙规则", default="default")
             
             # 步骤 5: 确认
             progress.update(task, advance=1, description=steps[4])
@@ -405,7 +518,7 @@ class InteractiveDemo:
                 border_style="green"
             ))
             
-            if not Confirm.ask("\n✅ 确认应用这些配置吗？"):
+            if not self.input.ask(Confirm, "\n✅ 确认应用这些配置吗？"):
                 console.print("❌ 配置已取消", style="yellow")
                 return
             
@@ -414,10 +527,10 @@ class InteractiveDemo:
             console.print("\n🎉 配置应用成功!", style="bold green")
             
             # 模拟应用过程
-            with Progress() as apply_progress:
+            with Progress(console=console) as apply_progress:
                 apply_task = apply_progress.add_task("⚙️ 应用配置", total=100)
                 for i in range(10):
-                    time.sleep(0.1)
+                    pacer.sleep(0.1)
                     apply_progress.update(apply_task, advance=10)
     
     def real_time_dashboard(self):
@@ -430,72 +543,37 @@ class InteractiveDemo:
             border_style="red"
         ))
         
-        console.print("🔄 仪表盘正在实时更新中... (Ctrl+C 停止)")
-        
-        try:
-            with Live(refresh_per_second=4) as live:
-                for _ in range(20):  # 显示20次更新
-                    # 生成实时数据
-                    cpu_usage = random.randint(5, 95)
-                    memory_usage = random.randint(20, 90)
-                    disk_io = random.randint(10, 200)
-                    network_traffic = random.randint(1, 100)
-                    
-                    # 创建仪表盘布局
-                    layout = Layout()
-                    layout.split_column(
-                        Layout(name="header", size=3),
-                        Layout(name="main", ratio=2),
-                        Layout(name="footer", size=3)
-                    )
-                    
-                    # 头部信息
-                    header_text = Text("🖥️ 系统实时监控", style="bold blue")
-                    layout["header"].update(Panel(header_text, style="blue"))
-                    
-                    # 主内容 - 指标表格
-                    metrics_table = Table(show_header=False, box=box.SIMPLE)
-                    metrics_table.add_column("指标", style="cyan", ratio=1)
-                    metrics_table.add_column("值", style="green", ratio=1)
-                    metrics_table.add_column("状态", style="yellow", ratio=1)
-                    
-                    metrics_table.add_row(
-                        "CPU 使用率", 
-                        f"{cpu_usage}%",
-                        "⚠️ 警告" if cpu_usage > 80 else "✅ 正常"
-                    )
-                    metrics_table.add_row(
-                        "内存使用", 
-                        f"{memory_usage}%", 
-                        "🔴 危险" if memory_usage > 85 else "🟡 注意" if memory_usage > 70 else "✅ 正常"
-                    )
-                    metrics_table.add_row(
-                        "磁盘 I/O", 
-                        f"{disk_io} MB/s", 
-                        "⚡ 高速" if disk_io > 150 else "📊 正常"
-                    )
-                    metrics_table.add_row(
-                        "网络流量", 
-                        f"{network_traffic} Mbps", 
-                        "🌊 高负载" if network_traffic > 80 else "📡 正常"
-                    )
-                    
-                    layout["main"].update(Panel(metrics_table, title="📈 实时指标"))
-                    
-                    # 底部状态
-                    status = "🟢 系统正常" if cpu_usage < 70 and memory_usage < 75 else "🟡 系统繁忙" if cpu_usage < 85 else "🔴 系统过载"
-                    footer_text = Text(f"📊 当前状态: {status} | ⏰ 更新时间: {time.strftime('%H:%M:%S')}")
-                    layout["footer"].update(Panel(footer_text))
-                    
-                    live.update(layout)
-                    time.sleep(1)
-                    
-        except KeyboardInterrupt:
-            console.print("\n👋 监控已停止", style="yellow")
+        # 状态行、仪表盘和采样进度共用一个 Live，由同一个事件循环驱动
+        updates = 20
+        dashboard = DashboardModel()
+        sampler = MetricsSampler(self.metrics_provider, interval=max(pacer.scale(1), 0.05))
+        progress = Progress(SpinnerColumn(), TextColumn("{task.description}"), BarColumn(),
+                            TextColumn("{task.completed}/{task.total}"), console=console)
+        sampling = progress.add_task("🔄 采样中（q / Esc / Ctrl+C 停止）", total=updates)
+        stage = LiveStage(console, refresh_per_second=8)
+        stage.add(progress, size=1)
+        stage.add(dashboard)
+        
+        async def sample():
+            # 只有新样本才写入历史，避免同一样本被重复计入趋势
+            last_sample = None
+            for _ in range(updates):
+                sample = sampler.latest()
+                if sample is not None and sample is not last_sample:
+                    dashboard.update(sample.values, sample.timestamp)
+                    last_sample = sample
+                progress.advance(sampling)
+                await pacer.asleep(1)
+        
+        with sampler:
+            completed = run_stage(stage, sample())
+        if not completed:
+            console.print("👋 监控已停止", style="yellow")
     
     def run_all_demos(self):
         """运行所有演示"""
-        self.show_welcome()
+        with self.input.screen("欢迎界面"):
+            self.show_welcome()
         
         demos = [
             ("智能菜单系统", self.smart_menu_system),
@@ -535,8 +613,8 @@ class InteractiveDemo:
             console.print(table)
             
             try:
-                choice = IntPrompt.ask(
-                    "\n🎯 请选择要运行的演示",
+                choice = self.input.ask(
+                    IntPrompt, "\n🎯 请选择要运行的演示",
                     choices=[str(i) for i in range(len(demos) + 1)],
                     show_choices=False
                 )
@@ -546,8 +624,10 @@ class InteractiveDemo:
                     break
                 
                 if 1 <= choice <= len(demos):
-                    demos[choice - 1][1]()
-                    console.input("\n↵ 按回车键继续...")
+                    name, demo = demos[choice - 1]
+                    with self.input.screen(name):
+                        demo()
+                    self.input.pause("\n↵ 按回车键继续...")
                 else:
                     console.print("❌ 无效的选择", style="red")
                     
@@ -557,10 +637,59 @@ class InteractiveDemo:
             except Exception as e:
                 console.print(f"❌ 发生错误: {e}", style="red")
 
-def main():
-    """主函数"""
-    demo = InteractiveDemo()
-    demo.run_all_demos()
+    def show_timings(self):
+        """显示各页面的耗时（脚本回放时即纯渲染时间）"""
+        table = Table(title="⏱ 各页面耗时", box=box.SIMPLE)
+        table.add_column("页面", style="cyan")
+        table.add_column("耗时", style="green", justify="right")
+        table.add_column("回答数", style="dim", justify="right")
+        for timing in self.input.timings:
+            table.add_row(timing.name, f"{timing.seconds * 1000:.1f} ms", str(timing.answers))
+        console.print(table)
+
+def parse_arguments(argv: Optional[List[str]] = None):
+    """解析命令行参数（argv 为 None 时使用 sys.argv[1:]）"""
+    import argparse
+    from pacing import add_pacing_arguments
+    parser = argparse.ArgumentParser(description="Rich 库高级交互式演示")
+    parser.add_argument("--catalog", metavar="FILE", help="实时搜索使用的条目文件（每行一个）")
+    parser.add_argument("--metrics", choices=["auto", "proc", "synthetic"], default="auto", help="仪表盘指标来源（默认自动选择 /proc）")
+    parser.add_argument("--script", metavar="FILE", help="从 JSON / YAML 脚本回放所有回答，无人值守运行并统计各页面耗时（默认瞬时模式）")
+    add_pacing_arguments(parser)
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """主函数（launcher.py 也在进程内调用）；--script 给出时从脚本回放所有回答"""
+    from pacing import configure_from_args
+    from input_provider import ScriptExhausted
+    args = parse_arguments(argv)
+    
+    # 脚本回放默认全速运行，除非显式指定了 --fast / --speed
+    configure_from_args(args)
+    if args.script and not args.fast and args.speed is None:
+        pacer.configure(0)
+    
+    try:
+        input_provider = create_input(console, args.script)
+    except (OSError, ValueError) as e:
+        console.print(f"❌ 无法读取脚本 {args.script}: {e}", style="red")
+        return 1
+    try:
+        metrics_provider = create_provider(args.metrics)
+    except ValueError as e:
+        console.print(f"❌ {e}", style="red")
+        return 1
+    demo = InteractiveDemo(metrics_provider, args.catalog, input_provider)
+    try:
+        demo.run_all_demos()
+    except ScriptExhausted as e:
+        console.print(f"\n❌ 脚本回放失败: {e}", style="red")
+        return 1
+    if args.script:
+        demo.show_timings()
+        if demo.input.remaining:
+            console.print(f"⚠️ 脚本还有 {demo.input.remaining} 个回答未使用", style="yellow")
+    return 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    raise SystemExit(main())
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+JSON Stream - incremental JSON parsing into a bounded Rich tree
+JsonEventReader tokenizes a text stream chunk by chunk into parse events
+(start_map, key, value, end_array, ...) without loading the document, and
+build_tree() turns events into a Tree iteratively: containers deeper than
+max_depth are collapsed, containers with more than max_items children end
+in a "... N more" stub, and reading stops once max_nodes nodes exist. Memory
+therefore stays bounded by the limits, not by the size of the input.
+"""
+
+import re
+from json import JSONDecodeError, JSONDecoder
+from json.decoder import scanstring
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+START_MAP, END_MAP = "start_map", "end_map"
+START_ARRAY, END_ARRAY = "start_array", "end_array"
+KEY, VALUE = "key", "value"
+
+Event = Tuple[str, Any]
+
+DEFAULT_MAX_DEPTH = 6
+DEFAULT_MAX_ITEMS = 50
+DEFAULT_MAX_NODES = 2000
+
+CHUNK_SIZE = 1 << 16
+
+# One token per match, after optional whitespace. Groups: 1 open bracket,
+# 2 close bracket, 3 separator, 4 string quote, 5 number (6 fraction,
+# 7 exponent), 8 literal
+_TOKEN = re.compile(
+    r"[ \t\n\r]*(?:([{\[])|([}\]])|([,:])|(\")"
+    r"|(-?(?:0|[1-9]\d*)(\.\d+)?([eE][-+]?\d+)?)|(true|false|null|NaN|-?Infinity))"
+)
+_LITERALS = {"true": True, "false": False, "null": None,
+             "NaN": float("nan"), "Infinity": float("inf"), "-Infinity": float("-inf")}
+_NUMBER, _LITERAL = 5, 8
+
+# Skipped containers up to this size are consumed (and validated) by the C
+# decoder in one call; larger or very deeply nested ones are scanned bracket
+# by bracket
+RAW_SKIP_LIMIT = 1 << 20
+
+# Grammar states of the tokenizer: what may come next
+_VALUE, _KEY, _COLON, _NEXT = range(4)
+_EXPECTING = {
+    _VALUE: "Expecting value",
+    _KEY: "Expecting property name enclosed in double quotes",
+    _COLON: "Expecting ':' delimiter",
+    _NEXT: "Expecting ',' delimiter",
+}
+
+_raw_decode = JSONDecoder().raw_decode
+
+# Skipping only needs brackets and complete strings; a lone quote means the
+# string continues in the next chunk
+_SKIP = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}"]')
+
+
+class JsonEventReader:
+    """Iterates over the parse events of one or more JSON values in a stream
+
+    Concatenated or newline-delimited documents (JSON Lines) are read one
+    after another. ``chars_read`` reports progress through the stream.
+    """
+
+    def __init__(self, stream: TextIO, chunk_size: int = CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.chars_read = 0
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._skip = False
+
+    def skip(self):
+        """Skip the container whose start event was just produced
+
+        Its contents are scanned for brackets only, without decoding values,
+        and no further events (including its end event) are produced for it.
+        """
+        self._skip = True
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping consumed text; False at end of input"""
+        if self._eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        self.chars_read += len(chunk)
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        self._eof = not chunk
+        return bool(chunk)
+
+    def __iter__(self) -> Iterator[Event]:
+        containers: List[str] = []   # "m" for objects, "a" for arrays
+        # What the grammar allows next; ``empty`` lets a container close right after opening
+        state = _VALUE
+        empty = False
+        buffer, pos = self._buffer, self._pos
+        token = _TOKEN.match
+        while True:
+            match = token(buffer, pos)
+            # Refill when nothing matches or a number/literal ends so close to the
+            # end of the buffer that it may continue (e.g. "12." + "5e3")
+            if match is None or (match.lastindex >= _NUMBER and match.end() >= len(buffer) - 2 and not self._eof):
+                self._pos = pos
+                if self._fill():
+                    buffer, pos = self._buffer, self._pos
+                    continue
+                buffer, pos = self._buffer, self._pos
+                match = token(buffer, pos)
+                if match is None:
+                    if buffer[pos:].strip():
+                        raise JSONDecodeError(_EXPECTING[state], buffer, pos)
+                    break
+            kind = match.lastindex
+            if kind == 1:
+                if state != _VALUE:
+                    raise JSONDecodeError(_EXPECTING[state], buffer, match.start(kind))
+                pos = match.end()
+                if buffer[pos - 1] == "{":
+                    containers.append("m")
+                    state = _KEY
+                    yield START_MAP, None
+                else:
+                    containers.append("a")
+                    yield START_ARRAY, None
+                empty = True
+                if self._skip:
+                    self._skip = False
+                    buffer, pos = self._skip_container(buffer, pos - 1)
+                    containers.pop()
+                    state = _NEXT if containers else _VALUE
+                    empty = False
+            elif kind == 2:
+                pos = match.end()
+                char = buffer[pos - 1]
+                if not containers or containers[-1] != ("m" if char == "}" else "a"):
+                    raise JSONDecodeError(f"Unexpected {char!r}", buffer, pos - 1)
+                if state != _NEXT and not (empty and state == (_KEY if char == "}" else _VALUE)):
+                    raise JSONDecodeError(_EXPECTING[state], buffer, pos - 1)
+                containers.pop()
+                state = _NEXT if containers else _VALUE
+                empty = False
+                yield (END_MAP if char == "}" else END_ARRAY), None
+            elif kind == 3:
+                pos = match.end()
+                if buffer[pos - 1] == ",":
+                    if state != _NEXT or not containers:
+                        raise JSONDecodeError(_EXPECTING[state] if containers else "Expecting value", buffer, pos - 1)
+                    state = _KEY if containers[-1] == "m" else _VALUE
+                else:
+                    if state != _COLON:
+                        raise JSONDecodeError(_EXPECTING[state], buffer, pos - 1)
+                    state = _VALUE
+                empty = False
+            elif kind == 4:
+                if state != _VALUE and state != _KEY:
+                    raise JSONDecodeError(_EXPECTING[state], buffer, match.start(4))
+                try:
+                    text, pos = scanstring(buffer, match.end())
+                except JSONDecodeError as e:
+                    # Strings may span chunks: read more and retry from the quote
+                    truncated = e.msg.startswith("Unterminated") or e.pos >= len(buffer) - 6
+                    self._pos = match.start(4)
+                    if truncated and self._fill():
+                        buffer, pos = self._buffer, self._pos
+                        continue
+                    raise
+                empty = False
+                if state == _KEY:
+                    state = _COLON
+                    yield KEY, text
+                else:
+                    state = _NEXT if containers else _VALUE
+                    yield VALUE, text
+            else:
+                if state != _VALUE:
+                    raise JSONDecodeError(_EXPECTING[state], buffer, match.start(kind))
+                pos = match.end()
+                state = _NEXT if containers else _VALUE
+                empty = False
+                if kind == _NUMBER:
+                    number = match.group(_NUMBER)
+                    yield VALUE, float(number) if match.group(6) or match.group(7) else int(number)
+                else:
+                    yield VALUE, _LITERALS[match.group(_LITERAL)]
+            self._buffer, self._pos = buffer, pos
+        self._buffer, self._pos = buffer, pos
+        if containers:
+            raise JSONDecodeError("Unexpected end of input", buffer, pos)
+
+    def _skip_container(self, buffer: str, start: int) -> Tuple[str, int]:
+        """Position just past the container opening at start"""
+        while len(buffer) - start <= RAW_SKIP_LIMIT:
+            try:
+                return buffer, _raw_decode(buffer, start)[1]
+            except RecursionError:
+                # Nested too deeply for the (recursive) C decoder
+                break
+            except JSONDecodeError as e:
+                truncated = e.msg.startswith("Unterminated") or e.pos >= len(buffer) - 16
+                self._pos = start
+                if not truncated or not self._fill():
+                    raise
+                buffer, start = self._buffer, self._pos
+        return self._scan_container(buffer, start + 1)
+
+    def _scan_container(self, buffer: str, pos: int) -> Tuple[str, int]:
+        closers = ["]" if buffer[pos - 1] == "[" else "}"]
+        scan = _SKIP.search
+        while closers:
+            match = scan(buffer, pos)
+            if match is None or match.group() == '"':
+                # Out of data, or a string that continues past the buffer
+                self._pos = len(buffer) if match is None else match.start()
+                if not self._fill():
+                    raise JSONDecodeError("Unexpected end of input", self._buffer, self._pos)
+                buffer, pos = self._buffer, self._pos
+                continue
+            pos = match.end()
+            char = buffer[pos - 1]
+            if match.start() != pos - 1:
+                continue   # a string
+            if char == "[":
+                closers.append("]")
+            elif char == "{":
+                closers.append("}")
+            elif closers.pop() != char:
+                raise JSONDecodeError(f"Unexpected {char!r}", buffer, pos - 1)
+        return buffer, pos
+
+
+def object_events(data: Any) -> Iterator[Event]:
+    """Parse events for an in-memory Python value (iterative, any depth)"""
+    stack: List[Iterator] = [iter([(None, data)])]
+    ends: List[Optional[str]] = [None]
+    while stack:
+        item = next(stack[-1], stack)
+        if item is stack:
+            stack.pop()
+            end = ends.pop()
+            if end is not None:
+                yield end, None
+            continue
+        key, value = item
+        if key is not None:
+            yield KEY, key
+        if isinstance(value, dict):
+            yield START_MAP, None
+            stack.append(iter(value.items()))
+            ends.append(END_MAP)
+        elif isinstance(value, (list, tuple)):
+            yield START_ARRAY, None
+            stack.append(((None, element) for element in value))
+            ends.append(END_ARRAY)
+        else:
+            yield VALUE, value
+
+
+def _skip_events(events: Iterator[Event]):
+    """Consume events up to the end of the container just started"""
+    depth = 1
+    for event, _ in events:
+        if event in (START_MAP, START_ARRAY):
+            depth += 1
+        elif event in (END_MAP, END_ARRAY):
+            depth -= 1
+            if not depth:
+                return
+
+
+def select_path(events: Iterable[Event], path: Sequence[str]) -> Iterator[Event]:
+    """Events of the value at path (object keys / array indices as strings)
+
+    Containers off the path are skipped - with JsonEventReader.skip() when
+    events come from a reader, so they are never decoded.
+    """
+    target = [str(part) for part in path]
+    skip = getattr(events, "skip", None)
+    events = iter(events)
+    if not target:
+        yield from events
+        return
+    trail: List[list] = []   # [kind, current key or index] per open container
+    for event, value in events:
+        if event == KEY:
+            trail[-1][1] = value
+            continue
+        if event in (END_MAP, END_ARRAY):
+            if not trail:
+                return
+            trail.pop()
+            continue
+        if trail and trail[-1][0] == "a":
+            trail[-1][1] += 1
+        depth = len(trail)
+        on_path = depth <= len(target) and all(str(trail[i][1]) == target[i] for i in range(depth))
+        if on_path and depth == len(target):
+            yield event, value
+            if event in (START_MAP, START_ARRAY):
+                nesting = 1
+                while nesting:
+                    event, value = next(events)
+                    yield event, value
+                    if event in (START_MAP, START_ARRAY):
+                        nesting += 1
+                    elif event in (END_MAP, END_ARRAY):
+                        nesting -= 1
+            return
+        if event not in (START_MAP, START_ARRAY):
+            continue
+        if not on_path:
+            if skip is not None:
+                skip()
+            else:
+                _skip_events(events)
+            continue
+        trail.append(["m", None] if event == START_MAP else ["a", -1])
+
+
+def scalar_text(value: Any):
+    """Styled Text for a JSON scalar"""
+    from rich.text import Text
+    if isinstance(value, str):
+        return Text(value, style="green")
+    if value is None or isinstance(value, bool):
+        return Text({None: "null", True: "true", False: "false"}[value], style="cyan")
+    return Text(str(value), style="yellow")
+
+
+class _Frame:
+    __slots__ = ("node", "kind", "count", "hidden")
+
+    def __init__(self, node, kind: Optional[str]):
+        self.node = node
+        self.kind = kind
+        self.count = 0
+        self.hidden = 0
+
+
+def build_tree(events: Iterable[Event], label="JSON", max_depth: int = DEFAULT_MAX_DEPTH,
+               max_items: int = DEFAULT_MAX_ITEMS, max_nodes: int = DEFAULT_MAX_NODES,
+               documents: bool = False):
+    """Build a Rich Tree from parse events, without recursion
+
+    The children of a single top-level container hang directly off the root;
+    with ``documents=True`` each top-level value becomes a numbered child
+    (for JSON Lines). Stops reading once max_nodes nodes have been added.
+    """
+    from rich.text import Text
+    from rich.tree import Tree
+
+    skip_container = getattr(events, "skip", None)
+    root = Tree(label)
+    stack = [_Frame(root, "a" if documents else None)]
+    key = None
+    skip = 0
+    nodes = 0
+    for event, value in events:
+        if skip:
+            if event in (START_MAP, START_ARRAY):
+                skip += 1
+            elif event in (END_MAP, END_ARRAY):
+                skip -= 1
+            continue
+        frame = stack[-1]
+        if event == KEY:
+            key = value
+            continue
+        if event in (END_MAP, END_ARRAY):
+            if frame.hidden:
+                frame.node.add(Text(f"... {frame.hidden} more", style="dim"))
+            elif frame.count == 0 and isinstance(frame.node.label, Text):
+                frame.node.label.append(" {}" if event == END_MAP else " []", style="dim")
+            if len(stack) > 1:
+                stack.pop()
+            continue
+
+        is_container = event in (START_MAP, START_ARRAY)
+        if frame.kind is None and is_container:
+            # The single top-level container is the root itself
+            frame.kind = "m" if event == START_MAP else "a"
+            continue
+
+        index = frame.count
+        frame.count += 1
+        if index >= max_items:
+            frame.hidden += 1
+            if is_container:
+                if skip_container is not None:
+                    skip_container()
+                else:
+                    skip = 1
+            continue
+        if nodes >= max_nodes:
+            for open_frame in stack:
+                open_frame.node.add(Text("... 已达节点上限，其余内容未读取", style="dim"))
+            break
+        nodes += 1
+
+        if frame.kind == "m":
+            name = Text(f"{key}:", style="blue")
+        else:
+            name = Text(f"[{index}]", style="dim")
+        if not is_container:
+            frame.node.add(Text.assemble(name, " ", scalar_text(value)))
+        elif len(stack) > max_depth:
+            frame.node.add(Text.assemble(name, (" {…}" if event == START_MAP else " […]", "dim")))
+            if skip_container is not None:
+                skip_container()
+            else:
+                skip = 1
+        else:
+            stack.append(_Frame(frame.node.add(name), "m" if event == START_MAP else "a"))
+    return root
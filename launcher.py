@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Launcher - one entry point for the show cases and the interactive demo
+Checks (and if needed installs) Rich, then imports the target and calls its
+main(argv) in this process: one interpreter start-up, one round of imports.
+--isolate runs the target in a child interpreter instead, so a crash is
+reported instead of taking the launcher down. Any option the launcher does
+not know is passed through to the target.
+
+    python launcher.py showcase --instant --show 5
+    python launcher.py interactive --script demo_tour.json
+    python launcher.py showcase --isolate --skip-pause
+"""
+
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+import traceback
+from typing import List, NamedTuple, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+class Target(NamedTuple):
+    """A launchable program: a module with main(argv) and its messages"""
+    module: str
+    starting: str
+    finished: str
+
+
+TARGETS = {
+    "showcase": Target("rich_showcase", "🎭 启动展示程序...", "✨ 展示完成！感谢使用 Rich 库展示舞台"),
+    "interactive": Target("interactive_demo", "🎮 启动交互式演示...", "✨ 交互式演示完成！"),
+}
+
+
+def install_requirements() -> bool:
+    """Install required packages"""
+    try:
+        print("📦 正在安装依赖包...")
+        result = subprocess.run([sys.executable, "-m", "pip", "install", "-r", os.path.join(HERE, "requirements.txt")],
+                                capture_output=True, text=True)
+        if result.returncode == 0:
+            print("✅ 依赖安装完成!")
+            return True
+        else:
+            print(f"❌ 依赖安装失败: {result.stderr}")
+            return False
+    except Exception as e:
+        print(f"❌ 安装过程中出错: {e}")
+        return False
+
+
+def ensure_rich() -> bool:
+    """True if Rich is importable, installing requirements.txt when it is not"""
+    try:
+        import rich  # noqa: F401 - the target imports it again from the module cache
+        print("✅ Rich 库已安装")
+        return True
+    except ImportError:
+        print("📦 检测到未安装 Rich 库")
+    if not install_requirements():
+        print("\n💡 请手动运行: pip install -r requirements.txt")
+        return False
+    importlib.invalidate_caches()
+    return True
+
+
+def run_in_process(target: Target, argv: List[str]) -> int:
+    """Import the target and call its main(argv); returns an exit status"""
+    if HERE not in sys.path:
+        sys.path.insert(0, HERE)
+    try:
+        module = importlib.import_module(target.module)
+    except ImportError as e:
+        print(f"❌ 无法导入 {target.module}: {e}")
+        return 1
+    try:
+        return module.main(argv) or 0
+    except KeyboardInterrupt:
+        print("\n👋 用户中断程序")
+        return 130
+    except Exception as e:
+        traceback.print_exc()
+        print(f"❌ 运行失败: {e}（可用 --isolate 在独立进程中运行）")
+        return 1
+
+
+def run_isolated(target: Target, argv: List[str]) -> int:
+    """Run the target in a child interpreter; a crash there only ends the child"""
+    try:
+        status = subprocess.call([sys.executable, os.path.join(HERE, f"{target.module}.py"), *argv])
+    except KeyboardInterrupt:
+        print("\n👋 用户中断程序")
+        return 130
+    if status < 0:
+        print(f"❌ 子进程被信号 {-status} 终止")
+    elif status:
+        print(f"❌ 子进程退出码 {status}")
+    return status
+
+
+def main(argv: Optional[List[str]] = None, target: Optional[str] = None,
+         title: str = "🚀 Rich 库展示舞台启动器") -> int:
+    """Parse launcher options, check dependencies and run the target; returns an exit status
+
+    With ``target`` fixed (the run_*.py wrappers) there is no target argument.
+    """
+    parser = argparse.ArgumentParser(
+        description="Rich 库展示舞台启动器",
+        epilog="其余参数原样传给目标程序，例如 --instant、--show 5、--script FILE（python rich_showcase.py --help 查看全部）",
+    )
+    if target is None:
+        parser.add_argument("target", choices=sorted(TARGETS), help="要运行的程序")
+    parser.add_argument("--check-only", action="store_true", help="仅检查依赖，不运行")
+    parser.add_argument("--isolate", action="store_true", help="在独立子进程中运行（崩溃不影响启动器，但多一次解释器启动）")
+    args, passthrough = parser.parse_known_args(argv)
+    chosen = TARGETS[target or args.target]
+
+    print(title)
+    print("-" * 50)
+    if not ensure_rich():
+        return 1
+    if args.check_only:
+        return 0
+
+    print(f"\n{chosen.starting}")
+    status = (run_isolated if args.isolate else run_in_process)(chosen, passthrough)
+    if status == 0:
+        print(f"\n{chosen.finished}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
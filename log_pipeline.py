@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Log Pipeline - logging through RichHandler without blocking the application
+Application threads log into a QueueLogHandler, which only appends the
+record to an in-memory queue (formatting happens later, on the listener).
+One listener thread takes the queued records in batches every
+``flush_interval`` seconds and renders each batch with a single write.
+When producers outrun the terminal, the overflow policy decides what gives:
+
+    block   producers wait for room (lossless, but they can stall)
+    drop    records arriving at a full queue are dropped
+    sample  above the high-water mark only 1 in ``sample_every`` records
+            below ``keep_level`` is kept; at a full queue records are dropped
+
+Dropped and sampled records are counted per level, and the listener logs a
+warning summarising them at most once per ``report_interval``.
+
+RichHandler lays every record out as a table, which costs about a
+millisecond; ``fast=True`` renders the same columns (time, level, message)
+with the console theme's styles as pre-styled lines instead, fast enough
+for tens of thousands of lines per second.
+
+    handler = RichHandler(console=console)
+    with LogPipeline(handler, policy="sample", fast=True) as pipeline:
+        pipeline.attach(logging.getLogger())
+        ...
+"""
+
+import logging
+import logging.handlers
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from typing import Callable, Deque, Dict, List, Optional
+
+from rich.console import COLOR_SYSTEMS, Console
+
+DEFAULT_CAPACITY = 50_000
+DEFAULT_MAX_BATCH = 5_000
+DEFAULT_FLUSH_INTERVAL = 0.05
+DEFAULT_SAMPLE_EVERY = 10
+DEFAULT_HIGH_WATER = 0.5
+DEFAULT_REPORT_INTERVAL = 1.0
+
+POLICIES = ("block", "drop", "sample")
+
+# How long a producer sleeps between checks while the "block" policy holds it
+BLOCK_WAIT = 0.001
+
+# Control characters removed from messages on the fast path (tab and newline are kept)
+_CONTROL_CODES = {code: None for code in (*range(0, 9), *range(11, 32), 127)}
+
+
+class LineRenderer:
+    """RichHandler's columns as pre-styled text, one line per record
+
+    Time and level use the console theme's ``log.time`` and
+    ``logging.level.*`` styles, rendered once per second / level and
+    reused. Messages are written as-is (no highlighting, markup or
+    wrapping; control codes removed), continuation lines indented under
+    the message column.
+    """
+
+    def __init__(self, console: Console, format: Callable[[logging.LogRecord], str] = logging.LogRecord.getMessage,
+                 show_time: bool = True, show_level: bool = True, time_format: str = "[%x %X]",
+                 omit_repeated_times: bool = True):
+        self.console = console
+        self.format = format
+        self.show_time = show_time
+        self.show_level = show_level
+        self.time_format = time_format
+        self.omit_repeated_times = omit_repeated_times
+        self._color_system = COLOR_SYSTEMS.get(console.color_system)
+        self._times: Dict[int, str] = {}
+        self._levels: Dict[str, str] = {}
+        self._last_time: Optional[int] = None
+        self._time_width = 0
+
+    def _styled(self, text: str, style: str) -> str:
+        return self.console.get_style(style, default="").render(text, color_system=self._color_system)
+
+    def _time(self, created: float) -> str:
+        second = int(created)
+        if self.omit_repeated_times and second == self._last_time:
+            return " " * self._time_width + " "
+        self._last_time = second
+        text = self._times.get(second)
+        if text is None:
+            if len(self._times) > 64:
+                self._times.clear()
+            plain = time.strftime(self.time_format, time.localtime(second))
+            self._time_width = len(plain)
+            text = self._times[second] = self._styled(plain, "log.time") + " "
+        return text
+
+    def _level(self, levelname: str) -> str:
+        text = self._levels.get(levelname)
+        if text is None:
+            text = self._levels[levelname] = self._styled(levelname.ljust(8), f"logging.level.{levelname.lower()}") + " "
+        return text
+
+    def render(self, records: List[logging.LogRecord]) -> str:
+        """The lines for records, newline-terminated"""
+        lines = []
+        indent = None
+        for record in records:
+            prefix = ""
+            if self.show_time:
+                prefix = self._time(record.created)
+            if self.show_level:
+                prefix += self._level(record.levelname)
+            message = self.format(record).translate(_CONTROL_CODES)
+            if "\n" in message:
+                if indent is None:
+                    indent = "\n" + " " * ((self._time_width + 1 if self.show_time else 0) + (9 if self.show_level else 0))
+                message = message.replace("\n", indent)
+            lines.append(prefix + message)
+        lines.append("")
+        return "\n".join(lines)
+
+
+class QueueLogHandler(logging.handlers.QueueHandler):
+    """Producer side of a LogPipeline: hands records over without formatting them
+
+    Messages are formatted on the listener thread, so arguments should not
+    be mutated after the logging call (as with any deferred handler).
+    """
+
+    def __init__(self, pipeline: "LogPipeline"):
+        super().__init__(pipeline)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        self.queue.offer(record)
+
+
+class LogPipeline:
+    """Moves log records from application threads to one rendering thread
+
+    ``stats`` counts records emitted, batches written, the deepest queue
+    seen, the listener's CPU time, and records dropped / sampled out per
+    level name.
+    """
+
+    def __init__(self, handler: logging.Handler, capacity: int = DEFAULT_CAPACITY, policy: str = "sample",
+                 sample_every: int = DEFAULT_SAMPLE_EVERY, keep_level: int = logging.WARNING,
+                 high_water: float = DEFAULT_HIGH_WATER, max_batch: int = DEFAULT_MAX_BATCH,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL, fast: bool = False,
+                 report_interval: float = DEFAULT_REPORT_INTERVAL):
+        if policy not in POLICIES:
+            raise ValueError(f"未知的溢出策略: {policy}（可选 {', '.join(POLICIES)}）")
+        self.handler = handler
+        self.capacity = capacity
+        self.policy = policy
+        self.sample_every = max(sample_every, 1)
+        self.keep_level = keep_level
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.report_interval = report_interval
+        self.console: Optional[Console] = getattr(handler, "console", None)
+        self.renderer: Optional[LineRenderer] = None
+        if fast:
+            if self.console is None:
+                raise ValueError("fast=True 需要带 console 的处理器（RichHandler）")
+            self.renderer = LineRenderer(self.console, handler.format)
+        self.queue_handler = QueueLogHandler(self)
+        self.stats = {"emitted": 0, "batches": 0, "max_depth": 0, "cpu": 0.0, "dropped": {}, "sampled": {}}
+
+        self._records: Deque[logging.LogRecord] = deque()
+        self._high_water = int(capacity * high_water)
+        self._tick = 0
+        self._count_lock = threading.Lock()
+        self._reported = 0
+        self._loggers: List[logging.Logger] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def lost(self) -> int:
+        """Records dropped or sampled out so far"""
+        with self._count_lock:
+            return sum(self.stats["dropped"].values()) + sum(self.stats["sampled"].values())
+
+    def _count(self, counter: Dict[str, int], record: logging.LogRecord):
+        with self._count_lock:
+            counter[record.levelname] = counter.get(record.levelname, 0) + 1
+
+    def offer(self, record: logging.LogRecord) -> bool:
+        """Queue a record, applying the overflow policy; False if it was not kept"""
+        records = self._records
+        depth = len(records)
+        if depth >= self.capacity:
+            if self.policy != "block":
+                self._count(self.stats["dropped"], record)
+                return False
+            while len(records) >= self.capacity and self._thread is not None:
+                time.sleep(BLOCK_WAIT)
+        elif self.policy == "sample" and depth >= self._high_water and record.levelno < self.keep_level:
+            self._tick += 1
+            if self._tick % self.sample_every:
+                self._count(self.stats["sampled"], record)
+                return False
+        records.append(record)
+        return True
+
+    def attach(self, logger: logging.Logger) -> logging.Logger:
+        """Route logger's records through the pipeline (detached again on stop)"""
+        logger.addHandler(self.queue_handler)
+        self._loggers.append(logger)
+        return logger
+
+    def _take(self) -> List[logging.LogRecord]:
+        records = self._records
+        depth = len(records)
+        if depth > self.stats["max_depth"]:
+            self.stats["max_depth"] = depth
+        return [records.popleft() for _ in range(min(depth, self.max_batch))]
+
+    def _write(self, batch: List[logging.LogRecord]):
+        """One write for a run of plain records on the fast path"""
+        if batch:
+            file = self.console.file
+            file.write(self.renderer.render(batch))
+            file.flush()
+
+    def _emit(self, batch: List[logging.LogRecord]):
+        started = time.thread_time()
+        if self.renderer is not None:
+            plain: List[logging.LogRecord] = []
+            for record in batch:
+                if record.exc_info:
+                    # Tracebacks still get RichHandler's full rendering
+                    self._write(plain)
+                    plain = []
+                    self.handler.handle(record)
+                else:
+                    plain.append(record)
+            self._write(plain)
+        else:
+            # Entering the console buffers its output: the batch goes out in one write
+            with self.console if self.console is not None else nullcontext():
+                for record in batch:
+                    self.handler.handle(record)
+            self.handler.flush()
+        self.stats["emitted"] += len(batch)
+        self.stats["batches"] += 1
+        self.stats["cpu"] += time.thread_time() - started
+
+    def _report(self):
+        """Log how many records were lost since the last report"""
+        lost = self.lost
+        if lost == self._reported:
+            return
+        with self._count_lock:
+            dropped = dict(self.stats["dropped"])
+            sampled = dict(self.stats["sampled"])
+        summary = ", ".join(f"{level} {count:,}" for level, count in sorted({
+            level: dropped.get(level, 0) + sampled.get(level, 0) for level in {*dropped, *sampled}}.items()))
+        record = logging.LogRecord(
+            "log_pipeline", logging.WARNING, __file__, 0,
+            "日志过载：新增丢弃 / 采样跳过 %s 条（累计 %s；队列容量 %s，策略 %s）",
+            (f"{lost - self._reported:,}", summary, f"{self.capacity:,}", self.policy), None,
+        )
+        self._reported = lost
+        self._emit([record])
+
+    def _run(self):
+        next_report = time.monotonic() + self.report_interval
+        while True:
+            stopping = self._stop.is_set()
+            batch = self._take()
+            if batch:
+                self._emit(batch)
+            if time.monotonic() >= next_report:
+                self._report()
+                next_report = time.monotonic() + self.report_interval
+            if len(batch) < self.max_batch:
+                if stopping and not self._records:
+                    break
+                # Let a batch build up; a full batch means we are behind, so go again at once
+                self._stop.wait(self.flush_interval)
+
+    def start(self) -> "LogPipeline":
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="log-pipeline", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Detach from loggers, write everything still queued and stop the listener"""
+        for logger in self._loggers:
+            logger.removeHandler(self.queue_handler)
+        self._loggers.clear()
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+        self._report()
+
+    def __enter__(self) -> "LogPipeline":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
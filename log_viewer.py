@@ -0,0 +1,880 @@
+#!/usr/bin/env python3
+"""
+Log Viewer - tail, page through and filter log files of any size
+LogFile memory-maps the file, so only the pages actually shown are read.
+A background thread builds a sparse line index - the byte offset of every
+INDEX_STRIDE-th line, in an array - a chunk at a time, so a 10 GB log
+opens instantly and the index costs 8 bytes per INDEX_STRIDE lines. Line N
+is found from its checkpoint by at most INDEX_STRIDE - 1 newline searches,
+whatever N is. The same thread polls the file (a stat every
+``poll_interval`` seconds) and follows appends like ``tail -f``, re-mapping
+the grown file; a truncated or rotated file is re-read from the start.
+
+In the same pass each block of INDEX_STRIDE lines is filed under the
+levels it mentions and the minutes its timestamps fall in. FilteredLines
+uses those indexes to read only the blocks that can match a LogFilter
+(level, time range, regex), and narrowing a filter re-checks just the
+lines the previous one kept, so each refinement skips the full rescan.
+
+LogView pages through a LogFile by byte position rather than line number,
+so the end of the file and scrolling work before the index has caught up;
+line numbers appear as soon as the index covers the visible lines. Levels
+are coloured with the console theme's ``logging.level.*`` styles, as
+RichHandler colours them.
+"""
+
+import bisect
+import mmap
+import os
+import re
+import threading
+import time
+from array import array
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple
+
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.filesize import decimal
+from rich.text import Text
+
+import terminal_input
+
+# Lines between two index checkpoints (one index block)
+INDEX_STRIDE = 64
+
+# Bytes indexed per step of the background thread
+INDEX_CHUNK = 8 * 1024 * 1024
+
+# Index blocks a filter examines per step
+SCAN_BLOCKS = 2048
+
+# Seconds per time bucket of the time index
+TIME_BUCKET = 60
+
+# A narrowed filter re-checks the previous result's lines only if it kept at most this share of
+# all lines; re-checking a line costs about as much as scanning a block with the indexes
+NARROW_FRACTION = 1 / 16
+
+DEFAULT_POLL_INTERVAL = 0.25
+
+# Longest line prefix read for display
+MAX_LINE_BYTES = 4096
+
+LEVEL_PATTERN = re.compile(r"\b(DEBUG|INFO|WARN(?:ING)?|ERROR|CRITICAL|FATAL)\b")
+TIME_PATTERN = re.compile(r"^\[?\d{2,4}[-/]\d{2}[-/]\d{2,4}[ T]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?\]?")
+
+# Timestamp fields at the start of a line: (Y-M-D or M/D/Y, hour, minute[, second])
+MINUTE_BYTES = re.compile(rb"^\[?(\d{2,4})[-/](\d{2})[-/](\d{2,4})[ T](\d{2}):(\d{2})", re.MULTILINE)
+LINE_TIME = re.compile(r"^\[?(\d{2,4})[-/](\d{2})[-/](\d{2,4})[ T](\d{2}):(\d{2}):(\d{2})")
+
+# Time range input: [YYYY-MM-DD ]HH:MM[:SS]
+WHEN_PATTERN = re.compile(r"^\s*(?:(\d{4})-(\d{1,2})-(\d{1,2})[ T])?(\d{1,2}):(\d{2})(?::(\d{2}))?\s*$")
+
+# Level words as written in logs, by the logging level they stand for
+LEVEL_NAMES = {
+    "DEBUG": "DEBUG",
+    "INFO": "INFO",
+    "WARN": "WARNING",
+    "WARNING": "WARNING",
+    "ERROR": "ERROR",
+    "CRITICAL": "CRITICAL",
+    "FATAL": "CRITICAL",
+}
+_LEVEL_WORDS = [(word.encode(), level) for word, level in LEVEL_NAMES.items() if word != "WARNING"]
+LEVEL_ORDER = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+# Minimum levels the l key cycles through (None: any line)
+LEVEL_CYCLE = [None, "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+LOG_HELP = ("↑/↓ 滚动  PgUp/PgDn 翻页  Home 开头  End/f 跟随  数字+回车 跳行  "
+            "/ 正则  t 时间范围  l 级别  c 清除过滤  q 退出")
+
+EDIT_PROMPTS = {"line": "跳转到行", "regex": "正则过滤", "time": "时间范围（开始..结束，如 12:00..12:30）"}
+
+# Control characters removed before display (tab is expanded separately)
+_CONTROL_CODES = {code: None for code in (*range(0, 9), *range(10, 32), 127)}
+
+# Prefilter of filters without a regex or level: every line is a candidate
+_LINE_STARTS = re.compile(r"^", re.MULTILINE)
+
+
+def _stride_pattern(lines: int):
+    """Matches exactly ``lines`` newline-terminated lines (compiled patterns are cached by re)"""
+    return re.compile(rb"(?:[^\n]*\n){%d}" % lines)
+
+
+@lru_cache(maxsize=4096)
+def _prefix_minute(prefix: bytes) -> Optional[int]:
+    """Epoch seconds of the minute a line prefix is stamped with, if any"""
+    match = MINUTE_BYTES.match(prefix)
+    return None if match is None else _minute(*match.groups())
+
+
+@lru_cache(maxsize=4096)
+def _minute(first, second, third, hour, minute) -> Optional[int]:
+    """Epoch seconds (local time) of a timestamp's minute, from its str or bytes fields"""
+    try:
+        if len(first) == 4:
+            year, month, day = int(first), int(second), int(third)
+        else:
+            month, day, year = int(first), int(second), int(third)
+            if year < 100:
+                year += 2000
+        return int(time.mktime((year, month, day, int(hour), int(minute), 0, 0, 0, -1)))
+    except (OverflowError, ValueError):
+        return None
+
+
+def line_time(line: str) -> Optional[int]:
+    """Epoch seconds of the timestamp a line starts with, if any"""
+    match = LINE_TIME.match(line)
+    if match is None:
+        return None
+    minute = _minute(*match.groups()[:5])
+    return None if minute is None else minute + int(match.group(6))
+
+
+def parse_time_range(text: str, day: Optional[float] = None) -> Tuple[Optional[float], Optional[float]]:
+    """(since, until) from "START..END", either side optional
+
+    Each side is "YYYY-MM-DD HH:MM[:SS]", or "HH:MM[:SS]" on the date of
+    ``day`` (default today). Both ends are inclusive.
+    """
+    if ".." not in text:
+        raise ValueError("时间范围格式应为 开始..结束，如 12:00..12:30 或 2026-10-17 12:00..")
+    reference = time.localtime(day if day is not None else time.time())
+
+    def parse(value: str, default_second: int) -> Optional[float]:
+        if not value.strip():
+            return None
+        match = WHEN_PATTERN.match(value)
+        if match is None:
+            raise ValueError(f"无法识别的时间: {value.strip()}")
+        year, month, mday, hour, minute, second = match.groups()
+        if year is None:
+            year, month, mday = reference.tm_year, reference.tm_mon, reference.tm_mday
+        return time.mktime((int(year), int(month), int(mday), int(hour), int(minute),
+                            int(second) if second else default_second, 0, 0, -1))
+
+    start, _, end = text.partition("..")
+    return parse(start, 0), parse(end, 59)
+
+
+class LogFile:
+    """A memory-mapped log file with line, level and time indexes built in the background
+
+    ``version`` changes whenever the file or the index does, so a viewer
+    can tell when to redraw; ``generation`` changes when the index starts
+    over. Byte positions handed out are line starts. Block k holds lines
+    k * INDEX_STRIDE onwards, from ``checkpoints[k]`` to ``checkpoints[k + 1]``.
+    """
+
+    def __init__(self, path: str, poll_interval: float = DEFAULT_POLL_INTERVAL, follow: bool = True):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.follow = follow
+        self.version = 0
+        self.generation = 0
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self.size = 0
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._open()
+
+    def _open(self):
+        if self._file is not None:
+            self._file.close()
+        self._file = open(self.path, "rb")
+        self._inode = os.fstat(self._file.fileno()).st_ino
+        self._map, self.size = None, 0
+        self._reset_index()
+        self._remap(os.fstat(self._file.fileno()).st_size)
+
+    def _remap(self, size: int):
+        # The previous map stays valid for readers still holding it and is freed with its last reference
+        self._map = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ) if size else None
+        self.size = size
+        self.version += 1
+
+    def _reset_index(self):
+        self.checkpoints = array("Q", [0])            # byte offset of line k * INDEX_STRIDE
+        self.level_blocks: Dict[str, array] = {}      # level name -> blocks mentioning it
+        self.time_buckets: Dict[int, array] = {}      # bucket start (epoch s) -> blocks with a timestamp in it
+        self._pending = 0                             # newlines seen after the last checkpoint
+        self.indexed = 0                              # bytes indexed so far
+        self.generation += 1
+
+    def refresh(self) -> bool:
+        """Pick up appends, truncation and rotation; True if anything changed"""
+        try:
+            status = os.stat(self.path)
+        except OSError:
+            return False  # Rotated away and not yet recreated: keep showing what we have
+        if status.st_ino != self._inode or status.st_size < self.size:
+            self._open()
+            return True
+        if status.st_size > self.size:
+            self._remap(status.st_size)
+            return True
+        return False
+
+    # Index
+
+    def _index_step(self):
+        """Index the next chunk: one anchored regex match per INDEX_STRIDE lines"""
+        data = self._map
+        start, stop = self.indexed, min(self.size, self.indexed + INDEX_CHUNK)
+        chunk = data[start:stop]
+        checkpoints = self.checkpoints
+        first_block = len(checkpoints) - 1
+        pattern = _stride_pattern(INDEX_STRIDE - self._pending)
+        position = 0
+        while True:
+            match = pattern.match(chunk, position)
+            if match is None:
+                break
+            position = match.end()
+            checkpoints.append(start + position)
+            pattern = _stride_pattern(INDEX_STRIDE)
+        self._pending = chunk.count(b"\n", position) + (self._pending if position == 0 else 0)
+        for block in range(first_block, len(checkpoints) - 1):
+            self._file_block(data, block, checkpoints[block], checkpoints[block + 1])
+        self.indexed = stop
+        self.version += 1
+
+    def _file_block(self, data: mmap.mmap, block: int, start: int, end: int):
+        """Add a finished block to the level and time indexes
+
+        Both are supersets, checked line by line when filtering: a level
+        word anywhere in the block counts (WARN also finds WARNING), and
+        timestamps are read from line prefixes as long as the block's first
+        timestamp, so only a handful of distinct prefixes are parsed.
+        """
+        for level in {level for word, level in _LEVEL_WORDS if data.find(word, start, end) != -1}:
+            blocks = self.level_blocks.get(level)
+            if blocks is None:
+                blocks = self.level_blocks[level] = array("I")
+            blocks.append(block)
+        stamp = MINUTE_BYTES.search(data, start, end)
+        if stamp is None:
+            return
+        width = stamp.end() - stamp.start()
+        for prefix in {line[:width] for line in data[start:end].split(b"\n")}:
+            minute = _prefix_minute(prefix)
+            if minute is None:
+                continue
+            bucket = minute - minute % TIME_BUCKET
+            blocks = self.time_buckets.get(bucket)
+            if blocks is None:
+                blocks = self.time_buckets[bucket] = array("I")
+            if not blocks or blocks[-1] != block:
+                blocks.append(block)
+
+    @property
+    def complete(self) -> bool:
+        """True once every byte currently in the file is indexed"""
+        return self.indexed >= self.size
+
+    @property
+    def progress(self) -> float:
+        return self.indexed / self.size if self.size else 1.0
+
+    @property
+    def line_count(self) -> int:
+        """Lines indexed so far (all lines once complete)"""
+        count = (len(self.checkpoints) - 1) * INDEX_STRIDE + self._pending
+        data = self._map
+        if self.complete and data is not None and data[self.size - 1] != 0x0A:
+            count += 1  # Last line without a newline (yet)
+        return count
+
+    def latest_time(self) -> Optional[int]:
+        """Start of the newest time bucket indexed so far"""
+        return max(tuple(self.time_buckets), default=None)
+
+    def _run(self):
+        while not self._closed.is_set():
+            self.refresh()
+            if self.indexed < self.size:
+                self._index_step()
+                continue
+            if not self.follow:
+                break
+            self._closed.wait(self.poll_interval)
+
+    def start(self) -> "LogFile":
+        """Start indexing (and following) in the background"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="log-index", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self):
+        self._closed.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+        self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "LogFile":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Positions
+
+    def offset_of(self, line: int) -> Optional[int]:
+        """Byte offset of line (0-based), or None if the index has not reached it"""
+        checkpoint, skip = divmod(line, INDEX_STRIDE)
+        checkpoints, data = self.checkpoints, self._map
+        if line < 0 or checkpoint >= len(checkpoints) or data is None:
+            return None
+        position = checkpoints[checkpoint]
+        for _ in range(skip):
+            position = data.find(b"\n", position, self.indexed) + 1
+            if position == 0:
+                return None
+        return position if position < self.size or line == 0 else None
+
+    def line_number(self, position: int) -> Optional[int]:
+        """0-based number of the line starting at position, if indexed"""
+        checkpoints, data = self.checkpoints, self._map
+        if data is None or position > self.indexed:
+            return None
+        checkpoint = bisect.bisect_right(checkpoints, position) - 1
+        return checkpoint * INDEX_STRIDE + data[checkpoints[checkpoint]:position].count(b"\n")
+
+    def forward(self, position: int, lines: int) -> int:
+        """Start of the line ``lines`` below position (stops at the last line)"""
+        data, size = self._map, self.size
+        if data is None:
+            return 0
+        for _ in range(lines):
+            following = data.find(b"\n", position, size) + 1
+            if following == 0 or following >= size:
+                break
+            position = following
+        return position
+
+    def back(self, position: int, lines: int) -> int:
+        """Start of the line ``lines`` above the line containing position"""
+        data = self._map
+        if data is None:
+            return 0
+        position = min(position, self.size)
+        for _ in range(lines):
+            if position <= 0:
+                return 0
+            position = data.rfind(b"\n", 0, position - 1) + 1
+        return position
+
+    def tail(self, lines: int) -> int:
+        """Start of the last ``lines`` lines"""
+        return self.back(self.size, lines)
+
+    def read_lines(self, position: int, count: int) -> List[Tuple[int, str]]:
+        """(offset, text) of up to count lines from position; long lines are cut at MAX_LINE_BYTES"""
+        data, size = self._map, self.size
+        lines = []
+        while data is not None and position < size and len(lines) < count:
+            end = data.find(b"\n", position, size)
+            if end == -1:
+                end = size
+            raw = data[position:min(end, position + MAX_LINE_BYTES)]
+            lines.append((position, raw.decode("utf-8", errors="replace").rstrip("\r")))
+            position = end + 1
+        return lines
+
+    def text(self, start: int, end: int) -> str:
+        """Bytes start..end decoded losslessly (undecodable bytes become surrogates, so lengths round-trip)"""
+        data = self._map
+        return "" if data is None else data[start:end].decode("utf-8", errors="surrogateescape")
+
+    def line(self, position: int) -> str:
+        """The whole line starting at position (as text() decodes it)"""
+        data, size = self._map, self.size
+        if data is None:
+            return ""
+        end = data.find(b"\n", position, size)
+        return self.text(position, size if end == -1 else end).rstrip("\r")
+
+
+class LogFilter(NamedTuple):
+    """Which lines a filtered view shows; None fields do not filter
+
+    Lines without a level word do not pass a level filter, and lines that
+    do not start with a timestamp do not pass a time range.
+    """
+    levels: Optional[FrozenSet[str]] = None
+    since: Optional[float] = None
+    until: Optional[float] = None
+    pattern: Optional[str] = None
+
+    @property
+    def active(self) -> bool:
+        return any(field is not None for field in self)
+
+    @property
+    def min_level(self) -> Optional[str]:
+        return None if self.levels is None else min(self.levels, key=LEVEL_ORDER.index)
+
+    def with_min_level(self, level: Optional[str]) -> "LogFilter":
+        """This filter showing only level and above (None: any level)"""
+        return self._replace(levels=None if level is None else frozenset(LEVEL_ORDER[LEVEL_ORDER.index(level):]))
+
+    def narrows(self, other: "LogFilter") -> bool:
+        """True if every line this filter keeps is also kept by other"""
+        return ((other.levels is None or (self.levels is not None and self.levels <= other.levels))
+                and (other.since is None or (self.since is not None and self.since >= other.since))
+                and (other.until is None or (self.until is not None and self.until <= other.until))
+                and (other.pattern is None or self.pattern == other.pattern))
+
+    def describe(self) -> str:
+        parts = []
+        if self.levels is not None:
+            parts.append(f"≥{self.min_level}")
+        if self.since is not None or self.until is not None:
+            def moment(value: Optional[float]) -> str:
+                return "" if value is None else time.strftime("%m-%d %H:%M:%S", time.localtime(value))
+            parts.append(f"{moment(self.since)}..{moment(self.until)}")
+        if self.pattern is not None:
+            parts.append(f"/{self.pattern}/")
+        return " ".join(parts)
+
+
+def _between(blocks, first: int, stop: int):
+    """The entries of a sorted block list in first..stop-1"""
+    return blocks[bisect.bisect_left(blocks, first):bisect.bisect_left(blocks, stop)]
+
+
+class FilteredLines:
+    """Offsets of the lines of a LogFile that pass a LogFilter, found in the background
+
+    Only blocks the level and time indexes list as candidates are read;
+    within them a prefilter regex (the filter's own pattern, else its level
+    words) jumps from hit to hit and only hit lines are checked in full.
+    Given a small enough result of a filter this one narrows, only the
+    lines that result kept are re-checked. Keeps up with the index as the file grows.
+    """
+
+    def __init__(self, log: LogFile, filter: LogFilter, previous: Optional["FilteredLines"] = None,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL):
+        self.log = log
+        self.filter = filter
+        self.poll_interval = poll_interval
+        self.regex = re.compile(filter.pattern) if filter.pattern is not None else None
+        self._prefilter = _LINE_STARTS
+        self._words: Optional[List[str]] = None
+        if filter.pattern is not None:
+            self._prefilter = re.compile(filter.pattern, re.MULTILINE)
+        elif filter.levels is not None:
+            # str.find per word is an order of magnitude faster than a regex alternation
+            self._words = [word for word, level in LEVEL_NAMES.items() if level in filter.levels and word != "WARNING"]
+        self.matches = array("Q")
+        self.scanned = 0            # blocks examined
+        self.version = 0
+        self._tail: List[int] = []  # matches after the last complete block, recomputed as it fills
+        self._generation = log.generation
+        self._previous = previous if previous is not None and previous._generation == log.generation \
+            and filter.narrows(previous.filter) \
+            and len(previous.matches) <= previous.scanned * INDEX_STRIDE * NARROW_FRACTION else None
+        self.narrowed = self._previous is not None  # built from a previous result instead of rescanning
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def caught_up(self) -> bool:
+        return self.scanned >= len(self.log.checkpoints) - 1 and self.log.complete
+
+    @property
+    def progress(self) -> float:
+        return min(self.scanned / max(len(self.log.checkpoints) - 1, 1), 1.0)
+
+    def __len__(self) -> int:
+        return len(self.matches) + len(self._tail)
+
+    def window(self, start: int, count: int) -> List[int]:
+        """Offsets of matches start..start+count-1"""
+        matches, tail = self.matches, self._tail
+        found = list(matches[start:start + count])
+        if len(found) < count:
+            begin = max(start - len(matches), 0)
+            found += tail[begin:begin + count - len(found)]
+        return found
+
+    def index_of(self, position: int) -> int:
+        """Index of the first match at or after position"""
+        index = bisect.bisect_left(self.matches, position)
+        if index < len(self.matches):
+            return index
+        return index + bisect.bisect_left(self._tail, position)
+
+    def accepts(self, line: str) -> bool:
+        """The full check of one line"""
+        filter = self.filter
+        if filter.levels is not None:
+            match = LEVEL_PATTERN.search(line)
+            if match is None or LEVEL_NAMES[match.group(1)] not in filter.levels:
+                return False
+        if filter.since is not None or filter.until is not None:
+            moment = line_time(line)
+            if moment is None or (filter.since is not None and moment < filter.since) \
+                    or (filter.until is not None and moment > filter.until):
+                return False
+        return self.regex is None or self.regex.search(line) is not None
+
+    def _candidates(self, first: int, stop: int) -> Optional[Set[int]]:
+        """Blocks in first..stop-1 that can hold a match by the level and time indexes (None: all)"""
+        log, filter = self.log, self.filter
+        candidates = None
+        if filter.levels is not None:
+            candidates = set()
+            for level in filter.levels:
+                candidates.update(_between(log.level_blocks.get(level, ()), first, stop))
+        if filter.since is not None or filter.until is not None:
+            in_range = set()
+            for bucket, blocks in tuple(log.time_buckets.items()):
+                if (filter.since is None or bucket + TIME_BUCKET > filter.since) \
+                        and (filter.until is None or bucket <= filter.until):
+                    in_range.update(_between(blocks, first, stop))
+            candidates = in_range if candidates is None else candidates & in_range
+        return candidates
+
+    def _hits(self, text: str) -> Callable[[int], int]:
+        """Finds the next prefilter hit in text at or after a position (-1: none left)"""
+        if self._words is None:
+            search = self._prefilter.search
+
+            def next_hit(position: int) -> int:
+                match = search(text, position)
+                return -1 if match is None else match.start()
+            return next_hit
+
+        upcoming = dict.fromkeys(self._words, 0)  # next occurrence of each word (-1: none left)
+
+        def next_hit(position: int) -> int:
+            best = -1
+            for word, found in upcoming.items():
+                if found != -1 and found < position:
+                    found = upcoming[word] = text.find(word, position)
+                if found != -1 and (best == -1 or found < best):
+                    best = found
+            return best
+        return next_hit
+
+    def _scan(self, start: int, end: int, found):
+        """Append to found the offsets of accepted lines in bytes start..end (whole lines)"""
+        text = self.log.text(start, end)
+        next_hit, accepts = self._hits(text), self.accepts
+        position = counted = 0
+        offset = start
+        while True:
+            hit = next_hit(position)
+            if hit == -1:
+                break
+            line_start = text.rfind("\n", position, hit) + 1 or position
+            if line_start >= len(text):
+                break
+            line_end = text.find("\n", hit)
+            if line_end == -1:
+                line_end = len(text)
+            if accepts(text[line_start:line_end].rstrip("\r")):
+                offset += len(text[counted:line_start].encode("utf-8", errors="surrogateescape"))
+                counted = line_start
+                found.append(offset)
+            position = line_end + 1
+
+    def _scan_blocks(self, stop: int):
+        """Examine blocks scanned..stop-1, reading runs of consecutive candidates at once"""
+        checkpoints = self.log.checkpoints
+        candidates = self._candidates(self.scanned, stop)
+        block = self.scanned
+        while block < stop:
+            if candidates is not None and block not in candidates:
+                block += 1
+                continue
+            run_end = block + 1
+            while run_end < stop and (candidates is None or run_end in candidates):
+                run_end += 1
+            self._scan(checkpoints[block], checkpoints[run_end], self.matches)
+            block = run_end
+        self.scanned = stop
+        self.version += 1
+
+    def _narrow(self, previous: "FilteredLines"):
+        """Start from previous's matches: re-check those lines instead of the blocks they came from"""
+        log, accepts, matches = self.log, self.accepts, self.matches
+        for index, offset in enumerate(previous.matches):
+            if index % 4096 == 0 and self._stopped.is_set():
+                return
+            if accepts(log.line(offset)):
+                matches.append(offset)
+        self.scanned = previous.scanned
+        self.version += 1
+
+    def _run(self):
+        if self._previous is not None:
+            self._narrow(self._previous)
+            self._previous = None
+        tail_version = None
+        while not self._stopped.is_set():
+            log = self.log
+            if log.generation != self._generation:
+                # Truncated or rotated: start over on the new file
+                self._generation, self.matches, self._tail, self.scanned = log.generation, array("Q"), [], 0
+                tail_version = None
+            blocks = len(log.checkpoints) - 1
+            if self.scanned < blocks:
+                self._scan_blocks(min(blocks, self.scanned + SCAN_BLOCKS))
+                continue
+            if log.version != tail_version:
+                tail_version = log.version
+                tail: List[int] = []
+                self._scan(log.checkpoints[-1], log.indexed, tail)
+                self._tail = tail
+                self.version += 1
+            self._stopped.wait(self.poll_interval)
+
+    def start(self) -> "FilteredLines":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="log-filter", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+
+def highlight_line(line: str) -> Text:
+    """A log line with its leading timestamp and its level coloured"""
+    text = Text(line.expandtabs(4).translate(_CONTROL_CODES), no_wrap=True)
+    plain = text.plain
+    match = TIME_PATTERN.match(plain)
+    if match:
+        text.stylize("log.time", 0, match.end())
+    match = LEVEL_PATTERN.search(plain)
+    if match:
+        text.stylize(f"logging.level.{LEVEL_NAMES[match.group(1)].lower()}", match.start(), match.end())
+    return text
+
+
+class LogView:
+    """Pages through a LogFile, or the lines passing a filter, above a one-line status bar
+
+    ``following`` keeps the last lines in view as the file grows.
+    ``height`` fixes the number of lines shown; by default the view fills
+    the available height (pager) or the console height.
+    """
+
+    def __init__(self, log: LogFile, following: bool = True, line_numbers: bool = True,
+                 height: Optional[int] = None, status_bar: bool = True):
+        self.log = log
+        self.following = following
+        self.line_numbers = line_numbers
+        self.status_bar = status_bar
+        self.height = height
+        self.top = 0                # byte offset of the first line shown, unfiltered
+        self.filtered: Optional[FilteredLines] = None
+        self.match_top = 0          # index of the first match shown, filtered
+        self.editing: Optional[str] = None
+        self.typed = ""
+        self.message = ""
+        self._page = height or 10
+        self._drawn = None
+
+    @property
+    def filter(self) -> LogFilter:
+        return self.filtered.filter if self.filtered is not None else LogFilter()
+
+    def set_filter(self, log_filter: LogFilter):
+        """Show only the lines passing log_filter (an inactive filter shows everything)
+
+        An invalid pattern raises re.error and leaves the current filter in place.
+        """
+        previous = self.filtered
+        # Built (and its pattern compiled) before the current filter is touched
+        filtered = FilteredLines(self.log, log_filter, previous) if log_filter.active else None
+        if previous is not None:
+            previous.stop()
+        self.filtered = filtered.start() if filtered is not None else None
+        self.match_top = 0
+
+    def close(self):
+        if self.filtered is not None:
+            self.filtered.stop()
+
+    def _bottom(self) -> int:
+        return self.log.tail(self._page)
+
+    def _last_match_page(self) -> int:
+        return max(len(self.filtered) - self._page, 0)
+
+    def scroll(self, lines: int):
+        if self.filtered is not None:
+            top = self._last_match_page() if self.following else self.match_top
+            self.following = False
+            self.match_top = max(min(top + lines, self._last_match_page()), 0)
+            return
+        top = self._bottom() if self.following else self.top
+        self.following = False
+        if lines < 0:
+            self.top = self.log.back(top, -lines)
+        else:
+            self.top = min(self.log.forward(top, lines), self._bottom())
+
+    def page(self, pages: int):
+        self.scroll(pages * self._page)
+
+    def home(self):
+        self.following = False
+        self.top = self.match_top = 0
+
+    def end(self):
+        self.following = True
+
+    def goto(self, line: int) -> bool:
+        """Show line (1-based), or the first match from it, at the top; False if not indexed yet"""
+        position = self.log.offset_of(max(line, 1) - 1)
+        if position is None:
+            return False
+        self.following = False
+        if self.filtered is not None:
+            self.match_top = min(self.filtered.index_of(position), self._last_match_page())
+        else:
+            self.top = min(position, self._bottom())
+        return True
+
+    def on_key(self, key: str) -> bool:
+        """Pager hook: line jumps, filters and following; other keys go to the pager"""
+        if self.editing is not None:
+            return self._edit(key)
+        if key.isdigit():
+            self.editing, self.typed = "line", key
+        elif key == "/":
+            self.editing, self.typed = "regex", self.filter.pattern or ""
+        elif key == "t":
+            self.editing, self.typed = "time", ""
+        elif key == "l":
+            current = self.filter.min_level
+            following = LEVEL_CYCLE[(LEVEL_CYCLE.index(current) + 1) % len(LEVEL_CYCLE)] if current in LEVEL_CYCLE else None
+            self.set_filter(self.filter.with_min_level(following))
+        elif key == "c":
+            self.set_filter(LogFilter())
+        elif key in ("f", "F"):
+            self.end()
+        else:
+            return False
+        self.message = ""
+        return True
+
+    def _edit(self, key: str) -> bool:
+        """A key typed into the line / regex / time prompt"""
+        if key == terminal_input.ESCAPE:
+            self.editing, self.typed = None, ""
+        elif key == terminal_input.BACKSPACE:
+            self.typed = self.typed[:-1]
+        elif key == terminal_input.ENTER:
+            editing, typed = self.editing, self.typed
+            self.editing, self.typed = None, ""
+            self._apply(editing, typed)
+        elif len(key) == 1 and key.isprintable():
+            if self.editing != "line" or key.isdigit():
+                self.typed += key
+        else:
+            return False  # Navigation keys keep working while typing
+        return True
+
+    def _apply(self, editing: str, typed: str):
+        try:
+            if editing == "line":
+                if typed and not self.goto(int(typed)):
+                    self.message = f"第 {int(typed):,} 行尚未索引到（已索引 {self.log.line_count:,} 行）"
+            elif editing == "regex":
+                self.set_filter(self.filter._replace(pattern=typed or None))
+            else:
+                since, until = parse_time_range(typed, self.log.latest_time()) if typed.strip() else (None, None)
+                self.set_filter(self.filter._replace(since=since, until=until))
+        except re.error as e:
+            self.message = f"正则表达式无效: {e}"
+        except ValueError as e:
+            self.message = str(e)
+
+    def changed(self) -> bool:
+        """Pager tick: True if the file, its index or the filter result changed since the last draw"""
+        return self._state() != self._drawn
+
+    def _state(self):
+        return self.log.version, self.filtered.version if self.filtered is not None else None
+
+    def status(self) -> Text:
+        log = self.log
+        parts = [log.path, decimal(log.size), f"{log.line_count:,} 行"]
+        if not log.complete:
+            parts[-1] += f"（索引中 {log.progress:.0%}）"
+        filtered = self.filtered
+        if filtered is not None:
+            found = f"过滤 {filtered.filter.describe()}: {len(filtered):,} 行"
+            if not filtered.caught_up:
+                found += f"（扫描中 {filtered.progress:.0%}）"
+            elif filtered.narrowed:
+                found += "（在上次结果中筛选）"
+            parts.append(found)
+        parts.append("跟随中" if self.following else "已暂停跟随")
+        if self.editing is not None:
+            parts.append(f"{EDIT_PROMPTS[self.editing]}: {self.typed}▏")
+        elif self.message:
+            parts.append(self.message)
+        return Text(" · ".join(parts), style="reverse", no_wrap=True, overflow="ellipsis")
+
+    def _rows(self) -> List[Tuple[Optional[int], str]]:
+        """(line number, text) of the lines in view"""
+        log, filtered = self.log, self.filtered
+        if filtered is not None:
+            last = self._last_match_page()
+            if self.following or self.match_top > last:
+                self.match_top = last
+            rows = []
+            for offset in filtered.window(self.match_top, self._page):
+                for _, line in log.read_lines(offset, 1):
+                    rows.append((log.line_number(offset) if self.line_numbers else None, line))
+            return rows
+        if self.following or self.top > log.size:
+            self.top = self._bottom()
+        lines = log.read_lines(self.top, self._page)
+        first = log.line_number(self.top) if self.line_numbers and lines else None
+        return [(None if first is None else first + index, line) for index, (_, line) in enumerate(lines)]
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        log = self.log
+        self._drawn = self._state()
+        self._page = max((self.height or options.height or console.height) - (1 if self.status_bar else 0), 1)
+        rows = self._rows()
+        numbered = any(number is not None for number, _ in rows)
+        gutter = len(f"{max(log.line_count, 1):,}") + 1 if numbered else 0
+        width = max(options.max_width - gutter, 1)
+        regex = self.filtered.regex if self.filtered is not None else None
+        for number, line in rows:
+            text = highlight_line(line)
+            if regex is not None:
+                text.highlight_regex(regex, "reverse")
+            text.truncate(width, overflow="ellipsis")
+            if gutter:
+                label = "" if number is None else f"{number + 1:,}"
+                text = Text.assemble((f"{label:>{gutter - 1}} ", "dim"), text, no_wrap=True)
+            text.end = "\n"
+            yield text
+        if not self.status_bar:
+            return
+        for _ in range(self._page - len(rows)):
+            yield Text("~", style="dim", end="\n")
+        status = self.status()
+        status.truncate(options.max_width, overflow="ellipsis", pad=True)
+        yield status
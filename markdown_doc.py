@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Markdown Document - lazily parsed, section-by-section rendering for --doc
+A long document is split on its top-level headings with a cheap line scan.
+Each section is parsed and rendered only when it scrolls into view, and its
+rendered lines are kept per width, so scrolling back is free and a resize
+re-renders just the sections on screen. The scroll position is a (section,
+line) anchor, which stays put when the width - and so every section's
+height - changes.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.segment import Segment
+from rich.text import Text
+
+# Rendered widths kept per section (the current one and the one before a resize)
+WIDTHS_KEPT = 2
+
+_ATX_HEADING = re.compile(r" {0,3}(#{1,6})(?:[ \t]+(.*?))?[ \t#]*$")
+_SETEXT_H1 = re.compile(r" {0,3}=+[ \t]*$")
+_FENCE = re.compile(r" {0,3}(`{3,}|~{3,})")
+_LINK_DEFINITION = re.compile(r" {0,3}\[[^\]]+\]:[ \t]*\S")
+# A link definition's title may sit on the line after its URL
+_LINK_TITLE = re.compile(r"[ \t]+[\"'(]")
+
+
+def _scan(lines: List[str]) -> Tuple[List[Tuple[int, int, str]], List[str]]:
+    """(line index, level, title) of every heading, and the link reference
+    definitions ("[ref]: url"), outside fenced code blocks"""
+    headings = []
+    definitions: List[str] = []
+    fence: Optional[str] = None
+    for index, line in enumerate(lines):
+        match = _FENCE.match(line)
+        if match:
+            marker = match.group(1)
+            if fence is None:
+                fence = marker
+            elif marker[0] == fence[0] and len(marker) >= len(fence) and not line.strip(" `~\n"):
+                fence = None
+            continue
+        if fence is not None:
+            continue
+        if _LINK_DEFINITION.match(line):
+            definitions.append(line.rstrip("\n"))
+            continue
+        if definitions and _LINK_TITLE.match(line) and _LINK_DEFINITION.match(lines[index - 1]):
+            definitions[-1] += "\n" + line.rstrip("\n")
+            continue
+        match = _ATX_HEADING.match(line)
+        if match:
+            headings.append((index, len(match.group(1)), (match.group(2) or "").strip()))
+        elif index and _SETEXT_H1.match(line) and lines[index - 1].strip():
+            headings.append((index - 1, 1, lines[index - 1].strip()))
+    return headings, definitions
+
+
+def split_sections(markdown: str) -> List[Tuple[str, str]]:
+    """(title, text) sections of a document, split on its top-level headings
+
+    The split level is the shallowest heading level used more than once, so
+    a runbook with a single "# Title" over many "## ..." sections is split
+    on the "##" headings (and the title heading). Reference links resolve
+    across sections: every section gets the document's link definitions.
+    """
+    lines = markdown.splitlines(keepends=True)
+    headings, definitions = _scan(lines)
+    # Definitions render as nothing, so they can follow each section's text
+    references = "\n\n" + "\n".join(definitions) + "\n" if definitions else ""
+    levels = [level for _, level, _ in headings]
+    repeated = [level for level in set(levels) if levels.count(level) > 1]
+    split_level = min(repeated) if repeated else min(levels, default=1)
+
+    starts = [(index, title) for index, level, title in headings if level <= split_level]
+    if not starts or starts[0][0] > 0:
+        starts.insert(0, (0, ""))
+    sections = []
+    for (start, title), (stop, _) in zip(starts, starts[1:] + [(len(lines), "")]):
+        text = "".join(lines[start:stop])
+        if text.strip():
+            sections.append((title, text + references))
+    return sections
+
+
+class MarkdownSection:
+    """One section: parsed on first render, rendered lines memoized per width"""
+
+    def __init__(self, title: str, text: str, **markdown_options):
+        self.title = title
+        self.text = text
+        self.markdown_options = markdown_options
+        self._markdown = None
+        self._rendered: Dict[int, List[List[Segment]]] = {}
+
+    def lines(self, console: Console, options: ConsoleOptions) -> List[List[Segment]]:
+        width = options.max_width
+        lines = self._rendered.get(width)
+        if lines is None:
+            if self._markdown is None:
+                from rich.markdown import Markdown
+                self._markdown = Markdown(self.text, **self.markdown_options)
+            lines = console.render_lines(self._markdown, options.update(height=None), pad=False)
+            if len(self._rendered) >= WIDTHS_KEPT:
+                self._rendered.pop(next(iter(self._rendered)))
+            self._rendered[width] = lines
+        return lines
+
+    @property
+    def rendered(self) -> bool:
+        return bool(self._rendered)
+
+
+class MarkdownDocument:
+    """A long Markdown document that renders only the sections in view
+
+    With a height (from ``height`` or the pager's layout) the document is a
+    scrollable window with a one-line position footer; without one it is
+    printed in full, like rich's Markdown.
+    """
+
+    def __init__(self, markdown: str, height: Optional[int] = None, **markdown_options):
+        self.sections = [MarkdownSection(title, text, **markdown_options)
+                         for title, text in split_sections(markdown)]
+        self.height = height
+        self.section = 0
+        self.line = 0
+        self._pending = 0
+        self._to_end = False
+        self._page = height or 10
+
+    # Navigation is recorded here and resolved at render time, when the width is known
+    def scroll(self, lines: int):
+        self._pending += lines
+
+    def page(self, pages: int):
+        self.scroll(pages * self._page)
+
+    def home(self):
+        self.section, self.line, self._pending, self._to_end = 0, 0, 0, False
+
+    def end(self):
+        self._pending, self._to_end = 0, True
+
+    def _section_lines(self, index: int, console: Console, options: ConsoleOptions) -> List[List[Segment]]:
+        lines = self.sections[index].lines(console, options)
+        # Blocks inside a document are separated by one blank line
+        return lines if index == len(self.sections) - 1 else lines + [[]]
+
+    def _move(self, position: Tuple[int, int], lines: int, console: Console,
+              options: ConsoleOptions) -> Tuple[int, int]:
+        """Position moved by lines, rendering only the sections passed over"""
+        section, line = position
+        while lines > 0:
+            count = len(self._section_lines(section, console, options))
+            if line + lines < count or section == len(self.sections) - 1:
+                return section, min(line + lines, count)
+            lines -= count - line
+            section, line = section + 1, 0
+        while lines < 0:
+            if line + lines >= 0 or section == 0:
+                return section, max(line + lines, 0)
+            lines += line
+            section -= 1
+            line = len(self._section_lines(section, console, options))
+        return section, line
+
+    def _window(self, console: Console, options: ConsoleOptions, height: int) -> List[List[Segment]]:
+        window: List[List[Segment]] = []
+        section, line = self.section, self.line
+        while len(window) < height and section < len(self.sections):
+            window.extend(self._section_lines(section, console, options)[line:line + height - len(window)])
+            section, line = section + 1, 0
+        return window
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        new_line = Segment.line()
+        height = self.height or options.height
+        if height is None:
+            for index in range(len(self.sections)):
+                for line in self._section_lines(index, console, options):
+                    yield from line
+                    yield new_line
+            return
+        if not self.sections:
+            return
+
+        self._page = height = max(height - 1, 1)
+        if self._to_end:
+            self.section = len(self.sections) - 1
+            self.line = len(self._section_lines(self.section, console, options))
+            self._pending, self._to_end = -height, False
+        if self._pending:
+            self.section, self.line = self._move((self.section, self.line), self._pending, console, options)
+            self._pending = 0
+        window = self._window(console, options, height)
+        if len(window) < height and (self.section, self.line) != (0, 0):
+            # Scrolled past the end: back up so the last line sits at the bottom
+            self.section, self.line = self._move((self.section, self.line), len(window) - height,
+                                                 console, options)
+            window = self._window(console, options, height)
+
+        for line in window:
+            yield from line
+            yield new_line
+        for _ in range(height - len(window)):
+            yield new_line
+        rendered = sum(section.rendered for section in self.sections)
+        title = self.sections[self.section].title
+        yield Text(f"§ {self.section + 1}/{len(self.sections)}" + (f" · {title}" if title else "")
+                   + f"  (已渲染 {rendered} 节)", style="dim", no_wrap=True, overflow="ellipsis")
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Metrics Providers - real and synthetic system metrics for the live demos
+A provider returns one sample of CPU, memory, disk and network figures; a
+MetricsSampler polls it on a background thread into a lock-free ring so the
+render loop only ever reads the latest published sample.
+"""
+
+import os
+import random
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+# Keys every provider reports:
+#   cpu        CPU usage in percent
+#   memory     memory usage in percent
+#   memory_mb  memory in use, in MB
+#   disk_io    disk read + write throughput in MB/s
+#   network    network receive + transmit throughput in Mbps
+METRIC_KEYS = ("cpu", "memory", "memory_mb", "disk_io", "network")
+
+
+class MetricsProvider:
+    """Source of system metric samples"""
+
+    name = "base"
+
+    def sample(self) -> Dict[str, float]:
+        """Return the current value of every key in METRIC_KEYS"""
+        raise NotImplementedError
+
+
+class ProcMetricsProvider(MetricsProvider):
+    """Linux provider reading /proc/stat, /proc/meminfo, /proc/diskstats and /proc/net/dev
+
+    Rates (CPU, disk, network) are computed from the counter deltas between
+    two consecutive samples; the very first sample reports averages since boot
+    for CPU and zero throughput.
+    """
+
+    name = "proc"
+
+    def __init__(self, proc_root: str = "/proc", sys_root: str = "/sys"):
+        self.proc_root = proc_root
+        self.sys_root = sys_root
+        self._last_time: Optional[float] = None
+        self._last_cpu = (0, 0)
+        self._last_disk = 0
+        self._last_net = 0
+
+    @staticmethod
+    def available(proc_root: str = "/proc") -> bool:
+        return os.path.exists(os.path.join(proc_root, "stat"))
+
+    def _read(self, name: str) -> List[str]:
+        with open(os.path.join(self.proc_root, name)) as f:
+            return f.readlines()
+
+    def _cpu_counters(self):
+        # cpu  user nice system idle iowait irq softirq steal ...
+        fields = [int(x) for x in self._read("stat")[0].split()[1:9]]
+        idle = fields[3] + fields[4]
+        return sum(fields), idle
+
+    def _memory(self):
+        info = {}
+        for line in self._read("meminfo"):
+            key, _, rest = line.partition(":")
+            info[key] = int(rest.split()[0])
+        total = info.get("MemTotal", 0)
+        available = info.get("MemAvailable", info.get("MemFree", 0))
+        used_kb = total - available
+        return (used_kb / total * 100 if total else 0.0), used_kb / 1024
+
+    def _is_whole_disk(self, name: str) -> bool:
+        if name.startswith(("loop", "ram", "zram")):
+            return False
+        block_dir = os.path.join(self.sys_root, "block")
+        if os.path.isdir(block_dir):
+            return os.path.exists(os.path.join(block_dir, name))
+        return True
+
+    def _disk_bytes(self) -> int:
+        sectors = 0
+        for line in self._read("diskstats"):
+            parts = line.split()
+            if len(parts) >= 10 and self._is_whole_disk(parts[2]):
+                # sectors read (index 5) + sectors written (index 9), 512 bytes each
+                sectors += int(parts[5]) + int(parts[9])
+        return sectors * 512
+
+    def _net_bytes(self) -> int:
+        total = 0
+        for line in self._read("net/dev")[2:]:
+            iface, _, rest = line.partition(":")
+            if iface.strip() == "lo":
+                continue
+            fields = rest.split()
+            total += int(fields[0]) + int(fields[8])
+        return total
+
+    def sample(self) -> Dict[str, float]:
+        now = time.monotonic()
+        cpu_total, cpu_idle = self._cpu_counters()
+        memory_pct, memory_mb = self._memory()
+        disk_bytes = self._disk_bytes()
+        net_bytes = self._net_bytes()
+
+        if self._last_time is None:
+            cpu_pct = (1 - cpu_idle / cpu_total) * 100 if cpu_total else 0.0
+            disk_rate = net_rate = 0.0
+        else:
+            elapsed = max(now - self._last_time, 1e-6)
+            total_delta = cpu_total - self._last_cpu[0]
+            idle_delta = cpu_idle - self._last_cpu[1]
+            cpu_pct = (1 - idle_delta / total_delta) * 100 if total_delta > 0 else 0.0
+            disk_rate = (disk_bytes - self._last_disk) / elapsed / 1_000_000
+            net_rate = (net_bytes - self._last_net) * 8 / elapsed / 1_000_000
+
+        self._last_time = now
+        self._last_cpu = (cpu_total, cpu_idle)
+        self._last_disk = disk_bytes
+        self._last_net = net_bytes
+        return {
+            "cpu": cpu_pct,
+            "memory": memory_pct,
+            "memory_mb": memory_mb,
+            "disk_io": disk_rate,
+            "network": net_rate,
+        }
+
+
+class SyntheticMetricsProvider(MetricsProvider):
+    """Deterministic pseudo-random provider (same seed, same sequence)
+
+    Values stay within the ranges the demos used to draw with random.randint.
+    """
+
+    name = "synthetic"
+
+    def __init__(self, seed: int = 0):
+        self._random = random.Random(seed)
+
+    def sample(self) -> Dict[str, float]:
+        rng = self._random
+        return {
+            "cpu": float(rng.randint(5, 95)),
+            "memory": float(rng.randint(20, 90)),
+            "memory_mb": float(rng.randint(512, 2048)),
+            "disk_io": float(rng.randint(10, 200)),
+            "network": float(rng.randint(1, 100)),
+        }
+
+
+PROVIDERS = ("auto", "proc", "synthetic")
+
+
+def create_provider(source: str = "auto") -> MetricsProvider:
+    """Create a provider by name; "auto" uses /proc when it is available
+
+    Raises ValueError for an unknown name, or for "proc" without /proc
+    (every sample would fail and the demos would never get a value).
+    """
+    if source == "auto":
+        source = "proc" if ProcMetricsProvider.available() else "synthetic"
+    if source == "proc":
+        if not ProcMetricsProvider.available():
+            raise ValueError("/proc 不可用，无法使用 proc 指标来源（可改用 --metrics synthetic）")
+        return ProcMetricsProvider()
+    if source == "synthetic":
+        return SyntheticMetricsProvider()
+    raise ValueError(f"未知的指标来源: {source}")
+
+
+class Sample(NamedTuple):
+    """One published sample"""
+    timestamp: float
+    values: Dict[str, float]
+
+
+class SampleRing:
+    """Fixed-size single-producer / single-consumer ring of samples
+
+    The writer fills a slot and only then advances ``written``; readers look
+    at ``written`` first and never take a lock. A slot is only reused after
+    ``capacity`` further writes, so the latest sample is always consistent.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity
+        self._slots: List[Optional[Sample]] = [None] * capacity
+        self.written = 0
+
+    def push(self, sample: Sample):
+        index = self.written
+        self._slots[index % self.capacity] = sample
+        self.written = index + 1  # publish
+
+    def latest(self) -> Optional[Sample]:
+        written = self.written
+        if written == 0:
+            return None
+        return self._slots[(written - 1) % self.capacity]
+
+    def recent(self, count: int) -> List[Sample]:
+        """Up to count most recent samples, oldest first"""
+        written = self.written
+        count = min(count, written, self.capacity - 1)
+        return [self._slots[i % self.capacity] for i in range(written - count, written)]
+
+
+class MetricsSampler:
+    """Polls a provider on a daemon thread and publishes into a SampleRing
+
+        with MetricsSampler(create_provider(), interval=1.0) as sampler:
+            values = sampler.values()
+    """
+
+    def __init__(self, provider: MetricsProvider, interval: float = 1.0, capacity: int = 64):
+        self.provider = provider
+        self.interval = interval
+        self.ring = SampleRing(capacity)
+        self.errors = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample_once(self):
+        try:
+            self.ring.push(Sample(time.time(), self.provider.sample()))
+        except (OSError, ValueError, IndexError):
+            self.errors += 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample_once()
+
+    def start(self) -> "MetricsSampler":
+        # Prime the ring so the first frame already has data
+        self._sample_once()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def latest(self) -> Optional[Sample]:
+        return self.ring.latest()
+
+    def values(self) -> Dict[str, float]:
+        """Latest published values (empty before the first sample)"""
+        sample = self.ring.latest()
+        return sample.values if sample else {}
+
+    def __enter__(self) -> "MetricsSampler":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Showcase Pacing - central clock for every animated show case
+All show cases sleep through the shared ``pacer`` so a single switch
+(--fast / --instant / --speed=N) controls how long a full run takes.
+"""
+
+import time
+
+# Speed multiplier used by --fast
+FAST_SPEED = 10.0
+
+
+class Pacer:
+    """Scaled clock shared by all show cases.
+
+    ``speed`` divides every requested delay: 1.0 is the original pacing,
+    10.0 runs ten times faster and ``0`` (instant) never sleeps at all.
+    """
+
+    def __init__(self, speed: float = 1.0):
+        self.configure(speed)
+
+    def configure(self, speed: float = 1.0):
+        """Set the speed multiplier (0 or a negative value means instant)"""
+        self.speed = max(float(speed), 0.0)
+        self.requested = 0.0  # seconds the show cases asked for
+        self.slept = 0.0      # seconds actually spent sleeping
+
+    @property
+    def instant(self) -> bool:
+        """True when animations are disabled entirely"""
+        return self.speed == 0.0
+
+    @property
+    def animated(self) -> bool:
+        """True when running at (or slower than) the original pace"""
+        return 0.0 < self.speed <= 1.0
+
+    def scale(self, seconds: float) -> float:
+        """Return the wall-clock duration for a nominal delay"""
+        if self.instant:
+            return 0.0
+        return seconds / self.speed
+
+    def sleep(self, seconds: float):
+        """Sleep for a nominal delay, scaled by the current speed"""
+        self.requested += seconds
+        delay = self.scale(seconds)
+        if delay > 0:
+            time.sleep(delay)
+            self.slept += delay
+
+    async def asleep(self, seconds: float):
+        """Awaitable sleep() for coroutine show cases (yields to the event loop even when instant)"""
+        import asyncio
+        self.requested += seconds
+        delay = self.scale(seconds)
+        await asyncio.sleep(delay)
+        self.slept += delay
+
+    def refresh_rate(self, per_second: float) -> float:
+        """Scale a Live/Progress refresh rate so frames keep up with the clock"""
+        if self.instant:
+            return per_second
+        return per_second * max(self.speed, 1.0)
+
+
+# Shared pacer used by rich_showcase.py and interactive_demo.py
+pacer = Pacer()
+
+
+def add_pacing_arguments(parser):
+    """Add --fast / --instant / --speed options to an argparse parser"""
+    def speed(value: str) -> float:
+        # A typo such as "--speed -2" must not silently turn into --instant
+        try:
+            multiplier = float(value)
+        except ValueError:
+            multiplier = float("nan")
+        if not multiplier > 0:
+            parser.error(f"--speed 必须是正数（瞬时模式请用 --instant）: {value}")
+        return multiplier
+
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--fast", action="store_true", help=f"快速模式（动画加速 {FAST_SPEED:g} 倍，且不清屏）")
+    group.add_argument("--instant", action="store_true", help="瞬时模式（跳过所有动画等待）")
+    group.add_argument("--speed", type=speed, metavar="N", help="动画速度倍数（正数；瞬时模式请用 --instant）")
+
+
+def configure_from_args(args) -> Pacer:
+    """Configure the shared pacer from parsed --fast / --instant / --speed"""
+    if getattr(args, "instant", False):
+        pacer.configure(0)
+    elif getattr(args, "speed", None) is not None:
+        pacer.configure(args.speed)
+    elif getattr(args, "fast", False):
+        pacer.configure(FAST_SPEED)
+    else:
+        pacer.configure(1.0)
+    return pacer
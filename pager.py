@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Pager - keyboard scrolling for viewers that render a window of their content
+Any view with scroll(rows), page(pages), home() and end() methods (such as
+VirtualTable, or LineView for any other renderable) can be paged: ↑/↓
+scroll, PgUp/PgDn/Space page, Home/End jump, q or Esc quits. Without a
+terminal the view (or a fallback renderable) is printed once.
+"""
+
+import sys
+from typing import Callable, Dict, Optional
+
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.layout import Layout
+from rich.live import Live
+from rich.segment import Segment
+from rich.text import Text
+
+import terminal_input
+from terminal_input import KeyReader, open_terminal
+
+PAGER_HELP = "↑/↓ 滚动  PgUp/PgDn/空格 翻页  Home/End 首尾  q/Esc 退出"
+
+QUIT_KEYS = {"q", "Q", terminal_input.ESCAPE, terminal_input.CTRL_C}
+
+# Non-printing navigation keys, safe to use alongside text input
+NAVIGATION_KEYS: Dict[str, Callable] = {
+    terminal_input.UP: lambda view: view.scroll(-1),
+    terminal_input.DOWN: lambda view: view.scroll(1),
+    terminal_input.PAGE_UP: lambda view: view.page(-1),
+    terminal_input.PAGE_DOWN: lambda view: view.page(1),
+    terminal_input.HOME: lambda view: view.home(),
+    terminal_input.END: lambda view: view.end(),
+}
+
+KEY_ACTIONS: Dict[str, Callable] = dict(
+    NAVIGATION_KEYS,
+    **{
+        "k": lambda view: view.scroll(-1),
+        "j": lambda view: view.scroll(1),
+        " ": lambda view: view.page(1),
+        "g": lambda view: view.home(),
+        "G": lambda view: view.end(),
+    },
+)
+
+
+class LineView:
+    """Scrollable window over the rendered lines of a renderable
+
+    The renderable is laid out once per width; scrolling only slices the
+    cached lines.
+    """
+
+    def __init__(self, renderable):
+        self.renderable = renderable
+        self.offset = 0
+        self._lines = []
+        self._width: Optional[int] = None
+        self._height = 10
+
+    def _clamp(self):
+        self.offset = max(min(self.offset, len(self._lines) - self._height), 0)
+
+    def scroll(self, lines: int):
+        self.offset += lines
+        self._clamp()
+
+    def page(self, pages: int):
+        self.scroll(pages * self._height)
+
+    def home(self):
+        self.offset = 0
+
+    def end(self):
+        self.offset = len(self._lines)
+        self._clamp()
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        if options.max_width != self._width:
+            self._lines = console.render_lines(self.renderable, options.update(height=None), pad=False)
+            self._width = options.max_width
+        self._height = options.height or console.height
+        self._clamp()
+        new_line = Segment.line()
+        for line in self._lines[self.offset:self.offset + self._height]:
+            yield from line
+            yield new_line
+
+
+def pager_layout(view, help_text: str = PAGER_HELP) -> Layout:
+    """The view above a one-line key help footer"""
+    layout = Layout()
+    layout.split_column(
+        Layout(view, name="body"),
+        Layout(Text(help_text, style="dim"), name="help", size=1),
+    )
+    return layout
+
+
+def run_pager(view, console: Console, help_text: str = PAGER_HELP,
+              on_key: Optional[Callable[[str], bool]] = None, fallback=None,
+              tick: Optional[Callable[[], bool]] = None, tick_interval: float = 0.25):
+    """Page through view until the user quits
+
+    ``on_key`` sees every key but Ctrl+C before the pager does (so a view
+    can take text input); returning True marks the key handled and redraws
+    the view. ``tick`` is called every ``tick_interval`` seconds
+    without a key press; returning True redraws the view (e.g. a file that
+    grew). Without a terminal, ``fallback`` (default: the view) is printed
+    instead and False is returned.
+    """
+    terminal = open_terminal() if console.is_terminal else None
+    if terminal is None:
+        console.print(view if fallback is None else fallback)
+        return False
+
+    try:
+        with KeyReader(terminal) as keys, \
+                Live(pager_layout(view, help_text), console=console, auto_refresh=False, screen=True) as live:
+            live.refresh()
+            while True:
+                key = keys.read_key(tick_interval if tick else None)
+                if key is None:
+                    if tick():
+                        live.refresh()
+                    continue
+                if key == terminal_input.CTRL_C:
+                    break
+                if not (on_key and on_key(key)):
+                    if key in QUIT_KEYS:
+                        break
+                    action = KEY_ACTIONS.get(key)
+                    if action is None:
+                        continue
+                    action(view)
+                live.refresh()
+    finally:
+        if terminal is not sys.stdin:
+            terminal.close()
+    return True
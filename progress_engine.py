@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Progress Engine - progress updates from many workers, drawn at a capped rate
+Workers never touch the Progress display: each holds a TaskReporter that
+adds up increments locally and posts them to a queue at most every
+``flush_interval`` seconds. One hub thread drains the queue, coalesces
+everything that arrived since the last frame into a single update per
+task, and refreshes the display no more than ``refresh_per_second`` times.
+With thousands of tasks at most ``max_visible`` rows are shown, next to an
+overall bar: running tasks take the rows of the longest-finished ones. The
+hub shows the Progress in a Live of its own, so the Progress itself is never
+started and adding tasks (which redraws a started Progress) costs no frame.
+
+Threads can share the hub's default queue; for a process pool pass a
+``multiprocessing.Manager().Queue()`` so reporters can be pickled.
+"""
+
+import hashlib
+import os
+import queue as queue_module
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from rich.live import Live
+from rich.progress import Progress, TaskID
+
+DEFAULT_REFRESH_PER_SECOND = 10.0
+DEFAULT_FLUSH_INTERVAL = 0.05
+DEFAULT_MAX_VISIBLE = 12
+
+CHECKSUM_CHUNK = 256 * 1024
+
+
+class TaskReporter:
+    """A worker's handle on one task; cheap to call on every chunk of work
+
+    Increments are batched locally and posted at most every flush_interval
+    seconds (and on flush() / done()), so the queue carries a few messages
+    per task rather than one per call. Several reporters may share a task.
+    """
+
+    def __init__(self, queue, task_id: TaskID, flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        self.queue = queue
+        self.task_id = task_id
+        self.flush_interval = flush_interval
+        self._pending = 0.0
+        self._posted = 0.0
+
+    def advance(self, amount: float = 1):
+        self._pending += amount
+        now = time.monotonic()
+        if now - self._posted >= self.flush_interval:
+            self._posted = now
+            self.queue.put((self.task_id, self._pending, None))
+            self._pending = 0.0
+
+    def update(self, **fields):
+        """Change total, description or custom fields (posted immediately)"""
+        self.queue.put((self.task_id, self._pending, fields))
+        self._pending = 0.0
+
+    def flush(self):
+        """Post whatever has been batched up (call when this worker stops reporting)"""
+        if self._pending:
+            self.queue.put((self.task_id, self._pending, None))
+            self._pending = 0.0
+
+    def done(self):
+        """Mark the whole task complete, whatever its count says"""
+        self.queue.put((self.task_id, self._pending, {"finished": True}))
+        self._pending = 0.0
+
+
+class ProgressHub:
+    """Applies queued progress messages to a Progress display on one thread
+
+        progress = Progress(..., auto_refresh=False)
+        with ProgressHub(progress, overall="总进度") as hub:
+            task_id = hub.add_task("file.bin", total=size)
+            pool.submit(work, hub.reporter(task_id))
+
+    The hub displays the Progress between start() and stop(); do not start
+    the Progress as well.
+
+    ``stats`` counts messages received, updates applied and frames drawn,
+    and the hub thread's CPU time spent on bookkeeping and on drawing.
+    """
+
+    def __init__(self, progress: Progress, refresh_per_second: float = DEFAULT_REFRESH_PER_SECOND,
+                 max_visible: int = DEFAULT_MAX_VISIBLE, overall: Optional[str] = None, queue=None):
+        self.progress = progress
+        self.interval = 1.0 / refresh_per_second
+        self.max_visible = max_visible
+        self.queue = queue if queue is not None else queue_module.SimpleQueue()
+        self.stats = {"messages": 0, "updates": 0, "frames": 0, "cpu": 0.0, "render_cpu": 0.0}
+        self.overall: Optional[TaskID] = progress.add_task(overall, total=0) if overall else None
+
+        self._totals: Dict[TaskID, float] = {}
+        self._completed: Dict[TaskID, float] = {}
+        self._grand_total = 0.0
+        self._waiting: "OrderedDict[TaskID, None]" = OrderedDict()   # started, no row yet
+        self._shown: "OrderedDict[TaskID, bool]" = OrderedDict()     # has a row -> finished?
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.live = Live(progress, console=progress.console, auto_refresh=False,
+                         transient=progress.live.transient)
+
+    def add_task(self, description: str, total: float, **fields) -> TaskID:
+        """Register a task; it stays hidden until its first progress arrives"""
+        with self._lock:
+            task_id = self.progress.add_task(description, total=total, visible=False, **fields)
+            self._totals[task_id] = total
+            self._completed[task_id] = 0.0
+            self._grand_total += total
+            if self.overall is not None:
+                self.progress.update(self.overall, total=self._grand_total)
+        return task_id
+
+    def reporter(self, task_id: TaskID, flush_interval: float = DEFAULT_FLUSH_INTERVAL) -> TaskReporter:
+        return TaskReporter(self.queue, task_id, flush_interval)
+
+    @property
+    def finished(self) -> bool:
+        with self._lock:
+            return all(self._completed[task_id] >= total for task_id, total in self._totals.items())
+
+    def _drain(self, timeout: float) -> Dict[TaskID, list]:
+        """Messages that arrive within timeout, coalesced to [advance, fields] per task"""
+        pending: Dict[TaskID, list] = {}
+        try:
+            message = self.queue.get(timeout=timeout)
+            while True:
+                # None is stop()'s wake-up call
+                if message is not None:
+                    task_id, advance, fields = message
+                    entry = pending.setdefault(task_id, [0.0, {}])
+                    entry[0] += advance
+                    if fields:
+                        entry[1].update(fields)
+                    self.stats["messages"] += 1
+                message = self.queue.get_nowait()
+        except queue_module.Empty:
+            pass
+        return pending
+
+    def _apply(self, pending: Dict[TaskID, list]):
+        progress = self.progress
+        overall_advance = 0.0
+        with self._lock:
+            for task_id, (advance, fields) in pending.items():
+                finished = fields.pop("finished", False)
+                total = self._totals[task_id]
+                if "total" in fields:
+                    self._totals[task_id] = fields["total"]
+                    self._grand_total += fields["total"] - total
+                    total = fields["total"]
+                completed = self._completed[task_id] + advance
+                if finished:
+                    completed = max(completed, total)
+                overall_advance += completed - self._completed[task_id]
+                self._completed[task_id] = completed
+                progress.update(task_id, completed=completed, **fields)
+                self.stats["updates"] += 1
+
+                if task_id in self._shown:
+                    self._shown[task_id] = completed >= total
+                elif completed < total:
+                    self._waiting[task_id] = None
+                else:
+                    # Finished before it got a row: show it only if a row is free
+                    self._waiting.pop(task_id, None)
+                    if len(self._shown) < self.max_visible:
+                        self._shown[task_id] = True
+                        progress.update(task_id, visible=True)
+
+            # Waiting tasks get free rows, then the rows of the longest-finished tasks
+            while self._waiting:
+                if len(self._shown) >= self.max_visible:
+                    oldest = next((shown for shown, done in self._shown.items() if done), None)
+                    if oldest is None:
+                        break
+                    del self._shown[oldest]
+                    progress.update(oldest, visible=False)
+                task_id, _ = self._waiting.popitem(last=False)
+                self._shown[task_id] = False
+                progress.update(task_id, visible=True)
+
+            if self.overall is not None and overall_advance:
+                progress.update(self.overall, advance=overall_advance, total=self._grand_total)
+
+    def _draw(self):
+        if self.live.is_started:
+            self.live.refresh()
+
+    def _run(self):
+        stats = self.stats
+        next_frame = time.monotonic()
+        while not self._stop.is_set():
+            pending = self._drain(max(next_frame - time.monotonic(), 0.0))
+            started = time.thread_time()
+            if pending:
+                self._apply(pending)
+            if time.monotonic() >= next_frame:
+                drawn = time.thread_time()
+                self._draw()
+                stats["frames"] += 1
+                stats["render_cpu"] += time.thread_time() - drawn
+                next_frame = time.monotonic() + self.interval
+            stats["cpu"] += time.thread_time() - started
+        stats["cpu"] -= stats["render_cpu"]
+
+    def start(self) -> "ProgressHub":
+        if not self.progress.disable:
+            self.live.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="progress-hub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the hub thread, applying whatever is still queued first, and draw the last frame"""
+        self._stop.set()
+        try:
+            if self._thread is not None:
+                # Wake the hub thread instead of waiting out its frame interval
+                self.queue.put(None)
+                self._thread.join()
+                self._thread = None
+            pending = self._drain(0.0)
+            if pending:
+                self._apply(pending)
+        finally:
+            self.live.stop()
+            console = self.progress.console
+            if not self.progress.disable and not console.is_interactive and not console.is_jupyter:
+                # As Progress.stop does: end the last frame's line when the output is not a terminal
+                console.print()
+
+    def __enter__(self) -> "ProgressHub":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def checksum_file(path: str, reporter: TaskReporter, chunk_size: int = CHECKSUM_CHUNK,
+                  delay: float = 0.0) -> str:
+    """sha256 of a file, reporting bytes read; delay (seconds per chunk) paces demos"""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+                reporter.advance(len(chunk))
+                if delay:
+                    time.sleep(delay)
+    finally:
+        reporter.flush()
+    return digest.hexdigest()
+
+
+def source_files(root: str, suffix: str = ".py", limit: Optional[int] = None) -> List[str]:
+    """Files below root with the given suffix (skipping caches and site-packages), sorted"""
+    skipped = {"__pycache__", "site-packages", "dist-packages", ".git"}
+    found = []
+    for directory, subdirs, files in os.walk(root):
+        subdirs[:] = sorted(name for name in subdirs if name not in skipped)
+        found.extend(os.path.join(directory, name) for name in sorted(files) if name.endswith(suffix))
+        if limit is not None and len(found) >= limit:
+            return found[:limit]
+    return found
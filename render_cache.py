@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Render Cache - memoized output for renderables that only depend on the terminal
+Show cases whose output is fixed for a given terminal print through a
+RenderCache. The first print builds the renderable and lays it out as
+usual, keeping the resulting segments under a caller-chosen identity plus
+the console's width, height, color system and character set; printing the
+same identity again (kiosk loops with --repeat, repeated --show runs in one
+process) writes the stored segments without building, measuring or
+wrapping anything. Entries are evicted least recently used once their
+estimated size passes ``max_bytes``.
+
+    render_cache.print(console, "layout_system", build_layout)
+
+Only use it for output that is the same every time it is printed at the
+same size: nothing random, timed or data dependent.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, List, NamedTuple, Optional, Tuple
+
+from rich.console import Console, RenderableType
+from rich.segment import Segment, Segments
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+# Approximate bytes a cached Segment takes beyond its text (the tuple and its references)
+SEGMENT_OVERHEAD = 72
+
+
+class RenderKey(NamedTuple):
+    """Everything cached output depends on"""
+    identity: Hashable
+    width: int
+    height: int  # layouts fill the terminal height
+    color_system: Optional[str]
+    ascii_only: bool
+
+
+def segments_size(segments: List[Segment]) -> int:
+    """Estimated memory held by a list of segments (styles are shared, so not counted)"""
+    return sys.getsizeof(segments) + sum(sys.getsizeof(segment.text) + SEGMENT_OVERHEAD for segment in segments)
+
+
+class RenderCache:
+    """Rendered segments by RenderKey, least recently used evicted past max_bytes (thread-safe)
+
+    ``stats`` counts hits, misses, evictions and renders too large to keep.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "oversized": 0}
+        self._entries: "OrderedDict[RenderKey, Tuple[List[Segment], int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(console: Console, identity: Hashable) -> RenderKey:
+        options = console.options
+        return RenderKey(identity, options.max_width, console.height, console.color_system, options.ascii_only)
+
+    def _evict(self):
+        while self.size > self.max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.size -= size
+            self.stats["evictions"] += 1
+
+    def resize(self, max_bytes: int):
+        """Change the memory cap, evicting as needed"""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def render(self, console: Console, identity: Hashable, build: Callable[[], RenderableType]) -> List[Segment]:
+        """The segments console.print would write for build(), building only on a miss"""
+        key = self.key(console, identity)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry[0]
+            self.stats["misses"] += 1
+        segments = list(console.render(build(), console.options))
+        size = segments_size(segments)
+        with self._lock:
+            if size > self.max_bytes:
+                self.stats["oversized"] += 1
+            elif key not in self._entries:
+                self._entries[key] = (segments, size)
+                self.size += size
+                self._evict()
+        return segments
+
+    def print(self, console: Console, identity: Hashable, build: Callable[[], RenderableType]):
+        """console.print(build()), from the cache when this output was printed before"""
+        console.print(Segments(self.render(console, identity, build)))
+
+
+# Shared by the show cases within one process
+render_cache = RenderCache()
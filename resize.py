@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Resize - debounced terminal resizes and a layout that reflows only what changed
+Dragging a terminal window's edge sends a burst of SIGWINCH signals, dozens
+per second. ResizeWatcher turns a burst into a single event: the signal
+handler only records the time, ``settling`` is True until no signal has
+arrived for ``debounce`` seconds, and poll() then reports the new size once.
+Callers draw nothing while the size is settling. Where there is no SIGWINCH
+(Windows) or the handler cannot be installed (not the main thread), a
+changed console.size counts as a signal instead.
+
+ReflowLayout is a rich Layout that keeps the rendered lines of each region,
+keyed by the region's width, height and renderable. A redraw only renders
+regions that were resized, replaced (update()) or invalidated, so after a
+resize the panels whose size stayed the same (headers, footers) keep their
+lines, and a frame where nothing changed renders nothing.
+
+    layout = ReflowLayout()
+    layout.split_column(Layout(header, name="header", size=3), Layout(name="main"))
+    with ResizeWatcher(console) as resize:
+        ...
+        if resize.poll() is not None:
+            live.refresh()
+"""
+
+import asyncio
+import signal
+import time
+from typing import Dict, List, Optional, Tuple
+
+from rich.console import Console, ConsoleDimensions, ConsoleOptions, RenderableType
+from rich.layout import Layout, LayoutRender, RenderMap
+from rich.segment import Segment
+
+# Seconds without a resize signal before a burst counts as finished
+DEFAULT_DEBOUNCE = 0.15
+
+
+class ResizeWatcher:
+    """Debounced terminal size changes, from SIGWINCH or by polling console.size
+
+    ``stats`` counts the signals received and the resizes reported.
+    """
+
+    def __init__(self, console: Console, debounce: float = DEFAULT_DEBOUNCE):
+        self.console = console
+        self.debounce = debounce
+        self.size = console.size
+        self.stats = {"signals": 0, "resizes": 0}
+        self._seen = self.size
+        self._last_signal: Optional[float] = None
+        self._installed = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._previous_handler = None
+
+    def notify(self, *_):
+        """Record a resize signal (the signal handler; may also be called directly)"""
+        self.stats["signals"] += 1
+        self._last_signal = time.monotonic()
+
+    def _check(self):
+        # Without a signal handler, a size change seen here counts as the signal
+        if not self._installed:
+            size = self.console.size
+            if size != self._seen:
+                self._seen = size
+                self.notify()
+
+    @property
+    def settling(self) -> bool:
+        """True while resize signals are still arriving (skip drawing until it is False)"""
+        self._check()
+        return self._last_signal is not None and time.monotonic() - self._last_signal < self.debounce
+
+    def poll(self) -> Optional[ConsoleDimensions]:
+        """The new terminal size once a burst of resizes has settled, otherwise None"""
+        if self.settling or self._last_signal is None:
+            return None
+        self._last_signal = None
+        size = self._seen = self.console.size
+        if size == self.size:
+            # Dragged back to where it started
+            return None
+        self.size = size
+        self.stats["resizes"] += 1
+        return size
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> "ResizeWatcher":
+        """Install the SIGWINCH handler, through loop.add_signal_handler when a loop is given"""
+        self.size = self._seen = self.console.size
+        if self._installed or not hasattr(signal, "SIGWINCH"):
+            return self
+        try:
+            if loop is not None:
+                loop.add_signal_handler(signal.SIGWINCH, self.notify)
+                self._loop = loop
+            else:
+                self._previous_handler = signal.signal(signal.SIGWINCH, self.notify)
+        except (ValueError, RuntimeError):
+            # Not the main thread: fall back to polling console.size
+            return self
+        self._installed = True
+        return self
+
+    def stop(self):
+        """Restore the previous SIGWINCH handler"""
+        if not self._installed:
+            return
+        if self._loop is not None:
+            self._loop.remove_signal_handler(signal.SIGWINCH)
+            self._loop = None
+        else:
+            signal.signal(signal.SIGWINCH, self._previous_handler or signal.SIG_DFL)
+        self._installed = False
+
+    def __enter__(self) -> "ResizeWatcher":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+class ReflowLayout(Layout):
+    """Layout that re-renders only the regions whose size or renderable changed
+
+    A region's lines are reused while its width, height and renderable
+    (by identity) stay the same, so content changed in place - a Text whose
+    plain was rewritten - must be reported with invalidate(). The cached
+    lines belong to one console; ``stats`` counts regions rendered and reused.
+    """
+
+    def __init__(self, renderable: Optional[RenderableType] = None, **kwargs):
+        super().__init__(renderable, **kwargs)
+        self.stats = {"rendered": 0, "reused": 0}
+        self._lines: Dict[Layout, Tuple[int, int, RenderableType, List[List[Segment]]]] = {}
+
+    def invalidate(self, *names: str):
+        """Render the named regions (and the regions inside them) again; all of them with no names"""
+        with self._lock:
+            if not names:
+                self._lines.clear()
+                return
+            for name in names:
+                pending = [self.get(name)]
+                while pending:
+                    layout = pending.pop()
+                    if layout is not None:
+                        self._lines.pop(layout, None)
+                        pending.extend(layout.children)
+
+    def render(self, console: Console, options: ConsoleOptions) -> RenderMap:
+        render_height = options.height or console.height
+        region_map = self._make_region_map(options.max_width, render_height)
+        render_map: RenderMap = {}
+        kept: Dict[Layout, Tuple[int, int, RenderableType, List[List[Segment]]]] = {}
+        for layout, region in region_map.items():
+            if layout.children:
+                continue
+            renderable = layout.renderable
+            cached = self._lines.get(layout)
+            if cached is not None and cached[:2] == (region.width, region.height) and cached[2] is renderable:
+                lines = cached[3]
+                self.stats["reused"] += 1
+            else:
+                lines = console.render_lines(renderable, options.update_dimensions(region.width, region.height))
+                self.stats["rendered"] += 1
+            kept[layout] = (region.width, region.height, renderable, lines)
+            render_map[layout] = LayoutRender(region, lines)
+        # Regions no longer shown (split or unsplit since) are dropped
+        self._lines = kept
+        return render_map
@@ -5,30 +5,74 @@ A comprehensive demonstration of Python's Rich library features for terminal bea
 """
 
 import time
+
+# Cold-start reference point, taken before any Rich module is imported
+_START_TIME = time.perf_counter()
+
+import importlib
 import json
-from rich.console import Console
-from rich.text import Text
-from rich.panel import Panel
-from rich.table import Table
-from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn, SpinnerColumn, TaskProgressColumn, TransferSpeedColumn, DownloadColumn
-from rich.tree import Tree
-from rich.logging import RichHandler
-from rich.status import Status
-from rich.markdown import Markdown
-from rich.syntax import Syntax
-from rich.layout import Layout
-from rich.columns import Columns
-from rich.live import Live
-from rich import box, inspect
-import time
-import random
 import argparse
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from rich.console import Console
+from pacing import pacer, add_pacing_arguments, configure_from_args
 
 # Initialize console
 console = Console()
 
+# Metrics provider used by the live demos ("auto", "proc" or "synthetic")
+metrics_source = "auto"
+
+# Files the progress show cases checksum under --instant, so a full run stays well under a second
+INSTANT_FILE_LIMIT = 24
+
+
+class ShowCase(NamedTuple):
+    """A registered show case and the modules it needs at run time"""
+    number: str
+    name: str
+    description: str
+    func: Callable[[], None]
+    requires: Tuple[str, ...]
+
+    def load(self):
+        """Import the modules this show case depends on"""
+        for module in self.requires:
+            importlib.import_module(module)
+
+    def run(self):
+        """Import dependencies on demand, then run the show case"""
+        self.load()
+        result = self.func()
+        if result is not None:
+            # Coroutine show cases (async def) run on their own event loop
+            import asyncio
+            asyncio.run(result)
+
+
+# Registry of all show cases, in presentation order
+SHOWCASES: List[ShowCase] = []
+
+
+def showcase(name: str, description: str, requires: Tuple[str, ...] = ()):
+    """Register a show case function; numbers follow registration order"""
+    def register(func):
+        SHOWCASES.append(ShowCase(str(len(SHOWCASES) + 1), name, description, func, tuple(requires)))
+        return func
+    return register
+
+
+def find_showcase(query: str) -> Optional[ShowCase]:
+    """Find a show case by number or (case-insensitive) name fragment"""
+    for case in SHOWCASES:
+        if query == case.number or query.lower() in case.name.lower():
+            return case
+    return None
+
+@showcase("Basic Text Styling", "基础文本样式和颜色", requires=("rich.text",))
 def show_basic_text_styling():
     """Show Case 1: Basic text styling with colors and formatting"""
+    from rich.text import Text
+    
     console.rule("[bold blue]Show Case 1: Basic Text Styling")
     
     # Create text with multiple styles
@@ -53,6 +97,7 @@ def show_basic_text_styling():
     console.print(combined_text)
     console.print()
 
+@showcase("Dynamic Text", "动态文本效果（打字机效果）")
 def show_dynamic_text():
     """Show Case 2: Dynamic text with typewriter effect"""
     console.rule("[bold blue]Show Case 2: Dynamic Text (Typewriter Effect)")
@@ -63,28 +108,23 @@ def show_dynamic_text():
     colors = [f"color({i})" for i in range(20, 231, 10)]
     
     console.print("准备开始打字机效果演示...")
-    time.sleep(1)
+    pacer.sleep(1)
     
     # Typewriter effect with gradient
     for i, char in enumerate(message):
         color_index = min(i, len(colors) - 1)
         console.print(char, style=colors[color_index], end="")
-        time.sleep(0.05)
+        pacer.sleep(0.05)
     
     console.print("\n")
 
+@showcase("Data Table", "数据表格展示", requires=("rich.table", "virtual_table"))
 def show_data_table():
     """Show Case 3: Data statistics table with highlighting"""
-    console.rule("[bold blue]Show Case 3: Data Statistics Table")
-    
-    # Create table
-    table = Table(title="期中考试成绩", box=box.ROUNDED)
+    from rich import box
+    from virtual_table import VirtualTable
     
-    # Add columns
-    table.add_column("姓名", justify="center")
-    table.add_column("数学", justify="right")
-    table.add_column("语文", justify="right")
-    table.add_column("总分", justify="right", style="bold")
+    console.rule("[bold blue]Show Case 3: Data Statistics Table")
     
     # Add data
     data = [
@@ -96,98 +136,152 @@ def show_data_table():
     # Find highest total score
     max_total = max(row[3] for row in data)
     
-    for row in data:
-        name, math, chinese, total = row
-        style = "green" if total == max_total else None
-        table.add_row(name, str(math), str(chinese), str(total), style=style)
+    # Rows are fetched per visible window, so the same table pages through large exports
+    table = VirtualTable(
+        data,
+        row_style=lambda index, row: "green" if row[3] == max_total else None,
+        title="期中考试成绩",
+        box=box.ROUNDED,
+    )
+    
+    # Add columns
+    table.add_column("姓名", justify="center")
+    table.add_column("数学", justify="right")
+    table.add_column("语文", justify="right")
+    table.add_column("总分", justify="right", style="bold")
     
     console.print(table)
     console.print()
 
+@showcase("Nested Tables", "嵌套表格", requires=("rich.table", "render_cache"))
 def show_nested_tables():
     """Show Case 4: Nested tables for complex data"""
-    console.rule("[bold blue]Show Case 4: Nested Tables")
-    
-    # Main table
-    main_table = Table(title="班级信息表")
-    main_table.add_column("班级", justify="center")
-    main_table.add_column("人数", justify="right")
-    main_table.add_column("学科成绩", justify="center")
+    from rich.table import Table
+    from render_cache import render_cache
     
-    # Create nested tables for each class
-    class_data = [
-        ("高一(1)班", 45, [("数学", 85), ("语文", 88), ("英语", 92)]),
-        ("高一(2)班", 42, [("数学", 78), ("语文", 85), ("英语", 89)])
-    ]
+    console.rule("[bold blue]Show Case 4: Nested Tables")
     
-    for class_name, student_count, subjects in class_data:
-        # Create nested table
-        nested_table = Table(box=None)
-        nested_table.add_column("科目", justify="left")
-        nested_table.add_column("分数", justify="right")
+    def build():
+        # Main table
+        main_table = Table(title="班级信息表")
+        main_table.add_column("班级", justify="center")
+        main_table.add_column("人数", justify="right")
+        main_table.add_column("学科成绩", justify="center")
         
-        for subject, score in subjects:
-            nested_table.add_row(subject, str(score))
+        # Create nested tables for each class
+        class_data = [
+            ("高一(1)班", 45, [("数学", 85), ("语文", 88), ("英语", 92)]),
+            ("高一(2)班", 42, [("数学", 78), ("语文", 85), ("英语", 89)])
+        ]
         
-        main_table.add_row(class_name, str(student_count), nested_table)
+        for class_name, student_count, subjects in class_data:
+            # Create nested table
+            nested_table = Table(box=None)
+            nested_table.add_column("科目", justify="left")
+            nested_table.add_column("分数", justify="right")
+            
+            for subject, score in subjects:
+                nested_table.add_row(subject, str(score))
+            
+            main_table.add_row(class_name, str(student_count), nested_table)
+        return main_table
     
-    console.print(main_table)
+    # Static output: laid out once per terminal size, then replayed from the render cache
+    render_cache.print(console, "nested_tables", build)
     console.print()
 
+@showcase("Single Progress Bar", "单任务进度条", requires=("rich.progress", "progress_engine", "transfer"))
 def show_single_progress_bar():
     """Show Case 5: Single task progress bar with details"""
-    console.rule("[bold blue]Show Case 5: Single Task Progress Bar")
+    import os
+    import sys
+    import sysconfig
+    from rich.progress import Progress, BarColumn, DownloadColumn, TextColumn, TimeRemainingColumn, TransferSpeedColumn
+    from progress_engine import ProgressHub
+    from transfer import transfer_file
     
-    total_size = 100  # MB
+    console.rule("[bold blue]Show Case 5: Single Task Progress Bar")
     
-    with Progress(
+    # Real transfer: hash the Python interpreter (or its shared library, whichever is
+    # larger) in 64 KiB chunks, paced to about 2 seconds; with --instant just os.py
+    if pacer.instant:
+        source = os.__file__
+    else:
+        candidates = [os.path.realpath(sys.executable),
+                      os.path.join(sysconfig.get_config_var("LIBDIR") or "", sysconfig.get_config_var("LDLIBRARY") or "")]
+        source = max((path for path in candidates if os.path.isfile(path)), key=os.path.getsize)
+    total_size = os.path.getsize(source)
+    chunk_size = 64 * 1024
+    
+    progress = Progress(
         TextColumn("[progress.description]{task.description}"),
         BarColumn(bar_width=40),
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TextColumn("{task.completed}MB/{task.total}MB"),
+        DownloadColumn(),
+        TransferSpeedColumn(),
         TimeRemainingColumn(),
-    ) as progress:
-        
-        task = progress.add_task("[cyan]下载文件中...", total=total_size)
-        
-        while not progress.finished:
-            progress.update(task, advance=5)  # Simulate download progress
-            time.sleep(0.1)
+        console=console,
+        auto_refresh=False,
+    )
+    # The hub displays the progress and draws it on its own frame clock
+    with ProgressHub(progress, refresh_per_second=pacer.refresh_rate(10)) as hub:
+        task = hub.add_task(f"[cyan]读取 {os.path.basename(source)}...", total=total_size)
+        result = transfer_file(source, hub.reporter(task), chunk_size=chunk_size,
+                               delay=pacer.scale(2.0 / max(total_size // chunk_size, 1)))
     
-    console.print("[green]下载完成！")
+    console.print(f"[green]完成！sha256 {result.digest[:16]}…")
     console.print()
 
+@showcase("Multi Progress Bars", "多任务并行进度条", requires=("rich.progress", "progress_engine"))
 def show_multi_progress_bars():
     """Show Case 6: Multi-task parallel progress bars"""
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+    from rich.progress import Progress, BarColumn, DownloadColumn, TextColumn
+    from progress_engine import ProgressHub, checksum_file, source_files
+    
     console.rule("[bold blue]Show Case 6: Multi-Task Progress Bars")
     
+    # Real work: checksum three standard library packages on a thread pool
+    stdlib = os.path.dirname(os.__file__)
     tasks = [
-        ("处理文件A", 100, "red"),
-        ("处理文件B", 150, "green"),
-        ("处理文件C", 200, "blue")
+        ("校验 json", "json", "red"),
+        ("校验 email", "email", "green"),
+        ("校验 asyncio", "asyncio", "blue")
     ]
     
-    with Progress(
+    progress = Progress(
         TextColumn("[progress.description]{task.description}"),
         BarColumn(bar_width=30),
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-    ) as progress:
-        
-        progress_tasks = []
-        for desc, total, color in tasks:
-            task = progress.add_task(f"[{color}]{desc}", total=total)
-            progress_tasks.append(task)
+        DownloadColumn(),
+        console=console,
+        auto_refresh=False,
+    )
+    futures = {}
+    with ProgressHub(progress, refresh_per_second=pacer.refresh_rate(10), max_visible=len(tasks)) as hub, \
+            ThreadPoolExecutor(max_workers=4) as pool:
         
-        while not progress.finished:
-            for task in progress_tasks:
-                progress.update(task, advance=2)  # Simulate progress
-            time.sleep(0.05)
-    
-    console.print("[bold]所有任务完成！")
+        for desc, package, color in tasks:
+            files = source_files(os.path.join(stdlib, package), limit=INSTANT_FILE_LIMIT if pacer.instant else None)
+            task_id = hub.add_task(f"[{color}]{desc}", total=sum(os.path.getsize(path) for path in files))
+            for path in files:
+                # Workers only post to the hub's queue; it coalesces and redraws at a capped rate
+                future = pool.submit(checksum_file, path, hub.reporter(task_id), chunk_size=4096,
+                                     delay=pacer.scale(0.01))
+                futures[future] = path
+    
+    errors = [(path, future.exception()) for future, path in futures.items() if future.exception() is not None]
+    for path, error in errors:
+        console.print(f"[red]❌ {os.path.relpath(path, stdlib)}: {error}[/red]")
+    console.print("[bold]所有任务完成！" if not errors else f"[bold]完成, {len(errors)} 个文件失败")
     console.print()
 
+@showcase("File Tree", "文件目录树", requires=("rich.tree",))
 def show_file_tree():
     """Show Case 7: File directory tree with icons"""
+    from rich.tree import Tree
+    
     console.rule("[bold blue]Show Case 7: File Directory Tree")
     
     tree = Tree("📁 my_project/", guide_style="bold bright_blue")
@@ -205,11 +299,14 @@ def show_file_tree():
     tree.add("📄 .gitignore")
     
     console.print(tree)
-    console.print("[italic]提示: 在实际终端中可以使用方向键展开/折叠节点")
+    console.print("[italic]提示: 使用 --tree PATH 浏览真实目录（并发扫描、按深度懒加载、遵循 .gitignore）")
     console.print()
 
+@showcase("JSON Tree", "JSON数据树", requires=("rich.tree", "rich.text", "json_stream"))
 def show_json_tree():
     """Show Case 8: JSON data tree visualization"""
+    from json_stream import build_tree, object_events
+    
     console.rule("[bold blue]Show Case 8: JSON Data Tree")
     
     user_data = {
@@ -224,68 +321,70 @@ def show_json_tree():
         "active": True
     }
     
-    def build_tree_from_dict(data, parent_tree):
-        if isinstance(data, dict):
-            for key, value in data.items():
-                key_text = Text(f"{key}:", style="blue")
-                if isinstance(value, (dict, list)):
-                    branch = parent_tree.add(key_text)
-                    build_tree_from_dict(value, branch)
-                else:
-                    value_style = "green" if isinstance(value, str) else "yellow" if isinstance(value, (int, float)) else "cyan"
-                    value_text = Text(str(value), style=value_style)
-                    parent_tree.add(Text.assemble(key_text, " ", value_text))
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                item_style = "green" if isinstance(item, str) else "yellow" if isinstance(item, (int, float)) else "cyan"
-                item_text = Text(str(item), style=item_style)
-                parent_tree.add(item_text)
-    
-    tree = Tree("📋 User Data")
-    build_tree_from_dict(user_data, tree)
+    # Built from parse events without recursion; list items keep their indices
+    tree = build_tree(object_events(user_data), "📋 User Data")
     
     console.print(tree)
     console.print()
 
+@showcase("Graded Logging", "分级日志", requires=("rich.logging", "log_pipeline"))
 def show_graded_logging():
-    """Show Case 9: Graded logging with timestamps"""
-    console.rule("[bold blue]Show Case 9: Graded Logging")
-    
-    from datetime import datetime
+    """Show Case 9: Graded logging through RichHandler behind a non-blocking queue"""
+    import logging
+    from rich.logging import RichHandler
+    from log_pipeline import LogPipeline
     
-    current_time = datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
-    
-    # Simulate different log levels
-    console.print(f"{current_time} [gray]DEBUG: 初始化配置文件")
-    console.print(f"{current_time} [blue]INFO: 服务启动成功")
-    console.print(f"{current_time} [yellow]WARNING: 内存使用率超过 80%")
-    console.print(f"{current_time} [bold red]ERROR: 连接数据库失败")
+    console.rule("[bold blue]Show Case 9: Graded Logging")
     
+    # Real log records, each with its own timestamp, rendered by RichHandler on the pipeline's thread
+    # (throughput under a 50k lines/s burst: python -m benchmarks.bench_logging)
+    logger = logging.getLogger("showcase.graded")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    with LogPipeline(RichHandler(console=console, show_path=False), flush_interval=0.02) as pipeline:
+        pipeline.attach(logger)
+        logger.debug("初始化配置文件")
+        pacer.sleep(0.5)
+        logger.info("服务启动成功")
+        pacer.sleep(0.5)
+        logger.warning("内存使用率超过 80%")
+        pacer.sleep(0.5)
+        logger.error("连接数据库失败")
     console.print()
 
-def show_real_time_status():
+@showcase("Real-time Status", "实时状态更新", requires=("rich.live", "async_runtime"))
+async def show_real_time_status():
     """Show Case 10: Real-time status updates"""
+    from async_runtime import LiveStage
+    
     console.rule("[bold blue]Show Case 10: Real-Time Status Updates")
     
     total_items = 100
     spinner_chars = ["↻", "→", "↺", "←"]
     
-    with Live(console=console, refresh_per_second=10) as live:
-        for i in range(total_items + 1):
-            if i == total_items:
-                live.update("[green]同步完成！耗时 5.2s")
-                break
-            
+    # One refresh task on the event loop; q / Esc / Ctrl+C stop the sync immediately
+    stage = LiveStage(console, refresh_per_second=10, animate=False)
+    status = stage.add("")
+    
+    async def sync_items():
+        started = time.perf_counter()
+        for i in range(total_items):
             spinner = spinner_chars[i % len(spinner_chars)]
             percentage = (i / total_items) * 100
-            status_text = f"{spinner} 同步中... {percentage:.1f}%（已同步 {i}/{total_items} 条）"
-            live.update(status_text)
-            time.sleep(0.02)
+            stage.update(status, f"{spinner} 同步中... {percentage:.1f}%（已同步 {i}/{total_items} 条）")
+            await pacer.asleep(0.02)
+        stage.update(status, f"[green]同步完成！耗时 {time.perf_counter() - started:.1f}s")
+    
+    if not await stage.run(sync_items()):
+        console.print("[yellow]⏹ 同步已中断[/yellow]")
     
     console.print()
 
+@showcase("Markdown Rendering", "Markdown文档渲染", requires=("rich.markdown", "markdown_doc"))
 def show_markdown_rendering():
     """Show Case 11: Markdown rendering in terminal"""
+    from markdown_doc import MarkdownDocument
+    
     console.rule("[bold blue]Show Case 11: Markdown Rendering")
     
     markdown_content = """
@@ -307,11 +406,15 @@ def show_markdown_rendering():
 官方文档：https://rich.readthedocs.io
     """
     
-    console.print(Markdown(markdown_content))
+    # Same output as rich's Markdown; see --doc for paging through long documents
+    console.print(MarkdownDocument(markdown_content))
     console.print()
 
+@showcase("Code Syntax Highlighting", "代码语法高亮", requires=("rich.syntax", "code_view"))
 def show_code_syntax_highlighting():
     """Show Case 12: Code syntax highlighting"""
+    from code_view import CodeView, HighlightedSource, memory_cache
+    
     console.rule("[bold blue]Show Case 12: Code Syntax Highlighting")
     
     python_code = '''def calculate_total(items):
@@ -330,91 +433,134 @@ items = [
 result = calculate_total(items)
 print(f"总价: ${result:.2f}")'''
     
-    syntax = Syntax(python_code, "python", theme="monokai", line_numbers=True)
-    console.print(syntax)
+    # Highlighted lines are cached by (content hash, lexer, theme): repeat runs skip lexing
+    source = HighlightedSource(python_code, "python", theme="monokai", cache=memory_cache)
+    console.print(CodeView(source, height=source.line_count))
     console.print()
 
+@showcase("Terminal Operations", "终端操作", requires=("rich.text", "async_runtime"))
 def show_terminal_operations():
     """Show Case 13: Terminal dimensions and clear animation"""
+    from rich.text import Text
+    from async_runtime import LiveStage, run_stage
+    
     console.rule("[bold blue]Show Case 13: Terminal Operations")
     
-    # Get terminal size
-    width, height = console.size
-    console.print(f"终端尺寸: {width} × {height}")
+    def size_text(width: int, height: int) -> Text:
+        return Text(f"终端尺寸: {width} × {height}\n\n准备演示清屏动画...")
     
-    console.print("\n准备演示清屏动画...")
-    time.sleep(2)
+    if console.is_terminal:
+        # The size follows the window while we wait (redrawn once a resize has settled)
+        stage = LiveStage(console, animate=False)
+        region = stage.add(size_text(*console.size))
+        stage.on_resize(lambda size: stage.update(region, size_text(*size)))
+        run_stage(stage, pacer.asleep(2))
+    else:
+        console.print(size_text(*console.size))
+        pacer.sleep(2)
     
     # Simulate clear animation (this is a simplified version)
     console.clear()
     
-    # Display centered message
+    # Display centered message, at the terminal's current width
     message = "Hello, Rich!"
-    padding = (width - len(message)) // 2
+    padding = (console.width - len(message)) // 2
     console.print(" " * padding + "[bold blue]" + message)
     
     console.print()
 
+@showcase("Emoji & Icons", "Emoji和图标", requires=("render_cache",))
 def show_emoji_icons():
     """Show Case 14: Emoji and icon integration"""
+    from rich.console import Group
+    from render_cache import render_cache
+    
     console.rule("[bold blue]Show Case 14: Emoji & Icons")
     
-    console.print("✅ 任务状态: 完成")
-    console.print("☀️  天气: 晴朗")
-    console.print("⚠️  警告: 即将超时")
-    console.print("📊 统计: 数据加载中")
-    console.print("🎯 目标: 达成")
-    console.print("🔔 通知: 新消息")
+    render_cache.print(console, "emoji_icons", lambda: Group(
+        "✅ 任务状态: 完成",
+        "☀️  天气: 晴朗",
+        "⚠️  警告: 即将超时",
+        "📊 统计: 数据加载中",
+        "🎯 目标: 达成",
+        "🔔 通知: 新消息",
+    ))
     
     console.print()
 
+@showcase("Layout System", "布局系统与面板",
+          requires=("rich.layout", "rich.panel", "resize", "async_runtime", "render_cache"))
 def show_layout_system():
     """Show Case 15: Layout system with panels"""
-    console.rule("[bold blue]Show Case 15: Layout System")
-    
-    # Create a layout
-    layout = Layout()
-    
-    # Split into main sections
-    layout.split(
-        Layout(name="header", size=3),
-        Layout(name="main", ratio=2),
-        Layout(name="footer", size=2)
-    )
+    from rich.layout import Layout
+    from rich.panel import Panel
+    from resize import ReflowLayout
+    from render_cache import render_cache
     
-    # Split main section into columns
-    layout["main"].split_row(
-        Layout(name="left", ratio=1),
-        Layout(name="center", ratio=2),
-        Layout(name="right", ratio=1)
-    )
-    
-    # Add content to each section
-    layout["header"].update(Panel("[bold]Rich Layout System Demo[/bold]", style="blue"))
-    layout["left"].update(Panel("[green]左侧面板\n这里可以放置菜单\n或导航内容[/green]", title="菜单"))
-    layout["center"].update(Panel("[yellow]中央内容区域\n这是主要的显示区域\n可以展示各种信息[/yellow]", title="内容"))
-    layout["right"].update(Panel("[cyan]右侧面板\n状态信息\n或辅助内容[/cyan]", title="状态"))
-    layout["footer"].update(Panel("[dim]底部状态栏\n© 2024 Rich Showcase[/dim]", style="dim"))
+    console.rule("[bold blue]Show Case 15: Layout System")
     
-    console.print(layout)
+    def build():
+        # Create a layout; resizes re-render only the panels whose size changed
+        layout = ReflowLayout()
+        
+        # Split into main sections
+        layout.split(
+            Layout(name="header", size=3),
+            Layout(name="main", ratio=2),
+            Layout(name="footer", size=2)
+        )
+        
+        # Split main section into columns
+        layout["main"].split_row(
+            Layout(name="left", ratio=1),
+            Layout(name="center", ratio=2),
+            Layout(name="right", ratio=1)
+        )
+        
+        # Add content to each section
+        layout["header"].update(Panel("[bold]Rich Layout System Demo[/bold]", style="blue"))
+        layout["left"].update(Panel("[green]左侧面板\n这里可以放置菜单\n或导航内容[/green]", title="菜单"))
+        layout["center"].update(Panel("[yellow]中央内容区域\n这是主要的显示区域\n可以展示各种信息[/yellow]", title="内容"))
+        layout["right"].update(Panel("[cyan]右侧面板\n状态信息\n或辅助内容[/cyan]", title="状态"))
+        layout["footer"].update(Panel("[dim]底部状态栏\n© 2024 Rich Showcase[/dim]", style="dim"))
+        return layout
+    
+    if console.is_terminal and not pacer.instant:
+        # Stays live for a moment, reflowing (debounced) when the window is resized
+        from async_runtime import LiveStage, run_stage
+        console.print("[dim]拖动窗口改变终端大小，布局会随之重排（q 跳过）[/dim]")
+        stage = LiveStage(console, animate=False)
+        stage.add(build())
+        run_stage(stage, pacer.asleep(5))
+    else:
+        # The layout fills the terminal, so it is cached per width and height
+        render_cache.print(console, "layout_system", build)
     console.print()
 
+@showcase("Columns Display", "多列内容展示", requires=("rich.columns", "rich.panel", "render_cache"))
 def show_columns_display():
     """Show case 16: Multi-column content display"""
+    from rich.columns import Columns
+    from rich.panel import Panel
+    from render_cache import render_cache
+    
     console.rule("[bold blue]Show Case 16: Columns Display")
     
-    # Create multiple panels for columns
-    panels = [
-        Panel("[bold red]项目 A[/bold red]\n状态: 进行中\n进度: 75%", title="面板 1"),
-        Panel("[bold green]项目 B[/bold green]\n状态: 已完成\n进度: 100%", title="面板 2"),
-        Panel("[bold blue]项目 C[/bold blue]\n状态: 待开始\n进度: 0%", title="面板 3"),
-        Panel("[bold yellow]项目 D[/bold yellow]\n状态: 暂停\n进度: 50%", title="面板 4")
-    ]
+    def build():
+        # Create multiple panels for columns
+        panels = [
+            Panel("[bold red]项目 A[/bold red]\n状态: 进行中\n进度: 75%", title="面板 1"),
+            Panel("[bold green]项目 B[/bold green]\n状态: 已完成\n进度: 100%", title="面板 2"),
+            Panel("[bold blue]项目 C[/bold blue]\n状态: 待开始\n进度: 0%", title="面板 3"),
+            Panel("[bold yellow]项目 D[/bold yellow]\n状态: 暂停\n进度: 50%", title="面板 4")
+        ]
+        return Columns(panels, equal=True, expand=True)
     
     # Display in columns
-    console.print(Columns(panels, equal=True, expand=True))
+    render_cache.print(console, "columns_display", build)
     console.print()
 
+@showcase("REPL Integration", "REPL集成与美化输出")
 def show_repl_integration():
     """Show case 17: REPL integration and pretty printing"""
     console.rule("[bold blue]Show Case 17: REPL Integration")
@@ -437,8 +583,11 @@ def show_repl_integration():
     console.print(sample_data)
     console.print()
 
+@showcase("Inspect Function", "对象检查调试功能", requires=("rich",))
 def show_inspect_function():
     """Show case 18: Rich inspect function for debugging"""
+    from rich import inspect
+    
     console.rule("[bold blue]Show Case 18: Inspect Function")
     
     # Create a sample class for inspection
@@ -466,16 +615,22 @@ def show_inspect_function():
     console.print()
     
     # Use inspect
-    inspect(obj, methods=True, help=True)
+    inspect(obj, console=console, methods=True, help=True)
     console.print()
 
+@showcase("Advanced Progress", "高级进度条跟踪", requires=("rich.progress", "progress_engine"))
 def show_advanced_progress():
     """Show case 19: Advanced progress tracking with custom columns"""
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+    from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn, TaskProgressColumn, TransferSpeedColumn, DownloadColumn
+    from progress_engine import ProgressHub, checksum_file, source_files
+    
     console.rule("[bold blue]Show Case 19: Advanced Progress")
     
     # Custom progress columns
     progress_columns = [
-        TextColumn("[bold blue]{task.description}"),
+        TextColumn("[bold blue]{task.description}", table_column=None),
         BarColumn(),
         TaskProgressColumn(),
         TimeRemainingColumn(),
@@ -483,33 +638,51 @@ def show_advanced_progress():
         DownloadColumn()
     ]
     
-    console.print("[bold]高级进度条 - 自定义列:[/bold]")
-    
-    with Progress(*progress_columns, console=console) as progress:
-        tasks = [
-            progress.add_task("[red]下载文件...", total=1000),
-            progress.add_task("[green]处理数据...", total=800),
-            progress.add_task("[blue]上传结果...", total=600)
-        ]
-        
-        while not progress.finished:
-            for task_id in tasks:
-                progress.update(task_id, advance=2.5)
-            time.sleep(0.02)
-    
+    console.print("[bold]高级进度条 - 自定义列（每个文件一个任务，只显示进行中的任务）:[/bold]")
+    
+    def checksum(path: str, reporter):
+        try:
+            checksum_file(path, reporter, chunk_size=16384, delay=pacer.scale(0.005))
+        finally:
+            # A file that failed still leaves the display
+            reporter.done()
+    
+    stdlib = os.path.dirname(os.__file__)
+    files = source_files(stdlib, limit=INSTANT_FILE_LIMIT if pacer.instant else None)
+    started = time.perf_counter()
+    progress = Progress(*progress_columns, console=console, auto_refresh=False)
+    futures = {}
+    with ProgressHub(progress, refresh_per_second=pacer.refresh_rate(10), max_visible=8,
+                     overall=f"[green]校验 {len(files):,} 个标准库文件") as hub, \
+            ThreadPoolExecutor(max_workers=8) as pool:
+        for path in files:
+            task_id = hub.add_task(os.path.relpath(path, stdlib), total=os.path.getsize(path))
+            futures[pool.submit(checksum, path, hub.reporter(task_id))] = path
+    
+    elapsed = time.perf_counter() - started
+    for future, path in futures.items():
+        if future.exception() is not None:
+            console.print(f"[red]❌ {os.path.relpath(path, stdlib)}: {future.exception()}[/red]")
+    stats = hub.stats
+    console.print(f"[dim]{len(files):,} 个任务, {stats['messages']:,} 条消息合并为 {stats['updates']:,} 次更新, "
+                  f"{stats['frames']:,} 帧; 进度簿记 CPU {stats['cpu'] / elapsed:.1%}[/dim]")
     console.print()
 
-def show_live_display():
+@showcase("Live Display", "实时数据显示", requires=("rich.live", "rich.table", "metrics", "async_runtime"))
+async def show_live_display():
     """Show case 20: Live display for real-time updates"""
     console.rule("[bold blue]Show Case 20: Live Display")
     
     console.print("[bold]实时数据显示演示:[/bold]")
-    console.print("模拟实时数据更新（每秒更新一次）...")
+    console.print("实时数据更新（每秒采样一次）...")
     console.print()
     
-    # Simulate live data updates
-    from rich.live import Live
+    # Live data updates from a background metrics sampler
     from rich.table import Table
+    from async_runtime import LiveStage
+    from metrics import MetricsSampler, create_provider
+    
+    sampler = MetricsSampler(create_provider(metrics_source), interval=max(pacer.scale(1), 0.05))
     
     def generate_table() -> Table:
         """生成实时数据表格"""
@@ -519,51 +692,62 @@ def show_live_display():
         table.add_column("内存使用")
         table.add_column("网络流量")
         
-        # Generate random data
-        import random
+        # Latest published sample; never blocks on /proc reads
+        values = sampler.values()
         current_time = time.strftime("%H:%M:%S")
-        cpu_usage = f"{random.randint(10, 90)}%"
-        memory_usage = f"{random.randint(512, 2048)} MB"
-        network_traffic = f"{random.randint(100, 1000)} KB/s"
+        # "—" until the first sample arrives (or while every sample fails)
+        cpu_usage = f"{values['cpu']:.0f}%" if "cpu" in values else "—"
+        memory_usage = f"{values['memory_mb']:.0f} MB" if "memory_mb" in values else "—"
+        network_traffic = f"{values['network'] * 125:.0f} KB/s" if "network" in values else "—"  # Mbps -> KB/s
         
         table.add_row(current_time, cpu_usage, memory_usage, network_traffic)
         return table
     
-    # Display live updates
-    with Live(generate_table(), refresh_per_second=1, console=console) as live:
+    async def sample_rows():
         for _ in range(5):
-            time.sleep(1)
-            live.update(generate_table())
+            await pacer.asleep(1)
+            stage.update(region, generate_table())
+    
+    # Display live updates: redrawn only when a new table is set
+    with sampler:
+        stage = LiveStage(console, refresh_per_second=1, animate=False)
+        region = stage.add(generate_table())
+        await stage.run(sample_rows())
     
     console.print()
 
+@showcase("Rules & Separators", "规则线和分隔符", requires=("rich.rule", "render_cache"))
 def show_rules_separators():
     """Show case 21: Rules and separators for visual organization"""
-    console.rule("[bold blue]Show Case 21: Rules & Separators")
-    
-    console.print("[bold]使用规则线进行视觉分隔:[/bold]")
-    console.print()
-    
-    # Different types of rules
-    console.rule("普通规则线")
-    console.print("这是普通规则线上方的内容")
-    console.print("这是普通规则线下方的内容")
-    console.print()
+    from rich.console import Group
+    from rich.rule import Rule
+    from render_cache import render_cache
     
-    console.rule("[bold green]带样式的规则线[/bold green]")
-    console.print("这是带样式规则线上方的内容")
-    console.print("这是带样式规则线下方的内容")
-    console.print()
-    
-    console.rule("章节标题", style="bold red")
-    console.print("重要章节内容...")
-    console.print()
+    console.rule("[bold blue]Show Case 21: Rules & Separators")
     
-    # Horizontal separator
-    console.print("─" * console.width)
-    console.print("这是水平分隔线")
-    console.print()
+    # The whole page as one renderable ("" is a blank line), cached per terminal width
+    render_cache.print(console, "rules_separators", lambda: Group(
+        "[bold]使用规则线进行视觉分隔:[/bold]",
+        "",
+        # Different types of rules
+        Rule("普通规则线"),
+        "这是普通规则线上方的内容",
+        "这是普通规则线下方的内容",
+        "",
+        Rule("[bold green]带样式的规则线[/bold green]"),
+        "这是带样式规则线上方的内容",
+        "这是带样式规则线下方的内容",
+        "",
+        Rule("章节标题", style="bold red"),
+        "重要章节内容...",
+        "",
+        # Horizontal separator
+        "─" * console.width,
+        "这是水平分隔线",
+        "",
+    ))
 
+@showcase("Prompt & Input", "交互式提示和输入", requires=("rich.prompt",))
 def show_prompt_input():
     """Show case 22: Interactive prompts and input handling"""
     console.rule("[bold blue]Show Case 22: Prompt & Input")
@@ -597,6 +781,7 @@ def show_prompt_input():
     console.print("   → 1")
     console.print()
 
+@showcase("Traceback Handling", "异常追踪美化", requires=("rich.traceback",))
 def show_traceback_handling():
     """Show case 23: Beautiful traceback formatting"""
     console.rule("[bold blue]Show Case 23: Traceback Handling")
@@ -604,23 +789,36 @@ def show_traceback_handling():
     console.print("[bold]美观的异常追踪信息格式化:[/bold]")
     console.print()
     
+    # The failing functions are compiled from a short snippet registered with linecache
+    # (under a file name that does not exist on disk), so the traceback highlights a
+    # few lines of source instead of this whole file for every frame
+    import linecache
+    import os
+    demo_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "traceback_demo.py")
+    demo_source = (
+        "def problematic_function():\n"
+        "    another_function()\n"
+        "\n"
+        "\n"
+        "def another_function():\n"
+        "    raise ValueError(\"这是一个模拟的错误信息\")\n"
+    )
+    linecache.cache[demo_file] = (len(demo_source), None, demo_source.splitlines(True), demo_file)
+    demo = {}
+    exec(compile(demo_source, demo_file, "exec"), demo)
+    
     # Demonstrate rich traceback
     try:
         # Create a deliberate error
-        def problematic_function():
-            another_function()
-            
-        def another_function():
-            raise ValueError("这是一个模拟的错误信息")
-            
-        problematic_function()
+        demo["problematic_function"]()
         
-    except Exception:
-        from rich.traceback import install
+    except Exception as error:
+        from rich.traceback import Traceback, install
         install(show_locals=True)
         
         console.print("标准Python traceback:")
-        console.print_exception()
+        # Starts at the demo functions: this frame would highlight the whole of this file
+        console.print(Traceback.from_exception(type(error), error, error.__traceback__.tb_next))
         console.print()
         
         console.print("Rich美化后的traceback:")
@@ -628,6 +826,7 @@ def show_traceback_handling():
     
     console.print()
 
+@showcase("Theme Customization", "主题定制", requires=("rich.theme",))
 def show_theme_customization():
     """Show case 24: Theme customization and styling"""
     console.rule("[bold blue]Show Case 24: Theme Customization")
@@ -647,13 +846,12 @@ def show_theme_customization():
         "highlight": "reverse"
     })
     
-    themed_console = Console(theme=custom_theme)
-    
-    themed_console.print("这是信息样式", style="info")
-    themed_console.print("这是警告样式", style="warning") 
-    themed_console.print("这是错误样式", style="error")
-    themed_console.print("这是成功样式", style="success")
-    themed_console.print("这是高亮样式", style="highlight")
+    with console.use_theme(custom_theme):
+        console.print("这是信息样式", style="info")
+        console.print("这是警告样式", style="warning") 
+        console.print("这是错误样式", style="error")
+        console.print("这是成功样式", style="success")
+        console.print("这是高亮样式", style="highlight")
     
     console.print()
     console.print("还可以创建完整的主题配置文件:")
@@ -662,114 +860,461 @@ def show_theme_customization():
     console.print("• 创建一致的品牌视觉")
     console.print()
 
-def parse_arguments():
-    """Parse command line arguments"""
+def parse_arguments(argv: Optional[List[str]] = None):
+    """Parse command line arguments (sys.argv[1:] when argv is None)"""
     import argparse
     parser = argparse.ArgumentParser(description="Rich Library Showcase")
     parser.add_argument("--skip-pause", action="store_true", help="跳过展示间的暂停")
-    parser.add_argument("--fast", action="store_true", help="快速模式（减少动画时间）")
+    add_pacing_arguments(parser)
     parser.add_argument("--list", action="store_true", help="列出所有展示项目")
     parser.add_argument("--show", type=str, help="运行特定展示项目（编号或名称）")
-    return parser.parse_args()
+    parser.add_argument("--repeat", type=int, default=1, metavar="N", help="重复运行 N 轮（0 表示无限循环的展台模式）；静态展示从第二轮起直接输出缓存的渲染结果")
+    parser.add_argument("--render-cache-mb", type=float, default=16, help="静态展示渲染缓存的内存上限（MB，默认 16，0 表示不缓存）")
+    parser.add_argument("--render-all", action="store_true", help="并行无头渲染所有展示到快照缓存")
+    parser.add_argument("--out", metavar="DIR", help="快照缓存输出目录（配合 --render-all）")
+    parser.add_argument("--width", type=int, help="快照渲染宽度（默认当前终端宽度）")
+    parser.add_argument("--jobs", type=int, help="并行数：--render-all 的渲染进程数（默认每个展示一个）/ --tree 的扫描线程数 / --transfer 的并发文件数（默认 4）")
+    parser.add_argument("--replay", metavar="DIR", help="从快照缓存回放展示，未命中时实时渲染")
+    parser.add_argument("--table", metavar="FILE", help="分页浏览 CSV 文件（- 表示标准输入），只渲染可见行")
+    parser.add_argument("--json", metavar="FILE", help="流式浏览 JSON / JSON Lines 文件（- 表示标准输入）")
+    parser.add_argument("--json-depth", type=int, default=6, help="JSON 树展开的最大深度（默认 6）")
+    parser.add_argument("--json-items", type=int, default=50, help="每个对象 / 数组最多显示的子项数（默认 50）")
+    parser.add_argument("--json-path", metavar="PATH", help="只显示该路径下的值，如 data.items.0")
+    parser.add_argument("--tree", metavar="PATH", help="并发扫描并浏览真实目录树")
+    parser.add_argument("--tree-depth", type=int, default=3, help="目录树扫描深度（默认 3，更深的目录折叠显示）")
+    parser.add_argument("--tree-entries", type=int, default=50, help="每个目录最多列出的条目数，超出部分汇总显示（默认 50）")
+    parser.add_argument("--no-ignore", action="store_true", help="不读取 .gitignore / .ignore 文件")
+    parser.add_argument("--code", metavar="FILE", help="语法高亮浏览源代码文件（按可见行增量高亮，结果缓存）")
+    parser.add_argument("--lexer", help="指定 --code 使用的 pygments 词法分析器（默认按文件名推断）")
+    parser.add_argument("--code-theme", default="monokai", help="--code / --doc 代码块的配色主题（默认 monokai）")
+    parser.add_argument("--doc", metavar="FILE", help="分页浏览长 Markdown 文档（- 表示标准输入），按节惰性解析和渲染")
+    parser.add_argument("--tail", metavar="FILE", help="浏览并跟随日志文件（mmap + 后台行索引，适合 GB 级日志，类似 tail -f）")
+    parser.add_argument("--transfer", nargs="+", metavar="PATH", help="分块读取并校验真实文件（目录递归），显示真实吞吐量")
+    parser.add_argument("--copy-to", metavar="DIR", help="--transfer 时同时复制到该目录")
+    parser.add_argument("--chunk-size", default="1M", help="--transfer 的读取块大小，如 64K、1M（默认 1M）")
+    parser.add_argument("--mmap", action="store_true", help="--transfer 使用 mmap 读取文件")
+    parser.add_argument("--metrics", choices=["auto", "proc", "synthetic"], default="auto", help="实时数据指标来源（默认自动选择 /proc）")
+    return parser.parse_args(argv)
 
 def list_showcases():
     """List all available showcases"""
     console = Console()
     console.print("[bold green]📋 可用展示项目:[/bold green]\n")
     
-    showcases = [
-        ("1", "Basic Text Styling", "基础文本样式和颜色"),
-        ("2", "Dynamic Text", "动态文本效果（打字机效果）"),
-        ("3", "Data Table", "数据表格展示"),
-        ("4", "Nested Tables", "嵌套表格"),
-        ("5", "Single Progress Bar", "单任务进度条"),
-        ("6", "Multi Progress Bars", "多任务并行进度条"),
-        ("7", "File Tree", "文件目录树"),
-        ("8", "JSON Tree", "JSON数据树"),
-        ("9", "Graded Logging", "分级日志"),
-        ("10", "Real-time Status", "实时状态更新"),
-        ("11", "Markdown Rendering", "Markdown文档渲染"),
-        ("12", "Code Syntax Highlighting", "代码语法高亮"),
-        ("13", "Terminal Operations", "终端操作"),
-        ("14", "Emoji & Icons", "Emoji和图标"),
-        ("15", "Layout System", "布局系统与面板"),
-        ("16", "Columns Display", "多列内容展示"),
-        ("17", "REPL Integration", "REPL集成与美化输出"),
-        ("18", "Inspect Function", "对象检查调试功能"),
-        ("19", "Advanced Progress", "高级进度条跟踪"),
-        ("20", "Live Display", "实时数据显示"),
-        ("21", "Rules & Separators", "规则线和分隔符"),
-        ("22", "Prompt & Input", "交互式提示和输入"),
-        ("23", "Traceback Handling", "异常追踪美化"),
-        ("24", "Theme Customization", "主题定制"),
-    ]
+    for case in SHOWCASES:
+        console.print(f"  [{case.number}] [bold]{case.name}[/bold] - {case.description}")
+    
+    # Cold-start time: module import up to a fully printed list
+    elapsed_ms = (time.perf_counter() - _START_TIME) * 1000
+    console.print(f"\n[dim]⏱ 冷启动耗时: {elapsed_ms:.1f} ms[/dim]")
+
+def local_module_sources(modules: Tuple[str, ...]) -> List[str]:
+    """Source of the given modules that are files of this repo, and of the repo modules they import"""
+    import ast
+    import os
+    here = os.path.dirname(os.path.abspath(__file__))
+    pending, seen, sources = list(modules), set(), []
+    while pending:
+        name = pending.pop(0)
+        path = os.path.join(here, name.split(".")[0] + ".py")
+        if path in seen or not os.path.isfile(path):
+            # Rich and the standard library are covered by the version in the key
+            continue
+        seen.add(path)
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        sources.append(source)
+        for node in ast.walk(ast.parse(source, path)):
+            if isinstance(node, ast.Import):
+                pending.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                pending.append(node.module)
+    return sources
+
+def showcase_snapshot_key(case: ShowCase, width: int, color_system: Optional[str], version: str) -> str:
+    """Cache key for a rendered show case (changes whenever its source or a repo module it uses changes)"""
+    import inspect as pyinspect
+    from snapshot_cache import snapshot_key
+    # pacing is shared by every show case without being listed in requires
+    source = "\n".join([pyinspect.getsource(case.func)] + local_module_sources(case.requires + ("pacing",)))
+    return snapshot_key(case.number, source, width, color_system, version)
+
+def render_snapshot(number: str, width: int, color_system: Optional[str]) -> Dict[str, str]:
+    """Render one show case headlessly into a recording console (process pool worker)"""
+    import io
+    global console
+    
+    pacer.configure(0)
+    console = Console(file=io.StringIO(), record=True, width=width, color_system=color_system)
+    find_showcase(number).run()
+    return {
+        "txt": console.export_text(clear=False),
+        "ansi": console.export_text(clear=False, styles=True),
+        "html": console.export_html(),
+    }
+
+def render_all_showcases(out_dir: str, width: Optional[int] = None, jobs: Optional[int] = None):
+    """Render every show case in parallel into the snapshot cache at out_dir"""
+    from concurrent.futures import ProcessPoolExecutor
+    from snapshot_cache import SnapshotCache, rich_version
+    
+    width = width or console.width
+    color_system = console.color_system
+    version = rich_version()
+    cache = SnapshotCache(out_dir)
+    
+    keys = {case.number: showcase_snapshot_key(case, width, color_system, version) for case in SHOWCASES}
+    pending = [case for case in SHOWCASES if keys[case.number] not in cache]
+    console.print(f"[bold]🖼 渲染快照:[/bold] {len(pending)} 个待渲染, {len(SHOWCASES) - len(pending)} 个已缓存 "
+                  f"(宽度 {width}, 颜色 {color_system or 'none'}, Rich {version})")
+    
+    started = time.perf_counter()
+    if pending:
+        # One task per show case; --jobs caps the pool size
+        with ProcessPoolExecutor(max_workers=jobs or len(pending)) as pool:
+            futures = {
+                case.number: pool.submit(render_snapshot, case.number, width, color_system)
+                for case in pending
+            }
+            for case in pending:
+                try:
+                    exports = futures[case.number].result()
+                except Exception as e:
+                    console.print(f"  [red]❌ [{case.number}] {case.name}: {e}[/red]")
+                    continue
+                cache.put(keys[case.number], exports, {
+                    "case": case.number,
+                    "name": case.name,
+                    "width": width,
+                    "color_system": color_system or "none",
+                    "rich": version,
+                })
+                console.print(f"  [green]✅[/green] [{case.number}] {case.name}")
+        cache.save_index()
+    
+    console.print(f"[dim]完成，耗时 {time.perf_counter() - started:.2f}s，输出目录: {out_dir}[/dim]")
+
+def replay_snapshot(case: ShowCase, cache, version: str) -> bool:
+    """Write a cached rendering of the show case to the console; False on a miss"""
+    key = showcase_snapshot_key(case, console.width, console.color_system, version)
+    frames = cache.get(key, "ansi" if console.color_system else "txt")
+    if frames is None:
+        return False
+    console.file.write(frames)
+    console.file.flush()
+    return True
+
+def view_table(path: str):
+    """Page through a CSV file (or stdin) with a virtual table"""
+    from rich import box
+    from pager import run_pager
+    from virtual_table import csv_source, VirtualTable
+    
+    try:
+        header, source = csv_source(path)
+    except OSError as e:
+        console.print(f"[red]❌ 无法打开 {path}: {e}[/red]")
+        return
+    
+    with source:
+        table = VirtualTable(source, title=path if path != "-" else None, box=box.SIMPLE_HEAD,
+                             header_style="bold cyan")
+        for name in header:
+            table.add_column(name)
+        run_pager(table, console)
+
+def view_json(path: str, max_depth: int, max_items: int, json_path: Optional[str] = None):
+    """Stream a JSON (or JSON Lines) file into a bounded tree and page through it"""
+    import io
+    import sys
+    from json import JSONDecodeError
+    from json_stream import JsonEventReader, build_tree, select_path
+    from pager import LineView, run_pager
+    
+    try:
+        stream = io.TextIOWrapper(sys.stdin.buffer, errors="replace") if path == "-" else open(path, errors="replace")
+    except OSError as e:
+        console.print(f"[red]❌ 无法打开 {path}: {e}[/red]")
+        return
+    
+    label = f"📋 {path}" + (f" → {json_path}" if json_path else "")
+    documents = path.endswith((".jsonl", ".ndjson"))
+    reader = JsonEventReader(stream)
+    events = select_path(reader, json_path.split(".")) if json_path else reader
+    with stream:
+        try:
+            with console.status(f"📥 正在读取 {path} ..."):
+                tree = build_tree(events, label, max_depth=max_depth, max_items=max_items, documents=documents)
+        except JSONDecodeError as e:
+            console.print(f"[red]❌ JSON 解析错误: {e.msg}（已读取 {reader.chars_read:,} 字符）[/red]")
+            return
+    run_pager(LineView(tree), console, fallback=tree)
+
+def view_tree(path: str, max_depth: int, max_entries: int, workers: Optional[int] = None,
+              use_ignore_files: bool = True):
+    """Scan a real directory concurrently, rendering the tree while it fills in"""
+    import os
+    from rich.console import Group
+    from rich.filesize import decimal
+    from rich.live import Live
+    from rich.text import Text
+    from fs_tree import FsScanner, render_tree
+    from pager import LineView, run_pager
+    
+    if not os.path.isdir(path):
+        console.print(f"[red]❌ 不是目录: {path}[/red]")
+        return
     
-    for num, name, desc in showcases:
-        console.print(f"  [{num}] [bold]{name}[/bold] - {desc}")
+    scanner = FsScanner(path, max_depth=max_depth, max_entries=max_entries,
+                        workers=workers, use_ignore_files=use_ignore_files)
+    started = time.perf_counter()
+    
+    def status() -> Text:
+        root = scanner.root
+        state = "✅ 扫描完成" if scanner.done else "🔍 扫描中…"
+        # "≥": directories below the depth limit (or unreadable) are not counted
+        bound = "≥" if root.partial else ""
+        return Text(f"{state} {scanner.dirs_scanned:,} 个目录, {bound}{root.total_files:,} 个文件, "
+                    f"{bound}{decimal(root.total_bytes)}, 忽略 {scanner.ignored:,} 项, "
+                    f"{time.perf_counter() - started:.1f}s", style="dim")
+    
+    scanner.start()
+    try:
+        # Progressive view: the partial tree is redrawn while worker threads scan
+        with Live(console=console, auto_refresh=False, transient=True, vertical_overflow="crop") as live:
+            while not scanner.wait(0.1):
+                live.update(Group(status(), render_tree(scanner)), refresh=True)
+    except KeyboardInterrupt:
+        console.print("[yellow]⏹ 扫描已中断，显示已扫描部分[/yellow]")
+    finally:
+        scanner.close()
+    
+    tree = render_tree(scanner)
+    view = Group(status(), tree)
+    run_pager(LineView(view), console, fallback=view)
 
-def main():
-    """Main function to run all showcase demonstrations"""
-    args = parse_arguments()
+def view_code(path: str, lexer: Optional[str] = None, theme: str = "monokai"):
+    """Page through a source file, highlighting only the lines scrolled into view"""
+    from code_view import CodeView, HighlightedSource, TokenCache, default_cache_dir
+    from pager import PAGER_HELP, run_pager
+    
+    started = time.perf_counter()
+    try:
+        source = HighlightedSource.from_file(path, lexer, theme, cache=TokenCache(default_cache_dir()))
+    except OSError as e:
+        console.print(f"[red]❌ 无法打开 {path}: {e}[/red]")
+        return
+    except ValueError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        return
+    
+    view = CodeView(source)
+    if not console.is_terminal:
+        view.height = source.line_count
+        console.print(view)
+        return
+    
+    # First screen is lexed on demand; the rest is lexed (and cached) in the background
+    source.finish_in_background()
+    cached = "缓存命中" if source.from_cache else f"首屏 {(time.perf_counter() - started) * 1000:.0f} ms"
+    run_pager(view, console, help_text=f"{path} · {source.lexer_name} · {source.line_count:,} 行 · {cached}  |  {PAGER_HELP}")
+
+def view_doc(path: str, code_theme: str = "monokai"):
+    """Page through a long Markdown document, rendering sections as they scroll into view"""
+    import io
+    import sys
+    from markdown_doc import MarkdownDocument
+    from pager import PAGER_HELP, run_pager
+    
+    try:
+        if path == "-":
+            text = io.TextIOWrapper(sys.stdin.buffer, errors="replace").read()
+        else:
+            with open(path, errors="replace") as f:
+                text = f.read()
+    except OSError as e:
+        console.print(f"[red]❌ 无法打开 {path}: {e}[/red]")
+        return
+    
+    document = MarkdownDocument(text, code_theme=code_theme, hyperlinks=True)
+    run_pager(document, console, help_text=f"{path} · {len(document.sections):,} 节  |  {PAGER_HELP}")
+
+def view_log(path: str):
+    """Tail a log file: the last lines at once, following appends; indexed in the background for jumps and filters"""
+    from log_viewer import LOG_HELP, LogFile, LogView
+    from pager import run_pager
+    
+    try:
+        log = LogFile(path)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]❌ 无法打开 {path}: {e}[/red]")
+        return
+    
+    view = LogView(log)
+    if not console.is_terminal:
+        # Like tail: the last screenful, without the pager's status bar
+        view.status_bar = False
+        console.print(view)
+        log.close()
+        return
+    
+    with log:
+        try:
+            run_pager(view, console, help_text=LOG_HELP, on_key=view.on_key, tick=view.changed)
+        finally:
+            view.close()
+
+def view_transfer(paths: List[str], copy_to: Optional[str] = None, chunk_size: str = "1M",
+                  workers: Optional[int] = None, use_mmap: bool = False):
+    """Hash (or copy) real files concurrently, showing per-file and overall transfer speed"""
+    from rich.filesize import decimal
+    from rich.progress import (Progress, BarColumn, DownloadColumn, TextColumn,
+                               TimeRemainingColumn, TransferSpeedColumn)
+    from progress_engine import ProgressHub
+    from transfer import DEFAULT_WORKERS, parse_size, plan_transfers, run_transfers
+    
+    try:
+        chunk = parse_size(chunk_size)
+    except ValueError:
+        console.print(f"[red]❌ 无效的块大小: {chunk_size}[/red]")
+        return
+    jobs, refused = plan_transfers(paths, copy_to)
+    for reason in refused:
+        console.print(f"[red]❌ {reason}[/red]")
+    if not jobs:
+        if not refused:
+            console.print(f"[red]❌ 没有可读取的文件: {' '.join(paths)}[/red]")
+        return
+    
+    workers = workers or DEFAULT_WORKERS
+    action = f"复制到 {copy_to}" if copy_to else "校验"
+    progress = Progress(
+        TextColumn("[bold blue]{task.description}", table_column=None),
+        BarColumn(),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+        TimeRemainingColumn(),
+        console=console,
+        auto_refresh=False,
+    )
+    with ProgressHub(progress, overall=f"[green]{action} {len(jobs):,} 个文件") as hub:
+        summary = run_transfers(jobs, hub, chunk, workers, use_mmap)
+    
+    for error in summary.errors:
+        console.print(f"[red]❌ {error}[/red]")
+    stats = hub.stats
+    console.print(f"[bold]{len(summary.results):,} 个文件, {decimal(summary.total_bytes)}, "
+                  f"{summary.seconds:.2f}s, 吞吐 {decimal(int(summary.throughput))}/s[/bold] "
+                  f"[dim](块 {decimal(chunk)}, 并发 {workers}, {'mmap' if use_mmap else 'read'}; "
+                  f"进度簿记 CPU {stats['cpu'] / max(summary.seconds, 1e-9):.1%})[/dim]")
+
+def print_showcase_header(case: ShowCase):
+    """Print the banner shown before a show case runs"""
+    console.print(f"[bold blue]───────────────────────────────────────────────────────────── Show Case {case.number}: {case.name.replace('_', ' ').title()} ─────────────────────────────────────────────────────────────[/bold blue]")
+
+def main(argv: Optional[List[str]] = None):
+    """Main function to run all showcase demonstrations (also called in-process by launcher.py)"""
+    global metrics_source
+    args = parse_arguments(argv)
+    configure_from_args(args)
+    metrics_source = args.metrics
+    if metrics_source != "auto":
+        from metrics import create_provider
+        try:
+            create_provider(metrics_source)
+        except ValueError as e:
+            console.print(f"[red]❌ {e}[/red]")
+            return
     
     if args.list:
         list_showcases()
         return
     
+    if args.table:
+        view_table(args.table)
+        return
+    
+    if args.json:
+        view_json(args.json, args.json_depth, args.json_items, args.json_path)
+        return
+    
+    if args.code:
+        view_code(args.code, args.lexer, args.code_theme)
+        return
+    
+    if args.doc:
+        view_doc(args.doc, args.code_theme)
+        return
+    
+    if args.tail:
+        view_log(args.tail)
+        return
+    
+    if args.transfer:
+        view_transfer(args.transfer, args.copy_to, args.chunk_size, args.jobs, args.mmap)
+        return
+    
+    if args.tree:
+        view_tree(args.tree, args.tree_depth, args.tree_entries, args.jobs, not args.no_ignore)
+        return
+    
+    if args.render_all:
+        if not args.out:
+            console.print("[red]❌ --render-all 需要配合 --out DIR 使用[/red]")
+            return
+        render_all_showcases(args.out, args.width, args.jobs)
+        return
+    
+    # Replay cached frames where available, run the show case otherwise
+    cache = version = None
+    if args.replay:
+        from snapshot_cache import SnapshotCache, rich_version
+        cache, version = SnapshotCache(args.replay), rich_version()
+    
+    def run_case(case: ShowCase):
+        print_showcase_header(case)
+        if cache is None or not replay_snapshot(case, cache, version):
+            case.run()
+    
+    import itertools
+    from rich.panel import Panel
+    from render_cache import render_cache
+    
+    render_cache.resize(int(args.render_cache_mb * 1024 * 1024))
+    rounds = itertools.count(1) if args.repeat <= 0 else range(1, args.repeat + 1)
+    
+    def report_render_cache():
+        if args.repeat != 1:
+            stats = render_cache.stats
+            console.print(f"[dim]渲染缓存: 命中 {stats['hits']} 次, 未命中 {stats['misses']} 次, "
+                          f"{len(render_cache)} 项 / {render_cache.size / 1024:.0f} KiB[/dim]")
+    
     console.print(Panel.fit("[bold blue]Rich Library 终端交互展示舞台[/bold blue]", subtitle="Python终端美化瑞士军刀"))
     console.print()
     
-    # Define all showcase functions
-    showcases = [
-        ("1", "Basic Text Styling", show_basic_text_styling),
-        ("2", "Dynamic Text", show_dynamic_text),
-        ("3", "Data Table", show_data_table),
-        ("4", "Nested Tables", show_nested_tables),
-        ("5", "Single Progress Bar", show_single_progress_bar),
-        ("6", "Multi Progress Bars", show_multi_progress_bars),
-        ("7", "File Tree", show_file_tree),
-        ("8", "JSON Tree", show_json_tree),
-        ("9", "Graded Logging", show_graded_logging),
-        ("10", "Real-time Status", show_real_time_status),
-        ("11", "Markdown Rendering", show_markdown_rendering),
-        ("12", "Code Syntax Highlighting", show_code_syntax_highlighting),
-        ("13", "Terminal Operations", show_terminal_operations),
-        ("14", "Emoji & Icons", show_emoji_icons),
-        ("15", "Layout System", show_layout_system),
-        ("16", "Columns Display", show_columns_display),
-        ("17", "REPL Integration", show_repl_integration),
-        ("18", "Inspect Function", show_inspect_function),
-        ("19", "Advanced Progress", show_advanced_progress),
-        ("20", "Live Display", show_live_display),
-        ("21", "Rules & Separators", show_rules_separators),
-        ("22", "Prompt & Input", show_prompt_input),
-        ("23", "Traceback Handling", show_traceback_handling),
-        ("24", "Theme Customization", show_theme_customization)
-    ]
-    
     # Run specific showcase if requested
     if args.show:
-        found = False
-        for num, name, func in showcases:
-            if args.show == num or args.show.lower() in name.lower():
-                console.print(f"[bold blue]───────────────────────────────────────────────────────────── Show Case {num}: {name.replace('_', ' ').title()} ─────────────────────────────────────────────────────────────[/bold blue]")
-                func()
-                found = True
-                break
-        
-        if not found:
+        case = find_showcase(args.show)
+        if case is None:
             console.print(f"[red]❌ 未找到展示项目: {args.show}[/red]")
             list_showcases()
+            return
+        
+        for _ in rounds:
+            run_case(case)
+        report_render_cache()
         return
     
-    # Run all showcases
-    for i, (num, name, showcase_func) in enumerate(showcases, 1):
-        console.print(f"[bold blue]───────────────────────────────────────────────────────────── Show Case {num}: {name.replace('_', ' ').title()} ─────────────────────────────────────────────────────────────[/bold blue]")
-        showcase_func()
-        if i < len(showcases) and not args.skip_pause:
-            console.input("[dim]按回车键继续下一个展示...")
-            if not args.fast:
-                console.clear()
+    # Run all showcases (round after round with --repeat)
+    for round_number in rounds:
+        for i, case in enumerate(SHOWCASES, 1):
+            run_case(case)
+            if (i < len(SHOWCASES) or round_number != args.repeat) and not args.skip_pause:
+                console.input("[dim]按回车键继续下一个展示...")
+                if not args.fast:
+                    console.clear()
     
+    report_render_cache()
     console.print(Panel.fit("[green]🎉 所有展示完成！[/green]", subtitle="感谢观看Rich库功能演示"))
 
 if __name__ == "__main__":
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Search Engine - indexed, ranked fuzzy search for the real-time search demo
+Items are normalized once (NFKC + casefold) and indexed two ways: a sorted
+array of word starts (binary-searched for prefix and word-prefix matches) and
+character trigrams. Results are ranked in tiers - prefix, word prefix, infix,
+then trigram-overlap fuzzy matches - and each tier is only computed when the
+ones before it leave room. Highlight spans are mapped back onto the original
+text, so they stay correct regardless of case.
+
+IncrementalSearch drives search-as-you-type: each keystroke only re-checks
+the matches of the previous query, and long scans can be abandoned as soon
+as a newer keystroke arrives.
+"""
+
+import heapq
+import re
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from itertools import compress, repeat
+from operator import contains
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+NGRAM = 3
+
+# Word starts are sorted by this many characters; longer queries are
+# narrowed by trigrams instead
+WORD_KEY_LENGTH = 16
+
+# Trigrams shared by more than this share of the corpus carry too little
+# information for the fuzzy pass and are skipped there
+COMMON_GRAM_RATIO = 0.2
+
+# Incremental scans poll their cancel callback once per this many items
+CANCEL_CHECK_INTERVAL = 2048
+
+
+def normalize(text: str) -> Tuple[str, Optional[List[int]]]:
+    """Normalize text for matching
+
+    Returns the normalized string and, when normalization changed the length
+    (e.g. "ß" -> "ss"), a map from normalized offsets back to original ones.
+    """
+    folded = unicodedata.normalize("NFKC", text).casefold()
+    if len(folded) == len(text):
+        return folded, None
+    pieces, offsets = [], []
+    for index, char in enumerate(text):
+        piece = unicodedata.normalize("NFKC", char).casefold()
+        pieces.append(piece)
+        offsets.extend([index] * len(piece))
+    return "".join(pieces), offsets
+
+
+def ngrams(text: str, size: int = NGRAM) -> Iterable[str]:
+    return (text[i:i + size] for i in range(len(text) - size + 1))
+
+
+def merge_spans(spans: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+# Positions that start a word: not preceded by a letter/digit, not whitespace
+WORD_START = re.compile(r"(?<![^\W_])(?=\S)")
+
+
+class SearchHit(NamedTuple):
+    """One ranked result; spans index into the original item text"""
+    index: int
+    text: str
+    score: float
+    spans: List[Tuple[int, int]]
+    fuzzy: bool = False
+
+
+class SearchIndex:
+    """Prefix and trigram index over a fixed catalogue of strings"""
+
+    def __init__(self, items: Sequence[str]):
+        self.items: List[str] = list(items)
+        self.normalized: List[str] = []
+        self._offsets: Dict[int, List[int]] = {}
+        postings: Dict[str, list] = defaultdict(list)
+        prefixes, word_starts = [], []
+        for index, item in enumerate(self.items):
+            folded, offsets = normalize(item)
+            self.normalized.append(folded)
+            if offsets is not None:
+                self._offsets[index] = offsets
+            for gram in {folded[i:i + NGRAM] for i in range(len(folded) - NGRAM + 1)}:
+                postings[gram].append(index)
+            prefixes.append((folded[:WORD_KEY_LENGTH], index))
+            for match in WORD_START.finditer(folded, 1, 0xFFFF):
+                position = match.start()
+                word_starts.append((folded[position:position + WORD_KEY_LENGTH], index, position))
+        # Compact posting lists once the catalogue is complete
+        self._postings = {gram: array("I", ids) for gram, ids in postings.items()}
+
+        # Sorted whole-item prefixes and sorted word starts, searched with bisect
+        prefixes.sort()
+        self._prefix_keys = [key for key, _ in prefixes]
+        self._prefix_items = array("I", (index for _, index in prefixes))
+        word_starts.sort()
+        self._word_keys = [key for key, _, _ in word_starts]
+        self._word_items = array("I", (index for _, index, _ in word_starts))
+        self._word_positions = array("H", (position for _, _, position in word_starts))
+
+    @classmethod
+    def from_file(cls, path: str, encoding: str = "utf-8") -> "SearchIndex":
+        """Build an index from a text file with one entry per line"""
+        with open(path, encoding=encoding, errors="replace") as f:
+            return cls([line.strip() for line in f if line.strip()])
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _original_span(self, index: int, start: int, end: int) -> Tuple[int, int]:
+        offsets = self._offsets.get(index)
+        if offsets is None:
+            return start, end
+        return offsets[start], offsets[end - 1] + 1
+
+    @staticmethod
+    def _prefix_range(keys: List[str], query: str) -> Tuple[int, int]:
+        """Range of sorted keys beginning with query"""
+        key = query[:WORD_KEY_LENGTH]
+        return bisect_left(keys, key), bisect_left(keys, key + "\U0010ffff")
+
+    def _word_prefix_hits(self, query: str, limit: int) -> List[SearchHit]:
+        """Items starting with the query, then items with a later word starting with it"""
+        normalized = self.normalized
+        long_query = len(query) > WORD_KEY_LENGTH
+        hits: List[SearchHit] = []
+        seen = set()
+
+        start, end = self._prefix_range(self._prefix_keys, query)
+        for entry in range(start, end):
+            if len(hits) == limit:
+                return hits
+            index = self._prefix_items[entry]
+            if long_query and not normalized[index].startswith(query):
+                continue
+            seen.add(index)
+            span = self._original_span(index, 0, len(query))
+            hits.append(SearchHit(index, self.items[index], 2.0 + 1.0 / len(normalized[index]), [span]))
+
+        start, end = self._prefix_range(self._word_keys, query)
+        for entry in range(start, end):
+            if len(hits) == limit:
+                break
+            index = self._word_items[entry]
+            position = self._word_positions[entry]
+            if index in seen or (long_query and not normalized[index].startswith(query, position)):
+                continue
+            seen.add(index)
+            span = self._original_span(index, position, position + len(query))
+            hits.append(SearchHit(index, self.items[index], 1.5 + 1.0 / (1 + position), [span]))
+        return hits
+
+    def _substring_candidates(self, query: str, candidates: Optional[Iterable[int]]) -> Iterable[int]:
+        if candidates is not None:
+            return candidates
+        if len(query) < NGRAM:
+            return range(len(self.items))
+        # Every substring match contains all query trigrams; scan the rarest list
+        rarest = None
+        for gram in set(ngrams(query)):
+            posting = self._postings.get(gram)
+            if posting is None:
+                return ()
+            if rarest is None or len(posting) < len(rarest):
+                rarest = posting
+        return rarest
+
+    def substring_matches(self, query: str, candidates: Optional[Iterable[int]] = None) -> List[int]:
+        """Ids of items containing the normalized query, in index order"""
+        normalized = self.normalized
+        return [i for i in self._substring_candidates(query, candidates) if query in normalized[i]]
+
+    def _infix_hits(self, query: str, exclude: set, limit: int) -> List[SearchHit]:
+        """Matches inside words, in catalogue order"""
+        normalized = self.normalized
+        hits = []
+        for index in self._substring_candidates(query, None):
+            if index in exclude:
+                continue
+            position = normalized[index].find(query)
+            if position < 0:
+                continue
+            span = self._original_span(index, position, position + len(query))
+            hits.append(SearchHit(index, self.items[index], 1.0 / (1 + position), [span]))
+            if len(hits) == limit:
+                break
+        return hits
+
+    def _fuzzy(self, query: str, exclude: set, limit: int) -> List[SearchHit]:
+        grams = list(dict.fromkeys(ngrams(query)))
+        if not grams:
+            return []
+        common = max(int(len(self.items) * COMMON_GRAM_RATIO), 1)
+        overlap: Counter = Counter()
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is not None and len(posting) <= common:
+                overlap.update(posting)
+        needed = max(1, (len(grams) + 1) // 2)
+        ranked = heapq.nsmallest(
+            limit,
+            ((count, index) for index, count in overlap.items() if count >= needed and index not in exclude),
+            key=lambda pair: (-pair[0], len(self.normalized[pair[1]]), pair[1]),
+        )
+        hits = []
+        for count, index in ranked:
+            text = self.normalized[index]
+            spans = []
+            for gram in grams:
+                position = text.find(gram)
+                if position >= 0:
+                    spans.append(self._original_span(index, position, position + NGRAM))
+            hits.append(SearchHit(index, self.items[index], count / len(grams), merge_spans(spans), fuzzy=True))
+        return hits
+
+    def search(self, query: str, limit: int = 50, fuzzy: bool = True) -> List[SearchHit]:
+        """Ranked hits: prefix, word prefix, infix, then fuzzy trigram matches"""
+        folded, _ = normalize(query.strip())
+        if not folded:
+            return [SearchHit(i, self.items[i], 0.0, []) for i in range(min(limit, len(self.items)))]
+        hits = self._word_prefix_hits(folded, limit)
+        if len(hits) < limit:
+            seen = {hit.index for hit in hits}
+            hits.extend(self._infix_hits(folded, seen, limit - len(hits)))
+        if fuzzy and len(hits) < limit and len(folded) >= NGRAM:
+            hits.extend(self._fuzzy(folded, {hit.index for hit in hits}, limit - len(hits)))
+        return hits
+
+    def count(self, query: str) -> int:
+        """Number of substring matches for the query"""
+        folded, _ = normalize(query.strip())
+        return len(self.substring_matches(folded)) if folded else len(self.items)
+
+
+class IncrementalSearch:
+    """Search-as-you-type session over a SearchIndex
+
+    The complete substring match list of every query typed so far is kept on
+    a stack. Extending the query re-checks only the previous matches (or the
+    rarest trigram posting, if that is smaller); deleting characters pops back
+    to a list that is already known. Scans poll ``should_cancel`` every
+    CANCEL_CHECK_INTERVAL items and stop early, leaving the previous results
+    in place, when it returns True.
+    """
+
+    def __init__(self, index: SearchIndex, limit: int = 50, fuzzy: bool = True):
+        self.index = index
+        self.limit = limit
+        self.fuzzy = fuzzy
+        self.query = ""
+        self.hits: List[SearchHit] = index.search("", limit=limit)
+        self.total = len(index)
+        self.scanned = 0
+        self._stack: List[Tuple[str, Sequence[int]]] = []
+
+    def _scan(self, query: str, candidates: Sequence[int],
+              should_cancel: Optional[Callable[[], bool]]) -> Optional[array]:
+        normalized = self.index.normalized
+        contiguous = isinstance(candidates, range)
+        matches = array("I")
+        for start in range(0, len(candidates), CANCEL_CHECK_INTERVAL):
+            if should_cancel is not None and should_cancel():
+                return None
+            chunk = candidates[start:start + CANCEL_CHECK_INTERVAL]
+            texts = normalized[chunk.start:chunk.stop] if contiguous else map(normalized.__getitem__, chunk)
+            matches.extend(compress(chunk, map(contains, texts, repeat(query))))
+        self.scanned = len(candidates)
+        return matches
+
+    def _rank(self, query: str, matches: Sequence[int]) -> List[SearchHit]:
+        index = self.index
+        hits = index._word_prefix_hits(query, self.limit)
+        seen = {hit.index for hit in hits}
+        normalized = index.normalized
+        for item in matches:
+            if len(hits) == self.limit:
+                break
+            if item in seen:
+                continue
+            position = normalized[item].find(query)
+            span = index._original_span(item, position, position + len(query))
+            hits.append(SearchHit(item, index.items[item], 1.0 / (1 + position), [span]))
+        if self.fuzzy and len(hits) < self.limit and len(query) >= NGRAM:
+            hits.extend(index._fuzzy(query, {hit.index for hit in hits}, self.limit - len(hits)))
+        return hits
+
+    def update(self, query: str, should_cancel: Optional[Callable[[], bool]] = None) -> bool:
+        """Search for query; returns False if cancelled (results are left unchanged)"""
+        folded, _ = normalize(query.strip())
+        stack = self._stack
+        while stack and not folded.startswith(stack[-1][0]):
+            stack.pop()
+
+        if not folded:
+            self.hits = self.index.search("", limit=self.limit)
+            self.total, self.scanned = len(self.index), 0
+        elif stack and stack[-1][0] == folded:
+            self.hits = self._rank(folded, stack[-1][1])
+            self.total, self.scanned = len(stack[-1][1]), 0
+        else:
+            candidates = self.index._substring_candidates(folded, None)
+            if stack and len(stack[-1][1]) < len(candidates):
+                candidates = stack[-1][1]
+            matches = self._scan(folded, candidates, should_cancel)
+            if matches is None:
+                return False
+            stack.append((folded, matches))
+            self.hits = self._rank(folded, matches)
+            self.total = len(matches)
+        self.query = query
+        return True
+
+
+def highlight(hit: SearchHit, style: str = "bold yellow"):
+    """Rich Text of a hit with its match spans styled"""
+    from rich.text import Text
+    text = Text(hit.text)
+    for start, end in hit.spans:
+        text.stylize(style, start, end)
+    return text
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Snapshot Cache - content-addressed store of pre-rendered show cases
+Each entry holds the text, ANSI and HTML exports of one show case, keyed by
+the case, its source, the terminal width, the color system and the Rich version.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+# Export formats stored for every snapshot (also the file extensions)
+EXPORT_FORMATS = ("txt", "ansi", "html")
+
+INDEX_FILE = "index.json"
+
+
+def rich_version() -> str:
+    """Return the installed Rich version (part of every cache key)"""
+    from importlib.metadata import version, PackageNotFoundError
+    try:
+        return version("rich")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def snapshot_key(case: str, source: str, width: int, color_system: Optional[str], version: str) -> str:
+    """Build the content address for one rendered show case"""
+    payload = json.dumps(
+        {
+            "case": case,
+            "source": hashlib.sha256(source.encode("utf-8")).hexdigest(),
+            "width": width,
+            "color_system": color_system or "none",
+            "rich": version,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SnapshotCache:
+    """Directory of rendered snapshots plus a human-readable index"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._index: Optional[Dict[str, dict]] = None
+
+    def _path(self, key: str, fmt: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.{fmt}")
+
+    @property
+    def index(self) -> Dict[str, dict]:
+        """Mapping of key -> metadata, loaded lazily from index.json"""
+        if self._index is None:
+            try:
+                with open(os.path.join(self.directory, INDEX_FILE), encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def __contains__(self, key: str) -> bool:
+        return all(os.path.exists(self._path(key, fmt)) for fmt in EXPORT_FORMATS)
+
+    def get(self, key: str, fmt: str = "ansi") -> Optional[str]:
+        """Return one export of a snapshot, or None on a cache miss"""
+        try:
+            with open(self._path(key, fmt), encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, key: str, exports: Dict[str, str], metadata: dict):
+        """Store all exports of a snapshot; files are written atomically"""
+        for fmt in EXPORT_FORMATS:
+            path = self._path(key, fmt)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(exports[fmt])
+            os.replace(tmp_path, path)
+        self.index[key] = metadata
+
+    def save_index(self):
+        """Write index.json describing every snapshot in the cache"""
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = os.path.join(self.directory, f"{INDEX_FILE}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, os.path.join(self.directory, INDEX_FILE))
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Terminal Input - single-keystroke reading for the live, keyboard-driven views
+KeyReader puts the terminal into cbreak mode (POSIX) or uses msvcrt (Windows)
+and returns one named key at a time, with optional timeouts and a cheap
+``pending()`` check so long-running work can notice new keystrokes.
+"""
+
+import os
+import sys
+from typing import Optional
+
+# Named keys returned by KeyReader.read_key(); printable characters are returned as-is
+ENTER = "enter"
+ESCAPE = "escape"
+BACKSPACE = "backspace"
+TAB = "tab"
+UP, DOWN, LEFT, RIGHT = "up", "down", "left", "right"
+PAGE_UP, PAGE_DOWN, HOME, END = "pageup", "pagedown", "home", "end"
+CTRL_C = "ctrl-c"
+
+_ESCAPE_SEQUENCES = {
+    "[A": UP, "[B": DOWN, "[C": RIGHT, "[D": LEFT,
+    "[H": HOME, "[F": END, "OH": HOME, "OF": END,
+    "[1~": HOME, "[4~": END, "[7~": HOME, "[8~": END,
+    "[5~": PAGE_UP, "[6~": PAGE_DOWN,
+}
+
+_WINDOWS_KEYS = {"H": UP, "P": DOWN, "K": LEFT, "M": RIGHT, "G": HOME, "O": END, "I": PAGE_UP, "Q": PAGE_DOWN}
+
+
+def interactive_terminal() -> bool:
+    """True when both stdin and stdout are attached to a terminal"""
+    return sys.stdin.isatty() and sys.stdout.isatty()
+
+
+def open_terminal():
+    """The controlling terminal for key input, or None if there is none
+
+    Returns sys.stdin when it is a terminal, else /dev/tty (POSIX) - so a
+    viewer can page through data piped into stdin.
+    """
+    if sys.stdin.isatty():
+        return sys.stdin
+    if os.name == "nt":
+        return None
+    try:
+        return open("/dev/tty")
+    except OSError:
+        return None
+
+
+class KeyReader:
+    """Context manager that reads individual keystrokes from the terminal
+
+        with KeyReader() as keys:
+            key = keys.read_key(timeout=0.1)
+
+    ``stream`` defaults to stdin; pass the controlling terminal (see
+    open_terminal) when stdin is carrying data.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream
+        self._fd: Optional[int] = None
+        self._saved = None
+
+    def __enter__(self) -> "KeyReader":
+        if os.name != "nt":
+            import termios
+            import tty
+            self._fd = (self.stream or sys.stdin).fileno()
+            self._saved = termios.tcgetattr(self._fd)
+            tty.setcbreak(self._fd)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._saved is not None:
+            import termios
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._saved)
+            self._saved = None
+
+    def fileno(self) -> int:
+        """File descriptor being read (POSIX), e.g. for an event loop's add_reader"""
+        return self._fd
+
+    def pending(self, timeout: float = 0.0) -> bool:
+        """True if a keystroke is waiting (optionally waiting up to timeout seconds)"""
+        if os.name == "nt":
+            import msvcrt
+            import time
+            deadline = time.monotonic() + timeout
+            while not msvcrt.kbhit():
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(0.01)
+            return True
+        import select
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        return bool(readable)
+
+    def _read_utf8(self) -> str:
+        data = os.read(self._fd, 1)
+        if not data:
+            return ""
+        # Complete multi-byte UTF-8 sequences (e.g. CJK input)
+        lead = data[0]
+        length = 4 if lead >= 0xF0 else 3 if lead >= 0xE0 else 2 if lead >= 0xC0 else 1
+        while len(data) < length:
+            more = os.read(self._fd, length - len(data))
+            if not more:
+                break
+            data += more
+        return data.decode("utf-8", errors="replace")
+
+    def read_key(self, timeout: Optional[float] = None) -> Optional[str]:
+        """Return the next key name/character, or None if timeout expires first"""
+        if timeout is not None and not self.pending(timeout):
+            return None
+        if os.name == "nt":
+            return self._read_windows_key()
+
+        char = self._read_utf8()
+        if char in ("\r", "\n"):
+            return ENTER
+        if char in ("\x7f", "\x08"):
+            return BACKSPACE
+        if char == "\t":
+            return TAB
+        if char == "\x03":
+            return CTRL_C
+        if char == "\x1b":
+            # A lone ESC, or the start of an escape sequence
+            sequence = ""
+            while self.pending(0.01) and len(sequence) < 4:
+                sequence += self._read_utf8()
+                if sequence in _ESCAPE_SEQUENCES:
+                    return _ESCAPE_SEQUENCES[sequence]
+            return ESCAPE if not sequence else _ESCAPE_SEQUENCES.get(sequence, ESCAPE)
+        return char
+
+    def _read_windows_key(self) -> str:
+        import msvcrt
+        char = msvcrt.getwch()
+        if char in ("\x00", "\xe0"):
+            return _WINDOWS_KEYS.get(msvcrt.getwch(), ESCAPE)
+        if char == "\r":
+            return ENTER
+        if char == "\x08":
+            return BACKSPACE
+        if char == "\x1b":
+            return ESCAPE
+        if char == "\x03":
+            return CTRL_C
+        return char
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Metric Time Series - fixed-memory history with O(1) window statistics
+Each MetricSeries keeps the last ``capacity`` samples in a preallocated
+array; min/max, average and p95 over that window are maintained incrementally
+as samples enter and leave, so reading them never rescans the history.
+"""
+
+import math
+from array import array
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+
+class MetricSeries:
+    """Ring buffer of float samples with incremental window statistics
+
+    * min / max: monotonic deques, amortised O(1) per sample
+    * avg:       running sum, re-summed exactly once per lap of the ring
+    * p95:       fixed histogram over [0, scale]; O(bins) to read, independent
+                 of the history length (values above scale land in the top bin)
+    """
+
+    def __init__(self, capacity: int = 120, scale: float = 100.0, bins: int = 100):
+        self.capacity = capacity
+        self.scale = scale
+        self._values = array("d", bytes(8 * capacity))
+        self._histogram = array("l", bytes(array("l").itemsize * bins))
+        self._count = 0       # samples currently in the window
+        self._total = 0       # samples ever pushed (also the next write position)
+        self._sum = 0.0
+        self._min: Deque[Tuple[int, float]] = deque()
+        self._max: Deque[Tuple[int, float]] = deque()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _bin(self, value: float) -> int:
+        bins = len(self._histogram)
+        index = int(value / self.scale * bins) if self.scale > 0 else 0
+        return min(max(index, 0), bins - 1)
+
+    def push(self, value: float):
+        """Add a sample, evicting the oldest one once the window is full"""
+        position = self._total
+        slot = position % self.capacity
+        if self._count == self.capacity:
+            evicted = self._values[slot]
+            self._sum -= evicted
+            self._histogram[self._bin(evicted)] -= 1
+        else:
+            self._count += 1
+
+        self._values[slot] = value
+        self._sum += value
+        self._histogram[self._bin(value)] += 1
+        self._total = position + 1
+        if slot == self.capacity - 1 and self._count == self.capacity:
+            # Re-sum once per lap to cancel float drift (amortised O(1))
+            self._sum = math.fsum(self._values)
+
+        oldest = self._total - self._count
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((position, value))
+        while self._min[0][0] < oldest:
+            self._min.popleft()
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((position, value))
+        while self._max[0][0] < oldest:
+            self._max.popleft()
+
+    @property
+    def last(self) -> Optional[float]:
+        if not self._count:
+            return None
+        return self._values[(self._total - 1) % self.capacity]
+
+    @property
+    def min(self) -> Optional[float]:
+        return self._min[0][1] if self._min else None
+
+    @property
+    def max(self) -> Optional[float]:
+        return self._max[0][1] if self._max else None
+
+    @property
+    def avg(self) -> Optional[float]:
+        return self._sum / self._count if self._count else None
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Approximate percentile (bin upper edge) from the window histogram"""
+        if not self._count:
+            return None
+        target = fraction * self._count
+        seen = 0
+        bins = len(self._histogram)
+        for index, count in enumerate(self._histogram):
+            seen += count
+            if seen >= target:
+                return min((index + 1) / bins * self.scale, self.max)
+        return self.max
+
+    @property
+    def p95(self) -> Optional[float]:
+        return self.percentile(0.95)
+
+    def recent(self, count: int):
+        """The last count samples, oldest first"""
+        count = min(count, self._count)
+        return [self._values[i % self.capacity] for i in range(self._total - count, self._total)]
+
+    def sparkline(self, width: int) -> str:
+        """Unicode sparkline of the last width samples, scaled to the window min/max"""
+        values = self.recent(width)
+        if not values:
+            return ""
+        low, high = self.min, self.max
+        span = high - low
+        top = len(SPARK_CHARS) - 1
+        if span <= 0:
+            return SPARK_CHARS[0] * len(values)
+        return "".join(SPARK_CHARS[int((value - low) / span * top)] for value in values)
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Transfer - chunked hashing / copying of real files on a bounded worker pool
+Files are read into one reusable buffer per worker (or through mmap), hashed
+and optionally written to a destination directory, reporting true byte
+counts to a ProgressHub. Chunk size and concurrency are tunable, and the
+summary reports measured throughput, so the same run with and without a
+progress display shows whether the display slows the I/O down. Copies are
+written to a temporary file next to the destination and renamed into place
+once complete; a destination that is the source itself is refused.
+"""
+
+import hashlib
+import mmap
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_WORKERS = 4
+DEFAULT_ALGORITHM = "sha256"
+
+_SIZE_SUFFIXES = {"k": 1024, "m": 1024 ** 2, "g": 1024 ** 3}
+
+
+class TransferResult(NamedTuple):
+    """One finished file"""
+    source: str
+    destination: Optional[str]
+    size: int
+    seconds: float
+    digest: str
+
+
+class TransferJob(NamedTuple):
+    """One file to hash or copy"""
+    source: str
+    destination: Optional[str]
+    size: int
+
+
+class TransferSummary(NamedTuple):
+    """A whole run: per-file results plus wall-clock totals"""
+    results: List[TransferResult]
+    errors: List[str]
+    total_bytes: int
+    seconds: float
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second over the whole run"""
+        return self.total_bytes / self.seconds if self.seconds > 0 else 0.0
+
+
+def parse_size(text: str) -> int:
+    """Parse a byte count such as 65536, 64K or 1M"""
+    text = text.strip().lower().rstrip("b")
+    factor = _SIZE_SUFFIXES.get(text[-1:], 1)
+    if factor != 1:
+        text = text[:-1]
+    size = int(float(text) * factor)
+    if size <= 0:
+        raise ValueError(f"chunk size must be positive: {text}")
+    return size
+
+
+def collect_files(paths: Iterable[str]) -> List[str]:
+    """Regular files named by paths, walking directories (sorted, symlinks skipped)"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, subdirs, names in os.walk(path):
+                subdirs.sort()
+                files.extend(os.path.join(directory, name) for name in sorted(names)
+                             if not os.path.islink(os.path.join(directory, name)))
+        elif os.path.isfile(path):
+            files.append(path)
+    return files
+
+
+def transfer_file(source: str, reporter=None, destination: Optional[str] = None,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE, use_mmap: bool = False,
+                  algorithm: str = DEFAULT_ALGORITHM, delay: float = 0.0) -> TransferResult:
+    """Hash source (and copy it to destination) chunk by chunk
+
+    ``reporter`` is anything with ``advance(bytes)`` and ``flush()``, such
+    as a progress_engine.TaskReporter. ``delay`` (seconds per chunk) paces
+    demos.
+    """
+    started = time.perf_counter()
+    digest = hashlib.new(algorithm)
+    size = 0
+    output = None
+    partial = None
+    try:
+        if destination is not None:
+            if same_file(source, destination):
+                raise OSError(f"目标与源文件相同: {destination}")
+            directory = os.path.dirname(destination) or "."
+            os.makedirs(directory, exist_ok=True)
+            # Written beside the destination, renamed over it only once complete
+            fd, partial = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(destination)}.",
+                                           suffix=".part")
+            output = os.fdopen(fd, "wb")
+        with open(source, "rb", buffering=0) as f:
+            length = os.fstat(f.fileno()).st_size
+            if use_mmap and length:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    view = memoryview(mapped)
+                    try:
+                        for offset in range(0, length, chunk_size):
+                            with view[offset:offset + chunk_size] as chunk:
+                                digest.update(chunk)
+                                if output is not None:
+                                    output.write(chunk)
+                                count = len(chunk)
+                            size += count
+                            if reporter is not None:
+                                reporter.advance(count)
+                            if delay:
+                                time.sleep(delay)
+                    finally:
+                        view.release()
+            else:
+                # One buffer per file, refilled in place: no allocation per chunk
+                buffer = bytearray(chunk_size)
+                view = memoryview(buffer)
+                while True:
+                    count = f.readinto(buffer)
+                    if not count:
+                        break
+                    chunk = view[:count]
+                    digest.update(chunk)
+                    if output is not None:
+                        output.write(chunk)
+                    size += count
+                    if reporter is not None:
+                        reporter.advance(count)
+                    if delay:
+                        time.sleep(delay)
+        if output is not None:
+            output.close()
+            shutil.copymode(source, partial)
+            os.replace(partial, destination)
+            partial = None
+    finally:
+        if output is not None:
+            output.close()
+        if partial is not None:
+            os.unlink(partial)
+        if reporter is not None:
+            reporter.flush()
+    return TransferResult(source, destination, size, time.perf_counter() - started, digest.hexdigest())
+
+
+def destination_path(source: str, base: str, copy_to: str) -> str:
+    """Where source goes under copy_to, keeping its path relative to base"""
+    relative = os.path.relpath(source, base) if os.path.isdir(base) else os.path.basename(source)
+    return os.path.join(copy_to, relative)
+
+
+def same_file(source: str, destination: str) -> bool:
+    """True if destination already is source (same path after resolving links, or same inode)"""
+    if os.path.realpath(source) == os.path.realpath(destination):
+        return True
+    try:
+        return os.path.samefile(source, destination)
+    except OSError:
+        return False
+
+
+def _inside(path: str, directory: str) -> bool:
+    return os.path.commonpath([path, directory]) == directory
+
+
+def plan_transfers(paths: List[str], copy_to: Optional[str] = None) -> Tuple[List[TransferJob], List[str]]:
+    """The jobs for every file under paths, and the reasons any files were refused
+
+    Files are collected once. When copy_to lies inside a source directory,
+    the files already under copy_to are not copied again, and a file whose
+    destination is the file itself is refused rather than truncated.
+    """
+    target = os.path.realpath(copy_to) if copy_to else None
+    jobs, refused = [], []
+    for base in paths:
+        for source in collect_files([base]):
+            destination = None
+            if copy_to:
+                destination = destination_path(source, base, copy_to)
+                if same_file(source, destination):
+                    refused.append(f"{source}: 目标与源文件相同，已跳过")
+                    continue
+                if _inside(os.path.realpath(source), target):
+                    # An earlier copy inside the source tree
+                    continue
+            jobs.append(TransferJob(source, destination, os.path.getsize(source)))
+    return jobs, refused
+
+
+def run_transfers(jobs: List[TransferJob], hub=None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  workers: int = DEFAULT_WORKERS, use_mmap: bool = False,
+                  algorithm: str = DEFAULT_ALGORITHM) -> TransferSummary:
+    """Hash (or copy) every job's file with at most ``workers`` in flight
+
+    With a ProgressHub each file is a task reporting its bytes; with hub=None
+    nothing is reported, which gives the baseline throughput.
+    """
+    def run(source: str, destination: Optional[str], task_id) -> TransferResult:
+        reporter = hub.reporter(task_id) if hub is not None else None
+        try:
+            return transfer_file(source, reporter, destination, chunk_size, use_mmap, algorithm)
+        finally:
+            if reporter is not None:
+                reporter.done()
+
+    results, errors = [], []
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="transfer") as pool:
+        futures = []
+        for source, destination, size in jobs:
+            task_id = hub.add_task(os.path.basename(source), total=size) if hub is not None else None
+            futures.append((source, pool.submit(run, source, destination, task_id)))
+        for source, future in futures:
+            try:
+                results.append(future.result())
+            except OSError as e:
+                errors.append(f"{source}: {e.strerror or e}")
+    seconds = time.perf_counter() - started
+    return TransferSummary(results, errors, sum(result.size for result in results), seconds)
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Virtual Table - a Rich table that only renders its visible window
+Rows come from a RowSource (a sequence, an iterator, a callback or a CSV
+file) and are fetched one viewport at a time. Column widths are measured on
+a sample of rows and widened as new rows scroll into view, so render time
+and memory depend on the viewport height rather than the size of the data.
+
+    table = VirtualTable(SequenceRows(rows), title="结果")
+    table.add_column("名称", style="green")
+    table.page(1)
+    console.print(table)
+"""
+
+import csv
+import io
+from array import array
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from rich.cells import cell_len
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.table import Table
+from rich.text import Text
+
+Row = Sequence[Any]
+
+# Rows measured up front to size the columns
+WIDTH_SAMPLE_ROWS = 200
+
+# Widest a measured column may become (explicit widths are not capped)
+MAX_MEASURED_WIDTH = 60
+
+# CSV files record the byte offset of every Nth row
+CSV_INDEX_STRIDE = 256
+
+
+class RowSource:
+    """Random access to rows by position"""
+
+    @property
+    def length(self) -> Optional[int]:
+        """Number of rows, or None while it is not known yet"""
+        raise NotImplementedError
+
+    def rows(self, start: int, stop: int) -> List[Row]:
+        """Rows start..stop-1 (fewer at the end of the data)"""
+        raise NotImplementedError
+
+    def count(self) -> int:
+        """Number of rows, reading to the end of the data if necessary"""
+        return self.length
+
+    def close(self):
+        """Release whatever the source holds open (nothing by default)"""
+
+    def __enter__(self) -> "RowSource":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SequenceRows(RowSource):
+    """Rows held in a list (or any sliceable sequence)"""
+
+    def __init__(self, rows: Sequence[Row]):
+        self._rows = rows
+
+    @property
+    def length(self) -> int:
+        return len(self._rows)
+
+    def rows(self, start: int, stop: int) -> List[Row]:
+        return list(self._rows[start:stop])
+
+
+class IteratorRows(RowSource):
+    """Rows pulled lazily from an iterator (e.g. a pipe)
+
+    Rows are only read as far as the view has scrolled; the rows read so far
+    are kept so that scrolling back does not need to re-read the input.
+    """
+
+    def __init__(self, rows: Iterable[Row]):
+        self._iterator: Optional[Iterator[Row]] = iter(rows)
+        self._seen: List[Row] = []
+
+    def _fill(self, stop: Optional[int]):
+        while self._iterator is not None and (stop is None or len(self._seen) < stop):
+            try:
+                self._seen.append(next(self._iterator))
+            except StopIteration:
+                self._iterator = None
+
+    @property
+    def length(self) -> Optional[int]:
+        return len(self._seen) if self._iterator is None else None
+
+    def rows(self, start: int, stop: int) -> List[Row]:
+        self._fill(stop)
+        return self._seen[start:stop]
+
+    def count(self) -> int:
+        self._fill(None)
+        return len(self._seen)
+
+
+class CallbackRows(RowSource):
+    """Rows produced on demand by fetch(start, stop)
+
+    ``length`` may be an int, a callable returning the current length (for
+    data that changes between renders) or None if unknown.
+    """
+
+    def __init__(self, fetch: Callable[[int, int], List[Row]],
+                 length: Union[int, Callable[[], int], None] = None):
+        self._fetch = fetch
+        self._length = length
+
+    @property
+    def length(self) -> Optional[int]:
+        return self._length() if callable(self._length) else self._length
+
+    def rows(self, start: int, stop: int) -> List[Row]:
+        return self._fetch(start, stop)
+
+    def count(self) -> int:
+        length = self.length
+        if length is None:
+            # Probe in doubling steps, then bisect the last step
+            low, high = 0, 1024
+            while self._fetch(high - 1, high):
+                low, high = high, high * 2
+            while low < high:
+                middle = (low + high + 1) // 2
+                if self._fetch(middle - 1, middle):
+                    low = middle
+                else:
+                    high = middle - 1
+            length = low
+        return length
+
+
+class CsvFileRows(RowSource):
+    """Rows of a CSV file, read from disk one window at a time
+
+    The file is scanned lazily; the byte offset of every CSV_INDEX_STRIDE-th
+    row is kept, so a window is reached with one seek and at most
+    CSV_INDEX_STRIDE skipped lines. Each record must fit on one line.
+    """
+
+    def __init__(self, path: str, encoding: str = "utf-8", skip_header: bool = True):
+        self.path = path
+        self.encoding = encoding
+        self._file = open(path, "rb")
+        self.header: Optional[List[str]] = None
+        if skip_header:
+            first = self._file.readline()
+            self.header = self._parse(first) if first else []
+        self._offsets = array("Q", [self._file.tell()])
+        self._indexed = 0          # rows counted so far
+        self._index_end = self._file.tell()
+        self._complete = False
+
+    def _parse(self, line: bytes) -> List[str]:
+        text = line.decode(self.encoding, errors="replace").rstrip("\r\n")
+        return next(csv.reader([text]), [])
+
+    def _index_to(self, stop: Optional[int]):
+        """Extend the sparse offset index until it covers row stop (or EOF)"""
+        if self._complete or (stop is not None and stop <= self._indexed):
+            return
+        self._file.seek(self._index_end)
+        while stop is None or self._indexed < stop:
+            line = self._file.readline()
+            if not line:
+                self._complete = True
+                break
+            self._indexed += 1
+            if self._indexed % CSV_INDEX_STRIDE == 0:
+                self._offsets.append(self._file.tell())
+        self._index_end = self._file.tell()
+
+    @property
+    def length(self) -> Optional[int]:
+        return self._indexed if self._complete else None
+
+    def rows(self, start: int, stop: int) -> List[Row]:
+        self._index_to(stop)
+        stop = min(stop, self._indexed)
+        if start >= stop:
+            return []
+        self._file.seek(self._offsets[start // CSV_INDEX_STRIDE])
+        for _ in range(start % CSV_INDEX_STRIDE):
+            self._file.readline()
+        return [self._parse(self._file.readline()) for _ in range(stop - start)]
+
+    def count(self) -> int:
+        self._index_to(None)
+        return self._indexed
+
+    def close(self):
+        self._file.close()
+
+
+def row_source(data: Union[RowSource, Sequence[Row], Iterable[Row], Callable[[int, int], List[Row]]]) -> RowSource:
+    """Wrap a sequence, iterator or fetch callback in the matching RowSource"""
+    if isinstance(data, RowSource):
+        return data
+    if isinstance(data, Sequence):
+        return SequenceRows(data)
+    if callable(data):
+        return CallbackRows(data)
+    return IteratorRows(data)
+
+
+def csv_source(path: str, encoding: str = "utf-8"):
+    """(header, RowSource) for a CSV file path, or "-" for standard input"""
+    if path == "-":
+        import sys
+        reader = csv.reader(io.TextIOWrapper(sys.stdin.buffer, encoding=encoding, errors="replace"))
+        header = next(reader, [])
+        return header, IteratorRows(reader)
+    source = CsvFileRows(path, encoding=encoding)
+    return source.header, source
+
+
+def _cell(cell: Any) -> Union[str, Text, None]:
+    """The renderable a cell is shown as: str and Text as they are, anything else as str(cell)"""
+    if isinstance(cell, (str, Text)) or cell is None:
+        return cell
+    return str(cell)
+
+
+def _cell_width(cell: Any) -> int:
+    """Cells a value takes once rendered (str cells are rendered as markup, with emoji codes)"""
+    cell = _cell(cell)
+    if cell is None:
+        return 0
+    if isinstance(cell, Text):
+        return cell.cell_len
+    if "[" in cell or ":" in cell:
+        return Text.from_markup(cell).cell_len
+    return cell_len(cell)
+
+
+class VirtualTable:
+    """Renders the visible window of a RowSource as a rich Table
+
+    Columns are declared with add_column() exactly like Table.add_column();
+    other keyword arguments (title, box, ...) are passed to each Table built.
+    ``height`` is the number of lines the table may use, including borders
+    and the status line; by default it fills the available height.
+    """
+
+    def __init__(self, source, height: Optional[int] = None,
+                 row_style: Optional[Callable[[int, Row], Optional[str]]] = None,
+                 selected_style: str = "reverse", **table_options):
+        self.source = row_source(source)
+        self.height = height
+        self.row_style = row_style
+        self.selected_style = selected_style
+        self.table_options = table_options
+        self.columns: List[Dict[str, Any]] = []
+        self.offset = 0
+        self.selected: Optional[int] = None
+        self._widths: List[int] = []
+        self._sampled = False
+        self._page_size = 10
+        self._chrome: Dict[int, int] = {}
+
+    def add_column(self, header: str = "", **options):
+        """Declare a column; options are those of Table.add_column()"""
+        self.columns.append(dict(options, header=header))
+        self._widths.append(cell_len(header))
+        self._chrome.clear()
+
+    # --- width estimation -------------------------------------------------
+
+    def _measure(self, rows: List[Row]):
+        widths = self._widths
+        for row in rows:
+            for column, cell in enumerate(row[:len(widths)]):
+                width = _cell_width(cell)
+                if width > widths[column]:
+                    widths[column] = min(width, MAX_MEASURED_WIDTH)
+
+    def _column_options(self, column: int) -> Dict[str, Any]:
+        options = dict(self.columns[column])
+        if not {"width", "ratio", "max_width"} & options.keys():
+            options["width"] = self._widths[column]
+        options.setdefault("no_wrap", True)
+        options.setdefault("overflow", "ellipsis")
+        return options
+
+    # --- viewport ---------------------------------------------------------
+
+    @property
+    def page_size(self) -> int:
+        """Rows shown by the most recent render"""
+        return self._page_size
+
+    def _clamp(self):
+        length = self.source.length
+        if length is not None:
+            self.offset = min(self.offset, max(length - self._page_size, 0))
+            if self.selected is not None:
+                self.selected = min(self.selected, max(length - 1, 0))
+        self.offset = max(self.offset, 0)
+
+    def scroll(self, rows: int):
+        """Move the window (or the selection, if there is one) by rows"""
+        if self.selected is not None:
+            self.select(self.selected + rows)
+        else:
+            self.offset += rows
+            self._clamp()
+
+    def page(self, pages: int):
+        self.scroll(pages * self._page_size)
+
+    def home(self):
+        if self.selected is not None:
+            self.select(0)
+        else:
+            self.offset = 0
+
+    def end(self):
+        last = self.source.count()
+        if self.selected is not None:
+            self.select(last - 1)
+        else:
+            self.offset = last - self._page_size
+            self._clamp()
+
+    def select(self, index: int):
+        """Highlight row index and scroll it into view"""
+        self.selected = max(index, 0)
+        self._clamp()
+        if self.selected < self.offset:
+            self.offset = self.selected
+        elif self.selected >= self.offset + self._page_size:
+            self.offset = self.selected - self._page_size + 1
+
+    # --- rendering --------------------------------------------------------
+
+    def _table(self) -> Table:
+        table = Table(**self.table_options)
+        for column in range(len(self.columns)):
+            options = self._column_options(column)
+            header = options.pop("header")
+            table.add_column(header, **options)
+        return table
+
+    def _chrome_lines(self, console: Console, options: ConsoleOptions) -> int:
+        """Lines taken by title, borders and header, measured on an empty table"""
+        width = options.max_width
+        if width not in self._chrome:
+            self._chrome[width] = len(console.render_lines(self._table(), options.update(height=None), pad=False))
+        return self._chrome[width]
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        if not self._sampled:
+            self._measure(self.source.rows(0, WIDTH_SAMPLE_ROWS))
+            self._sampled = True
+
+        height = self.height or options.height or console.height
+        length = self.source.length
+        page_size = max(height - self._chrome_lines(console, options), 1)
+        paging = self.offset > 0 or length is None or length > page_size
+        if paging:
+            page_size = max(page_size - 1, 1)  # room for the status line
+        self._page_size = page_size
+        self._clamp()
+        if self.selected is not None:
+            self.select(self.selected)
+
+        rows = self.source.rows(self.offset, self.offset + page_size)
+        self._measure(rows)
+        table = self._table()
+        for position, row in enumerate(rows, self.offset):
+            style = self.row_style(position, row) if self.row_style else None
+            if position == self.selected:
+                style = self.selected_style
+            table.add_row(*(_cell(cell) for cell in row), style=style)
+        yield table
+
+        if paging:
+            length = self.source.length
+            total = f"{length:,}" if length is not None else f"{self.offset + len(rows):,}+"
+            first = self.offset + 1 if rows else 0
+            yield Text(f"第 {first:,}-{self.offset + len(rows):,} 行，共 {total} 行", style="dim")